@@ -2,7 +2,9 @@ from discord import Intents, Object
 from discord.ext import commands
 from settings import bot_token, guild_id, prefix
 from modules.core import logger
-from modules.automatic_messages.tasks import setup_automatic_messages
+from modules.automatic_messages.tasks import setup_automatic_messages, stop_automatic_messages
+from modules.automatic_messages.image_cache import image_cache
+from modules.logs_config.dispatcher import log_dispatcher
 
 
 EXTENSIONS = {
@@ -73,11 +75,17 @@ class Bot(commands.Bot):
 
         # Inicializar sistema de mensajes automáticos
         try:
-            setup_automatic_messages(self)
+            await setup_automatic_messages(self)
             logger.info("Sistema de mensajes automáticos iniciado")
         except Exception as e:
             logger.error("Error al iniciar mensajes automáticos: %s", e)
 
+    async def close(self):
+        # Antes de cerrar la conexión: el programador guarda su estado y los logs se envían
+        await stop_automatic_messages()
+        await log_dispatcher.close()
+        await image_cache.close()
+        await super().close()
 
     def init(self):
         self.run(token=bot_token, log_handler=logger.handlers[0])
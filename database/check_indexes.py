@@ -0,0 +1,108 @@
+"""
+Comprueba con EXPLAIN QUERY PLAN que las consultas por clave de los servicios usan un índice.
+
+Crea una base de datos en memoria con schema.sql y las migraciones, y falla si
+alguna consulta recorre una tabla completa. Las consultas se importan de los
+propios servicios, así que un cambio en ellas se comprueba sin tocar este script;
+al añadir una consulta por clave a un servicio hay que añadirla a INDEXED_QUERIES.
+
+Uso (desde la raíz del repositorio): python -m database.check_indexes
+"""
+
+import sqlite3
+import sys
+
+from database.migrator import apply_migrations
+from modules.automatic_messages.services.message_service import MessageService
+from modules.channel_formats.service import ChannelFormatsService
+from modules.clans.service import ClanService
+from modules.echo.service import EchoService
+from modules.logs_config.service import LogsConfigService
+from modules.triggers.service import TriggersService
+
+_clans_by_role, _members_by_role, _channels_by_role = (
+    sql for sql, _ in ClanService.all_clans_queries(role_id=0)
+)
+
+# (descripción, consulta); los parámetros se sustituyen por NULL
+INDEXED_QUERIES = [
+    # clans
+    ("clan por id", ClanService.CLAN_SELECT_BY_ID_SQL),
+    ("clan activo por id", ClanService.CLAN_SELECT_ACTIVE_BY_ID_SQL),
+    ("clan por rol", ClanService.CLAN_SELECT_BY_ROLE_SQL),
+    ("clanes de un miembro", ClanService.CLAN_SELECT_BY_MEMBER_SQL),
+    ("clan por canal", ClanService.CLAN_SELECT_BY_CHANNEL_SQL),
+    ("listado de clanes por rol", _clans_by_role),
+    ("miembros del listado de clanes por rol", _members_by_role),
+    ("canales del listado de clanes por rol", _channels_by_role),
+    # clan_members
+    ("miembro por usuario", ClanService.MEMBER_SELECT_BY_USER_SQL),
+    ("líder por usuario", ClanService.MEMBER_SELECT_BY_ROLE_SQL),
+    ("miembro de un clan", ClanService.MEMBER_SELECT_SQL),
+    ("líder de un clan", ClanService.MEMBER_SELECT_WITH_ROLE_SQL),
+    ("miembros de un clan", ClanService.MEMBER_SELECT_BY_CLAN_SQL),
+    ("recuento de miembros", ClanService.MEMBER_COUNT_BY_CLAN_SQL),
+    ("cambiar rol de miembro", ClanService.MEMBER_UPDATE_ROLE_SQL),
+    ("expulsar miembro", ClanService.MEMBER_DELETE_SQL),
+    ("borrar miembros de un clan", ClanService.MEMBER_DELETE_BY_CLAN_SQL),
+    # clan_channels
+    ("canal de un clan", ClanService.CHANNEL_SELECT_SQL),
+    ("canales de un clan", ClanService.CHANNEL_SELECT_BY_CLAN_SQL),
+    ("borrar canal de un clan", ClanService.CHANNEL_DELETE_SQL),
+    # triggers
+    ("trigger por id", TriggersService.TRIGGER_SELECT_BY_ID_SQL),
+    ("triggers de un canal", TriggersService.TRIGGER_SELECT_BY_CHANNEL_SQL),
+    # channel_formats
+    ("formato por id", ChannelFormatsService.FORMAT_SELECT_BY_ID_SQL),
+    ("formatos de un canal", ChannelFormatsService.FORMAT_SELECT_BY_CHANNEL_SQL),
+    # logs
+    ("log por tipo", LogsConfigService.LOG_SELECT_BY_TYPE_SQL),
+    # automatic_messages
+    ("mensaje automático por id", MessageService.MESSAGE_SELECT_BY_ID_SQL),
+    ("mensajes automáticos de un canal", MessageService.MESSAGE_SELECT_BY_CHANNEL_SQL),
+    ("mensajes automáticos de una categoría", MessageService.MESSAGE_SELECT_BY_CATEGORY_SQL),
+    # echo_messages
+    ("echo por id", EchoService.ECHO_SELECT_BY_ID_SQL),
+    ("echos de un usuario", EchoService.ECHO_SELECT_BY_USER_SQL),
+    ("echos de un servidor", EchoService.ECHO_SELECT_BY_GUILD_SQL),
+]
+
+
+def build_database() -> sqlite3.Connection:
+    """Base de datos en memoria con el esquema y todas las migraciones"""
+    conn = sqlite3.connect(":memory:")
+    apply_migrations(conn)
+    return conn
+
+
+def full_scans(conn: sqlite3.Connection, sql: str) -> list:
+    """Pasos del plan que recorren una tabla completa sin índice"""
+    params = (None,) * sql.count("?")
+    plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return [
+        row[3] for row in plan
+        if row[3].upper().startswith("SCAN") and "INDEX" not in row[3].upper()
+    ]
+
+
+def main() -> int:
+    conn = build_database()
+    failures = 0
+    for description, sql in INDEXED_QUERIES:
+        scans = full_scans(conn, sql)
+        if scans:
+            failures += 1
+            print(f"❌ {description}: {'; '.join(scans)}")
+        else:
+            print(f"✅ {description}")
+    conn.close()
+
+    if failures:
+        print(f"{failures} consultas recorren tablas completas")
+        return 1
+    print("Todas las consultas usan índices")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,42 @@
-from typing import Optional
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, Tuple
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from queue import Queue
+import asyncio
+import threading
 import sqlite3
+from settings import database_profile
 from modules.core import logger
+from .migrator import apply_migrations
 import json
 
 NO_RESULTS = "No se han encontrado resultados"
 NO_CURSOR = "No se ha podido ejecutar la consulta a la base de datos"
 QUERY_ERROR = "Error en la consulta a la base de datos"
 
+# Perfil de almacenamiento por defecto; se puede sobrescribir con la clave "database" de config.json
+DEFAULT_STORAGE_PROFILE = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 64 * 1024 * 1024,  # bytes
+    "cache_size": -16000,  # negativo = KiB
+    "busy_timeout": 5000,  # ms
+    "read_connections": 4,
+}
+JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
 
 class Database:
     _instance = None
     _conn = None
+    _lock = threading.RLock()
+    _executor: Optional[ThreadPoolExecutor] = None
+    _read_executor: Optional[ThreadPoolExecutor] = None
+    _read_pool: Optional[Queue] = None
+    _tx_depth = 0
 
     def __new__(cls):
         if cls._instance is None:
@@ -22,56 +47,157 @@ class Database:
     def __init__(self):
         if not hasattr(self, "_initialized"):
             db_path = Path(__file__).parent / "database.db"
-            self._conn = sqlite3.connect(str(db_path))
+            self._profile = {**DEFAULT_STORAGE_PROFILE, **database_profile}
+            # La conexión de escritura se comparte entre el hilo del bot y el hilo de la
+            # base de datos; el acceso se serializa con self._lock
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
             self._conn.row_factory = sqlite3.Row
-            self._create_tables()
+            self._apply_pragmas(self._conn, writer=True)
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="database")
+            self._migrate()
             self._initialized = True
             self._conn.execute("PRAGMA foreign_keys = ON")
+            self._open_read_pool(db_path)
 
-    def _create_tables(self):
-        if self._conn is None:
-            logger.error("No hay conexión a la base de datos")
+    def _apply_pragmas(self, conn: sqlite3.Connection, writer: bool) -> None:
+        profile = self._profile
+        conn.execute(f"PRAGMA busy_timeout = {int(profile['busy_timeout'])}")
+        conn.execute(f"PRAGMA cache_size = {int(profile['cache_size'])}")
+        conn.execute(f"PRAGMA mmap_size = {int(profile['mmap_size'])}")
+
+        if not writer:
+            conn.execute("PRAGMA query_only = ON")
+            return
+
+        journal_mode = str(profile["journal_mode"]).upper()
+        if journal_mode in JOURNAL_MODES:
+            mode = conn.execute(f"PRAGMA journal_mode = {journal_mode}").fetchone()[0]
+            logger.info("Base de datos en modo journal %s", mode)
+        else:
+            logger.error("journal_mode no válido en la configuración: %s", journal_mode)
+
+        synchronous = str(profile["synchronous"]).upper()
+        if synchronous in SYNCHRONOUS_MODES:
+            conn.execute(f"PRAGMA synchronous = {synchronous}")
+        else:
+            logger.error("synchronous no válido en la configuración: %s", synchronous)
+
+    def _open_read_pool(self, db_path: Path) -> None:
+        """
+        Abre las conexiones de solo lectura que usan select/single.
+        Solo tiene sentido en modo WAL, donde las lecturas no esperan a las escrituras.
+        """
+        size = int(self._profile["read_connections"])
+        if size <= 0 or str(self._profile["journal_mode"]).upper() != "WAL":
+            return
+
+        self._read_pool = Queue(maxsize=size)
+        for _ in range(size):
+            conn = sqlite3.connect(
+                f"{db_path.as_uri()}?mode=ro", uri=True, check_same_thread=False
+            )
+            conn.row_factory = sqlite3.Row
+            self._apply_pragmas(conn, writer=False)
+            self._read_pool.put(conn)
+        self._read_executor = ThreadPoolExecutor(
+            max_workers=size, thread_name_prefix="database-read"
+        )
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        if self._read_pool is None:
+            with self._lock:
+                if self._conn is None:
+                    raise sqlite3.Error("Database connection is not established.")
+                yield self._conn
             return
 
+        conn = self._read_pool.get()
         try:
-            sql_path = Path(__file__).parent / "schema.sql"
-            if not sql_path.exists():
-                logger.error("No se encuentra el archivo %s", str(sql_path))
-                return
-
-            with open(sql_path, "r", encoding="utf-8") as f:
-                sql_script = f.read()
-                if not sql_script:
-                    logger.error("El archivo schema.sql está vacío")
-                    return
-
-                self._conn.executescript(sql_script)
-                self._conn.commit()
+            yield conn
+        finally:
+            self._read_pool.put(conn)
 
-        except sqlite3.Error as e:
-            logger.error("Error de SQLite al crear las tablas: %s", e)
+    def _migrate(self):
+        """Aplica el esquema y las migraciones pendientes (ver database/migrator.py)"""
+        if self._conn is None:
+            logger.error("No hay conexión a la base de datos")
+            return
+
+        with self._lock:
+            try:
+                previous, current = apply_migrations(self._conn)
+                if current != previous:
+                    logger.info("Base de datos migrada de la versión %s a la %s", previous, current)
+            except (sqlite3.Error, OSError, ValueError) as e:
+                logger.error("Error aplicando las migraciones de la base de datos: %s", e)
 
     def close(self) -> None:
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        if self._read_executor:
+            self._read_executor.shutdown(wait=True)
+            self._read_executor = None
+        if self._read_pool:
+            while not self._read_pool.empty():
+                self._read_pool.get_nowait().close()
+            self._read_pool = None
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
 
     def execute(self, query: str, params: tuple = ()) -> sqlite3.Cursor:
         # logger.info("Ejecutando consulta: %s", query)
 
-        if self._conn is None:
-            raise sqlite3.Error("Database connection is not established.")
-        cursor = self._conn.cursor()
-        cursor.execute(query, params)
-        self._conn.commit()
-        return cursor
+        with self._lock:
+            if self._conn is None:
+                raise sqlite3.Error("Database connection is not established.")
+            cursor = self._conn.cursor()
+            cursor.execute(query, params)
+            if self._tx_depth == 0:
+                self._conn.commit()
+            return cursor
+
+    def executemany(self, query: str, params_seq: Iterable[tuple]) -> sqlite3.Cursor:
+        """Ejecuta la misma sentencia para cada juego de parámetros con un único commit"""
+        with self._lock:
+            if self._conn is None:
+                raise sqlite3.Error("Database connection is not established.")
+            cursor = self._conn.cursor()
+            cursor.executemany(query, params_seq)
+            if self._tx_depth == 0:
+                self._conn.commit()
+            return cursor
+
+    @contextmanager
+    def transaction(self) -> Iterator["Database"]:
+        """
+        Agrupa varias escrituras en una sola transacción: se confirman juntas al salir
+        del bloque o se deshacen todas si se produce una excepción.
+        Las transacciones anidadas se integran en la exterior. Las lecturas hechas
+        con select/single dentro del bloque no ven los cambios aún sin confirmar.
+        """
+        with self._lock:
+            if self._conn is None:
+                raise sqlite3.Error("Database connection is not established.")
+            self._tx_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self._conn.rollback()
+                raise
+            self._tx_depth -= 1
+            if self._tx_depth == 0:
+                self._conn.commit()
 
     def select(self, sql: str, bindings: tuple = ()) -> list[dict]:
         try:
-            cursor = self.execute(sql, bindings)
-            if not cursor:
-                return []
-            rows = cursor.fetchall()
+            with self._reader() as conn:
+                rows = conn.execute(sql, bindings).fetchall()
 
             response = [dict(row) for row in rows] if rows else []
             logger.debug(json.dumps(response, ensure_ascii=False, indent=2))
@@ -82,13 +208,65 @@ class Database:
 
     def single(self, sql: str, bindings: tuple = ()) -> Optional[dict]:
         try:
-            cursor = self.execute(sql, bindings)
-            if not cursor:
-                return None
-            row = cursor.fetchone()
+            with self._reader() as conn:
+                row = conn.execute(sql, bindings).fetchone()
 
             return dict(row) if row else None
         except sqlite3.Error as e:
             logger.error("Error en la consulta: %s", e)
             return None
 
+    def select_snapshot(self, queries: Sequence[Tuple[str, tuple]]) -> list[list[dict]]:
+        """
+        Ejecuta varias consultas en una misma transacción de lectura, de modo que
+        todas ven la misma instantánea aunque entre medias se confirme una escritura.
+        Los errores se propagan para que el llamante no mezcle resultados parciales.
+        """
+        with self._reader() as conn:
+            began = not conn.in_transaction
+            if began:
+                conn.execute("BEGIN")
+            try:
+                return [
+                    [dict(row) for row in conn.execute(sql, bindings).fetchall()]
+                    for sql, bindings in queries
+                ]
+            finally:
+                if began:
+                    conn.rollback()
+
+    # API asíncrona: las consultas se ejecutan en el hilo dedicado de la base de datos
+    # para que un commit lento no bloquee el event loop de discord.py
+
+    async def _run(self, func: Callable[..., Any], *args, read: bool = False) -> Any:
+        # Las lecturas van al pool de lectura (si existe) para no esperar detrás de las escrituras
+        executor = self._read_executor if read and self._read_executor else self._executor
+        if executor is None:
+            raise sqlite3.Error("Database connection is not established.")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(func, *args))
+
+    async def execute_async(self, query: str, params: tuple = ()) -> sqlite3.Cursor:
+        return await self._run(self.execute, query, params)
+
+    async def executemany_async(self, query: str, params_seq: Iterable[tuple]) -> sqlite3.Cursor:
+        return await self._run(self.executemany, query, list(params_seq))
+
+    async def transaction_async(self, work: Callable[["Database"], Any]) -> Any:
+        """Ejecuta work(db) dentro de una transacción en el hilo de la base de datos"""
+
+        def run() -> Any:
+            with self.transaction() as db:
+                return work(db)
+
+        return await self._run(run)
+
+    async def select_async(self, sql: str, bindings: tuple = ()) -> list[dict]:
+        return await self._run(self.select, sql, bindings, read=True)
+
+    async def single_async(self, sql: str, bindings: tuple = ()) -> Optional[dict]:
+        return await self._run(self.single, sql, bindings, read=True)
+
+    async def select_snapshot_async(self, queries: Sequence[Tuple[str, tuple]]) -> list[list[dict]]:
+        return await self._run(self.select_snapshot, list(queries), read=True)
+
@@ -0,0 +1,5 @@
+-- Migración para guardar el estado de ejecución de los mensajes automáticos
+-- Permite retomar la programación exacta tras un reinicio del bot
+
+ALTER TABLE automatic_messages ADD COLUMN last_sent_at TIMESTAMP; -- Último envío realizado
+ALTER TABLE automatic_messages ADD COLUMN next_run_at TIMESTAMP; -- Próxima ejecución programada
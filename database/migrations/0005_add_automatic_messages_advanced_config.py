@@ -0,0 +1,50 @@
+"""
+Copia la configuración avanzada de los mensajes existentes a las columnas
+añadidas en 0005_add_automatic_messages_advanced_config.sql y deja en el texto
+solo el contenido del mensaje. Se hace en Python para no depender de que
+SQLite esté compilado con JSON1.
+"""
+
+import json
+import sqlite3
+
+ADVANCED_CONFIG_MARKER = '__ADVANCED_CONFIG__:'
+
+
+def _split_advanced_config(text: str) -> tuple:
+    """Separa el texto del bloque __ADVANCED_CONFIG__ y devuelve los valores de las columnas"""
+    main_text, _, raw_config = text.partition(ADVANCED_CONFIG_MARKER)
+    try:
+        config = json.loads(raw_config)
+    except json.JSONDecodeError:
+        # Igual que al enviar: la configuración que no se puede leer se ignora
+        config = {}
+    if not isinstance(config, dict):
+        config = {}
+
+    embed = config.get('embed')
+    if not isinstance(embed, dict):
+        embed = None
+
+    return (
+        main_text.strip(),
+        1 if embed else 0,
+        (embed.get('title') or None) if embed else None,
+        (embed.get('description') or None) if embed else None,
+        (embed.get('color') or 'blue') if embed else None,
+        (embed.get('image') or None) if embed else None,
+        config.get('attachment_image_url') or None,
+    )
+
+
+def migrate(conn: sqlite3.Connection) -> None:
+    rows = conn.execute(
+        "SELECT id, text FROM automatic_messages WHERE instr(text, ?) > 0",
+        (ADVANCED_CONFIG_MARKER,),
+    ).fetchall()
+    conn.executemany("""
+        UPDATE automatic_messages
+        SET text = ?, has_embed = ?, embed_title = ?, embed_description = ?,
+            embed_color = ?, embed_image_url = ?, attachment_image_url = ?
+        WHERE id = ?
+    """, [(*_split_advanced_config(text), message_id) for message_id, text in rows])
@@ -0,0 +1,11 @@
+-- Migración para guardar la configuración avanzada de los mensajes automáticos en columnas
+-- Sustituye el bloque "__ADVANCED_CONFIG__:{json}" que se añadía al final del texto
+
+ALTER TABLE automatic_messages ADD COLUMN has_embed INTEGER NOT NULL DEFAULT 0; -- 1 si el mensaje se envía con embed
+ALTER TABLE automatic_messages ADD COLUMN embed_title TEXT;
+ALTER TABLE automatic_messages ADD COLUMN embed_description TEXT;
+ALTER TABLE automatic_messages ADD COLUMN embed_color TEXT; -- Nombre de color o hexadecimal (#RRGGBB)
+ALTER TABLE automatic_messages ADD COLUMN embed_image_url TEXT; -- Imagen dentro del embed
+ALTER TABLE automatic_messages ADD COLUMN attachment_image_url TEXT; -- Imagen enviada como archivo adjunto
+
+-- La configuración de los mensajes existentes se copia en 0005_add_automatic_messages_advanced_config.py
@@ -0,0 +1,13 @@
+-- Migración: tabla de mensajes echo
+-- Antes la creaba EchoService cada vez que se instanciaba el servicio
+
+CREATE TABLE IF NOT EXISTS echo_messages (
+    id TEXT PRIMARY KEY,
+    message_id INTEGER NOT NULL,
+    channel_id INTEGER NOT NULL,
+    guild_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    is_embed BOOLEAN NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
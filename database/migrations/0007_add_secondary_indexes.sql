@@ -0,0 +1,23 @@
+-- Migración: índices secundarios para las consultas más frecuentes
+-- Hasta ahora solo existían las claves primarias, así que estas búsquedas recorrían la tabla completa.
+-- clan_members ya tiene (user_id, clan_id) como clave primaria, que cubre las búsquedas por user_id.
+-- Se puede comprobar que se usan con: python -m database.check_indexes
+
+-- Miembros y canales de un clan (listados, recuento de miembros, estadísticas)
+CREATE INDEX IF NOT EXISTS idx_clan_members_clan_id ON clan_members (clan_id);
+CREATE INDEX IF NOT EXISTS idx_clan_channels_clan_id ON clan_channels (clan_id);
+
+-- Clan asociado a un rol
+CREATE INDEX IF NOT EXISTS idx_clans_role_id ON clans (role_id);
+
+-- Triggers y formatos de un canal
+CREATE INDEX IF NOT EXISTS idx_triggers_channel_id ON triggers (channel_id);
+CREATE INDEX IF NOT EXISTS idx_channel_formats_channel_id ON channel_formats (channel_id);
+
+-- Mensajes automáticos de un canal o de una categoría
+CREATE INDEX IF NOT EXISTS idx_automatic_messages_channel_id ON automatic_messages (channel_id);
+CREATE INDEX IF NOT EXISTS idx_automatic_messages_category_id ON automatic_messages (category_id);
+
+-- Últimos mensajes echo de un usuario o de un servidor, ya ordenados por fecha
+CREATE INDEX IF NOT EXISTS idx_echo_messages_user_guild_created ON echo_messages (user_id, guild_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_echo_messages_guild_created ON echo_messages (guild_id, created_at);
@@ -0,0 +1,120 @@
+"""
+Migraciones versionadas del esquema de la base de datos
+
+schema.sql es el esquema base y cada archivo NNNN_descripcion.sql de migrations/
+es la versión NNNN. Una versión puede tener además un NNNN_descripcion.py con una
+función migrate(conn), que se ejecuta después del .sql y sirve para las
+transformaciones de datos que no conviene hacer en SQL.
+
+La última versión aplicada se guarda en PRAGMA user_version, así que cada
+migración se ejecuta una sola vez. Las pendientes se aplican al arrancar, todas
+en una única transacción: o se aplican todas o ninguna.
+
+Las bases de datos anteriores a este sistema tienen la versión 0 y pueden tener
+ya algunas columnas añadidas a mano; por eso los ALTER TABLE ... ADD COLUMN de
+columnas que ya existen se omiten.
+"""
+
+import importlib.util
+import re
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+DATABASE_DIR = Path(__file__).resolve().parent
+SCHEMA_FILE = DATABASE_DIR / "schema.sql"
+MIGRATIONS_DIR = DATABASE_DIR / "migrations"
+
+_MIGRATION_NAME = re.compile(r"^(\d+)_(\w+)\.(sql|py)$")
+_COMMENT_LINE = re.compile(r"^\s*--.*$", re.MULTILINE)
+_ADD_COLUMN = re.compile(r"^\s*ALTER\s+TABLE\s+(\w+)\s+ADD\s+COLUMN\s+(\w+)", re.IGNORECASE)
+
+
+def split_statements(sql_script: str) -> Iterator[str]:
+    """Separa un script SQL en sentencias completas"""
+    statement = ""
+    for line in sql_script.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            yield statement
+            statement = ""
+
+
+def load_migrations(directory: Path = MIGRATIONS_DIR) -> List[Tuple[int, List[Path]]]:
+    """
+    Archivos de cada migración (el .sql antes que el .py), ordenados por versión.
+    Las versiones deben ser consecutivas desde 1.
+    """
+    versions: Dict[int, Dict[str, Path]] = {}
+    for path in directory.iterdir():
+        if path.suffix not in (".sql", ".py"):
+            continue
+        match = _MIGRATION_NAME.match(path.name)
+        if not match:
+            raise ValueError(f"Nombre de migración no válido: {path.name}")
+        files = versions.setdefault(int(match.group(1)), {})
+        if any(other.stem != path.stem for other in files.values()):
+            raise ValueError(f"Hay varias migraciones con la versión {int(match.group(1))} ({path.name})")
+        files[match.group(3)] = path
+
+    migrations = []
+    for expected, version in enumerate(sorted(versions), start=1):
+        if version != expected:
+            raise ValueError(f"Falta la migración {expected}")
+        files = versions[version]
+        migrations.append((version, [files[kind] for kind in ("sql", "py") if kind in files]))
+    return migrations
+
+
+def _column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
+    return any(row[1] == column for row in conn.execute(f"PRAGMA table_info({table})"))
+
+
+def _apply_script(conn: sqlite3.Connection, sql_script: str) -> None:
+    for statement in split_statements(sql_script):
+        match = _ADD_COLUMN.match(_COMMENT_LINE.sub("", statement))
+        if match and _column_exists(conn, match.group(1), match.group(2)):
+            continue
+        conn.execute(statement)
+
+
+def _run_python(conn: sqlite3.Connection, path: Path) -> None:
+    spec = importlib.util.spec_from_file_location(f"migration_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.migrate(conn)
+
+
+def _apply_migration(conn: sqlite3.Connection, paths: List[Path]) -> None:
+    for path in paths:
+        if path.suffix == ".sql":
+            _apply_script(conn, path.read_text(encoding="utf-8"))
+        else:
+            _run_python(conn, path)
+
+
+def apply_migrations(conn: sqlite3.Connection) -> Tuple[int, int]:
+    """
+    Aplica el esquema base y las migraciones pendientes.
+    Devuelve (versión anterior, versión actual). Si una migración falla se
+    deshacen todas y se relanza la excepción.
+    """
+    previous = conn.execute("PRAGMA user_version").fetchone()[0]
+    migrations = load_migrations()
+    pending = [(version, paths) for version, paths in migrations if version > previous]
+    if previous > 0 and not pending:
+        return previous, previous
+
+    current = migrations[-1][0] if migrations else previous
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if previous == 0:
+            _apply_script(conn, SCHEMA_FILE.read_text(encoding="utf-8"))
+        for _, paths in pending:
+            _apply_migration(conn, paths)
+        conn.execute(f"PRAGMA user_version = {current}")
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return previous, current
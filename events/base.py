@@ -13,7 +13,7 @@ class BaseEvents(commands.Cog):
     async def on_ready(self):
         logger.info("Iniciado sesión como %s en el servidor %s", self.bot.user.name, guild_id)
         await send_message_to_admin(self.bot, "🟥🟧🟨🟩   **Ready**   🟩🟨🟧🟥")
-        setup_automatic_messages(self.bot)
+        await setup_automatic_messages(self.bot)
 
     @commands.Cog.listener()
     async def on_disconnect(self):
@@ -1,6 +1,7 @@
 from discord.ext import commands
 from modules.logs_config import LogHandler
 from modules.automatic_messages.tasks import get_scheduler
+from modules.automatic_messages.mentions import mention_index
 from modules.core import logger
 from modules.clans.service import ClanService
 
@@ -13,10 +14,12 @@ class GuildEvents(commands.Cog):
 
     @commands.Cog.listener()
     async def on_member_join(self, member):
+        mention_index.update_member(member)
         await self.log_handler.log_member_join(member)
 
     @commands.Cog.listener()
     async def on_member_remove(self, member):
+        mention_index.remove_member(member)
         await self.log_handler.log_member_remove(member)
 
         # Remover al usuario de los clanes si pertenece a alguno
@@ -41,6 +44,19 @@ class GuildEvents(commands.Cog):
         except Exception as e:
             logger.error(f"Error al procesar remoción de clanes para usuario {member.id}: {str(e)}")
 
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role):
+        mention_index.update_role(role)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before, after):
+        if before.name != after.name:
+            mention_index.update_role(after)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role):
+        mention_index.remove_role(role)
+
     @commands.Cog.listener()
     async def on_guild_channel_create(self, channel):
         """Maneja la creación de canales para mensajes automáticos"""
@@ -1,6 +1,7 @@
-from discord import Member
+from discord import Member, User
 from discord.ext import commands
 from modules.logs_config import LogHandler
+from modules.automatic_messages.mentions import mention_index
 
 
 class MemberEvents(commands.Cog):
@@ -10,8 +11,19 @@ class MemberEvents(commands.Cog):
 
     @commands.Cog.listener()
     async def on_member_update(self, before: Member, after: Member):
+        mention_index.update_member(after)
         await self.log_handler.log_member_update(before, after)
 
+    @commands.Cog.listener()
+    async def on_user_update(self, before: User, after: User):
+        # El nombre de usuario es global: se actualiza en todos los servidores compartidos
+        if before.name == after.name:
+            return
+        for guild in after.mutual_guilds:
+            member = guild.get_member(after.id)
+            if member:
+                mention_index.update_member(member)
+
 
 async def setup(bot):
     await bot.add_cog(MemberEvents(bot))
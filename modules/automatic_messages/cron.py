@@ -0,0 +1,179 @@
+"""
+Expresiones cron (minuto hora día mes día_semana) precompiladas en bitsets
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+MONTH_NAMES = {
+    name: number
+    for number, name in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1
+    )
+}
+WEEKDAY_NAMES = {
+    name: number for number, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])
+}
+
+# Años que se recorren como máximo buscando la próxima ejecución; cubre el 29 de febrero
+MAX_SEARCH_YEARS = 8
+
+
+class CronError(ValueError):
+    """Expresión cron inválida"""
+
+
+def _parse_value(value: str, low: int, high: int, names: Optional[Dict[str, int]]) -> int:
+    value = value.lower()
+    if names and value in names:
+        return names[value]
+    if not value.isdigit():
+        raise CronError(f"Valor no válido: {value}")
+    number = int(value)
+    if not low <= number <= high:
+        raise CronError(f"Valor fuera de rango ({low}-{high}): {value}")
+    return number
+
+
+def _parse_field(field: str, low: int, high: int, names: Optional[Dict[str, int]] = None) -> int:
+    """Convierte un campo cron en un bitset donde el bit N indica que el valor N es válido"""
+    mask = 0
+    for part in field.split(","):
+        range_part, _, step_part = part.partition("/")
+        step = 1
+        if step_part:
+            if not step_part.isdigit() or int(step_part) == 0:
+                raise CronError(f"Paso no válido: {part}")
+            step = int(step_part)
+
+        if range_part == "*":
+            start, end = low, high
+        elif "-" in range_part:
+            first, _, last = range_part.partition("-")
+            start = _parse_value(first, low, high, names)
+            end = _parse_value(last, low, high, names)
+            if start > end:
+                raise CronError(f"Rango no válido: {part}")
+        else:
+            start = _parse_value(range_part, low, high, names)
+            # "5/15" equivale a "5-59/15"
+            end = high if step_part else start
+
+        for value in range(start, end + 1, step):
+            mask |= 1 << value
+    return mask
+
+
+def _next_bit(mask: int, start: int) -> Optional[int]:
+    """Primer valor >= start presente en el bitset"""
+    remaining = mask >> start
+    if not remaining:
+        return None
+    return start + (remaining & -remaining).bit_length() - 1
+
+
+def _first_of_next_month(moment: datetime) -> datetime:
+    if moment.month == 12:
+        return moment.replace(year=moment.year + 1, month=1, day=1, hour=0, minute=0)
+    return moment.replace(month=moment.month + 1, day=1, hour=0, minute=0)
+
+
+@dataclass(frozen=True)
+class CronExpression:
+    expression: str
+    minutes: int
+    hours: int
+    days: int
+    months: int
+    weekdays: int  # 0 = domingo, como en cron
+    days_restricted: bool
+    weekdays_restricted: bool
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = bool(self.days >> moment.day & 1)
+        weekday_ok = bool(self.weekdays >> ((moment.weekday() + 1) % 7) & 1)
+        # Igual que cron: si se restringen ambos campos basta con que se cumpla uno
+        if self.days_restricted and self.weekdays_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, after: datetime) -> Optional[datetime]:
+        """
+        Primera ejecución estrictamente posterior a `after`, o None si no hay
+        ninguna en los próximos años (por ejemplo, el 31 de febrero).
+        Cada paso salta directamente al siguiente valor válido del campo.
+        """
+        moment = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = after.year + MAX_SEARCH_YEARS
+
+        while moment.year <= limit:
+            if not self.months >> moment.month & 1:
+                month = _next_bit(self.months, moment.month + 1)
+                if month is None:
+                    moment = moment.replace(year=moment.year + 1, month=1, day=1, hour=0, minute=0)
+                else:
+                    moment = moment.replace(month=month, day=1, hour=0, minute=0)
+                continue
+
+            if not self._day_matches(moment):
+                next_day = (moment + timedelta(days=1)).replace(hour=0, minute=0)
+                moment = next_day if next_day.month == moment.month else _first_of_next_month(moment)
+                continue
+
+            hour = _next_bit(self.hours, moment.hour)
+            if hour is None:
+                moment = (moment + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if hour != moment.hour:
+                moment = moment.replace(hour=hour, minute=0)
+
+            minute = _next_bit(self.minutes, moment.minute)
+            if minute is None:
+                next_hour = _next_bit(self.hours, moment.hour + 1)
+                if next_hour is None:
+                    moment = (moment + timedelta(days=1)).replace(hour=0, minute=0)
+                else:
+                    moment = moment.replace(hour=next_hour, minute=0)
+                continue
+
+            return moment.replace(minute=minute)
+
+        return None
+
+
+@lru_cache(maxsize=256)
+def parse_cron(expression: str) -> CronExpression:
+    """Compila una expresión cron de 5 campos. Lanza CronError si no es válida."""
+    if not expression or not isinstance(expression, str):
+        raise CronError("Expresión vacía")
+
+    parts = expression.split()
+    if len(parts) != 5:
+        raise CronError("La expresión debe tener 5 campos: minuto hora día mes día_semana")
+    minute, hour, day, month, weekday = parts
+
+    weekdays = _parse_field(weekday, 0, 7, WEEKDAY_NAMES)
+    if weekdays & 1 << 7:
+        # 7 también es domingo
+        weekdays = (weekdays | 1) & ~(1 << 7)
+
+    return CronExpression(
+        expression=expression,
+        minutes=_parse_field(minute, 0, 59),
+        hours=_parse_field(hour, 0, 23),
+        days=_parse_field(day, 1, 31),
+        months=_parse_field(month, 1, 12, MONTH_NAMES),
+        weekdays=weekdays,
+        days_restricted=not day.startswith("*"),
+        weekdays_restricted=not weekday.startswith("*"),
+    )
+
+
+def cron_next_run(expression: str, after: datetime) -> Tuple[Optional[datetime], Optional[str]]:
+    """Próxima ejecución de una expresión cron, con el error si no es válida"""
+    try:
+        return parse_cron(expression).next_after(after), None
+    except CronError as e:
+        return None, str(e)
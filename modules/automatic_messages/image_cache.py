@@ -0,0 +1,279 @@
+"""
+Descarga de imágenes para mensajes automáticos con sesión HTTP compartida
+y caché en disco direccionada por contenido
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+import aiohttp
+from modules.core import logger
+
+CACHE_DIR = Path(__file__).resolve().parents[2] / "database" / "image_cache"
+INDEX_FILE = "index.json"
+
+MAX_CACHE_BYTES = 100 * 1024 * 1024
+MAX_IMAGE_BYTES = 10 * 1024 * 1024  # límite de subida de Discord sin boost
+FETCH_TIMEOUT = 10  # segundos
+READ_CHUNK_BYTES = 64 * 1024
+
+# Tiempo durante el que una imagen en caché se usa sin preguntar al servidor (segundos)
+REVALIDATE_AFTER = 300
+
+IMAGE_EXTENSIONS = {
+    'image/png': 'png',
+    'image/jpeg': 'jpg',
+    'image/jpg': 'jpg',
+    'image/gif': 'gif',
+    'image/webp': 'webp',
+}
+
+
+def _expected_length(response: aiohttp.ClientResponse) -> Optional[int]:
+    """Content-Length del cuerpo tal y como se lee, o None si no se puede comprobar"""
+    # Con Content-Encoding aiohttp descomprime y la cabecera no corresponde a los bytes leídos
+    if response.headers.get('Content-Encoding', 'identity').lower() != 'identity':
+        return None
+    return response.content_length
+
+
+def _image_filename(url: str, content_type: str) -> str:
+    """Nombre del archivo según el Content-Type o, si no es conocido, la extensión de la URL"""
+    content_type = content_type.split(';')[0].strip().lower()
+    if content_type in IMAGE_EXTENSIONS:
+        return f"image.{IMAGE_EXTENSIONS[content_type]}"
+
+    ext = urlparse(url).path.rsplit('.', 1)[-1].lower()
+    if ext in ('png', 'jpg', 'jpeg', 'gif', 'webp'):
+        return f"image.{ext}"
+    return 'image.png'
+
+
+class ImageCache:
+    """
+    Las imágenes se guardan en disco con el hash SHA-256 de su contenido como
+    nombre, así que varias URLs con los mismos bytes comparten archivo. Para cada
+    URL se recuerdan el ETag y el Last-Modified: pasado REVALIDATE_AFTER se hace
+    una petición condicional y, si el servidor responde 304, no se vuelve a
+    descargar nada. Al superar MAX_CACHE_BYTES se eliminan las URLs usadas hace más tiempo.
+    """
+
+    def __init__(self, cache_dir: Path = CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._entries: Optional[Dict[str, dict]] = None
+        # Un lock por URL; desaparece cuando ninguna tarea lo está usando o esperando
+        self._locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+        # Protege el índice y sus archivos, que se escriben desde hilos
+        self._io_lock = threading.Lock()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=FETCH_TIMEOUT))
+        return self._session
+
+    async def close(self) -> None:
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _load_index(self) -> Dict[str, dict]:
+        with self._io_lock:
+            return self._load_index_locked()
+
+    def _load_index_locked(self) -> Dict[str, dict]:
+        if self._entries is None:
+            try:
+                with open(self.cache_dir / INDEX_FILE, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self._entries = {}
+        return self._entries
+
+    def _save_index(self) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_dir / f"{INDEX_FILE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._entries, f)
+        tmp_path.replace(self.cache_dir / INDEX_FILE)
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.cache_dir / digest
+
+    def _read_blob(self, digest: str) -> Optional[bytes]:
+        try:
+            return self._blob_path(digest).read_bytes()
+        except OSError:
+            return None
+
+    def _store(
+        self,
+        url: str,
+        data: bytes,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        filename: str,
+        content_length: Optional[int],
+    ) -> None:
+        """Guarda la imagen y su entrada en el índice (se ejecuta fuera del event loop)"""
+        digest = hashlib.sha256(data).hexdigest()
+        with self._io_lock:
+            entries = self._load_index_locked()
+            path = self._blob_path(digest)
+            if not path.exists():
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(data)
+
+            now = time.time()
+            entries[url] = {
+                "digest": digest,
+                "size": len(data),
+                "content_length": content_length,
+                "filename": filename,
+                "etag": etag,
+                "last_modified": last_modified,
+                "checked_at": now,
+                "used_at": now,
+            }
+            self._evict()
+            self._save_index()
+
+    def _discard(self, url: str) -> None:
+        """Elimina la entrada de una URL y su archivo si ninguna otra URL lo usa"""
+        with self._io_lock:
+            entries = self._load_index_locked()
+            entry = entries.pop(url, None)
+            if entry is None:
+                return
+            if not any(other["digest"] == entry["digest"] for other in entries.values()):
+                self._blob_path(entry["digest"]).unlink(missing_ok=True)
+            self._save_index()
+
+    @staticmethod
+    def _is_complete(entry: dict, data: bytes) -> bool:
+        # Las entradas sin content_length son de versiones que podían guardar imágenes truncadas
+        if "content_length" not in entry:
+            return False
+        return entry["content_length"] is None or entry["content_length"] == len(data)
+
+    def _touch(self, url: str, revalidated: bool) -> None:
+        with self._io_lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return
+            entry["used_at"] = time.time()
+            # El último uso solo sirve para la expulsión: se guarda con la siguiente escritura
+            if revalidated:
+                entry["checked_at"] = entry["used_at"]
+                self._save_index()
+
+    def _evict(self) -> None:
+        entries = self._entries
+        sizes = {entry["digest"]: entry["size"] for entry in entries.values()}
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+
+        for url in sorted(entries, key=lambda key: entries[key]["used_at"]):
+            if total <= self.max_bytes:
+                break
+            digest = entries.pop(url)["digest"]
+            if any(entry["digest"] == digest for entry in entries.values()):
+                continue
+            total -= sizes[digest]
+            self._blob_path(digest).unlink(missing_ok=True)
+
+    async def fetch(self, url: str) -> Optional[Tuple[bytes, str]]:
+        """
+        Obtiene una imagen (bytes, nombre de archivo) desde la caché o la red.
+        Devuelve None si la URL no es válida o no se pudo descargar.
+        """
+        parsed = urlparse(url)
+        if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+            return None
+
+        # Una sola descarga por URL aunque varios mensajes la pidan a la vez
+        lock = self._locks.get(url)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[url] = lock
+        async with lock:
+            return await self._fetch(url)
+
+    async def _fetch(self, url: str) -> Optional[Tuple[bytes, str]]:
+        entries = await asyncio.to_thread(self._load_index)
+        entry = entries.get(url)
+        cached = await asyncio.to_thread(self._read_blob, entry["digest"]) if entry else None
+        if cached is not None and not self._is_complete(entry, cached):
+            logger.warning("Descartada la imagen en caché incompleta de %s", url)
+            await asyncio.to_thread(self._discard, url)
+            entry, cached = None, None
+
+        if cached is not None and time.time() - entry["checked_at"] < REVALIDATE_AFTER:
+            # _touch espera al lock de E/S, que los hilos retienen mientras escriben en disco
+            await asyncio.to_thread(self._touch, url, False)
+            return cached, entry["filename"]
+
+        headers = {}
+        if cached is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            async with self._get_session().get(url, headers=headers) as response:
+                if response.status == 304 and cached is not None:
+                    await asyncio.to_thread(self._touch, url, True)
+                    return cached, entry["filename"]
+
+                if response.status != 200:
+                    logger.warning("Error descargando imagen desde %s: HTTP %s", url, response.status)
+                    return (cached, entry["filename"]) if cached is not None else None
+
+                if response.content_length and response.content_length > MAX_IMAGE_BYTES:
+                    logger.warning("Imagen demasiado grande en %s (%d bytes)", url, response.content_length)
+                    return None
+
+                # Se lee hasta el final del cuerpo, cortando en cuanto supera el límite
+                data = bytearray()
+                async for chunk in response.content.iter_chunked(READ_CHUNK_BYTES):
+                    data.extend(chunk)
+                    if len(data) > MAX_IMAGE_BYTES:
+                        logger.warning("Imagen demasiado grande en %s", url)
+                        return None
+                data = bytes(data)
+
+                expected_length = _expected_length(response)
+                if expected_length is not None and expected_length != len(data):
+                    logger.warning(
+                        "Imagen incompleta en %s: %d de %d bytes", url, len(data), expected_length
+                    )
+                    return None
+
+                filename = _image_filename(url, response.headers.get('Content-Type', ''))
+                await asyncio.to_thread(
+                    self._store,
+                    url,
+                    data,
+                    response.headers.get('ETag'),
+                    response.headers.get('Last-Modified'),
+                    filename,
+                    expected_length,
+                )
+                return data, filename
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("Error descargando imagen desde %s: %s", url, e)
+            # Si la red falla se usa la copia en caché aunque no se haya podido revalidar
+            return (cached, entry["filename"]) if cached is not None else None
+
+
+image_cache = ImageCache()
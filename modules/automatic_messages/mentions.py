@@ -0,0 +1,109 @@
+"""Índice de nombres de roles y miembros para resolver @role{} y @user{} sin recorrer el servidor."""
+
+from typing import Dict, Iterable, Optional, Tuple
+from discord import Guild, Member, Role
+
+
+def _key(name: str) -> str:
+    return name.casefold()
+
+
+class _NameIndex:
+    """Nombre normalizado -> ids, en orden de inserción, con el mapa inverso para actualizar."""
+
+    def __init__(self):
+        self._ids_by_name: Dict[str, Dict[int, None]] = {}
+        self._names_by_id: Dict[int, Tuple[str, ...]] = {}
+
+    def add(self, object_id: int, names: Iterable[Optional[str]]) -> None:
+        self.remove(object_id)
+        keys = tuple(dict.fromkeys(_key(name) for name in names if name))
+        self._names_by_id[object_id] = keys
+        for key in keys:
+            self._ids_by_name.setdefault(key, {})[object_id] = None
+
+    def remove(self, object_id: int) -> None:
+        for key in self._names_by_id.pop(object_id, ()):
+            ids = self._ids_by_name.get(key)
+            if ids is None:
+                continue
+            ids.pop(object_id, None)
+            if not ids:
+                del self._ids_by_name[key]
+
+    def find(self, name: str) -> Tuple[int, ...]:
+        return tuple(self._ids_by_name.get(_key(name), ()))
+
+
+class _GuildMentionIndex:
+    def __init__(self, guild: Guild):
+        self.roles = _NameIndex()
+        self.members = _NameIndex()
+        for role in guild.roles:
+            self.roles.add(role.id, (role.name,))
+        for member in guild.members:
+            self.members.add(member.id, (member.name, member.nick))
+
+
+class MentionIndex:
+    """
+    Roles y miembros de cada servidor indexados por nombre (y apodo) sin distinguir
+    mayúsculas. Se construye la primera vez que se usa en un servidor y después se
+    mantiene con los eventos de miembros y roles, así que resolver una mención no
+    depende del tamaño del servidor.
+    """
+
+    def __init__(self):
+        self._guilds: Dict[int, _GuildMentionIndex] = {}
+
+    def _get(self, guild: Guild) -> _GuildMentionIndex:
+        index = self._guilds.get(guild.id)
+        if index is None:
+            index = _GuildMentionIndex(guild)
+            self._guilds[guild.id] = index
+        return index
+
+    def find_role(self, guild: Guild, name: str) -> Optional[Role]:
+        for role_id in self._get(guild).roles.find(name):
+            role = guild.get_role(role_id)
+            if role is not None:
+                return role
+        return None
+
+    def find_member(self, guild: Guild, name: str) -> Optional[Member]:
+        for member_id in self._get(guild).members.find(name):
+            member = guild.get_member(member_id)
+            if member is not None:
+                return member
+        return None
+
+    # Los eventos solo actualizan servidores ya indexados; el resto se indexa al usarse
+
+    def update_member(self, member: Member) -> None:
+        index = self._guilds.get(member.guild.id)
+        if index is not None:
+            index.members.add(member.id, (member.name, member.nick))
+
+    def remove_member(self, member: Member) -> None:
+        index = self._guilds.get(member.guild.id)
+        if index is not None:
+            index.members.remove(member.id)
+
+    def update_role(self, role: Role) -> None:
+        index = self._guilds.get(role.guild.id)
+        if index is not None:
+            index.roles.add(role.id, (role.name,))
+
+    def remove_role(self, role: Role) -> None:
+        index = self._guilds.get(role.guild.id)
+        if index is not None:
+            index.roles.remove(role.id)
+
+    def invalidate(self, guild_id: Optional[int] = None) -> None:
+        if guild_id is None:
+            self._guilds.clear()
+        else:
+            self._guilds.pop(guild_id, None)
+
+
+mention_index = MentionIndex()
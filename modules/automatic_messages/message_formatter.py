@@ -1,51 +1,14 @@
 """
 Módulo para formatear y enviar mensajes automáticos con soporte para embeds e imágenes
 """
-import json
 import discord
 import io
-import urllib.request
-import urllib.parse
-import asyncio
-import concurrent.futures
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Dict, Any
-
-def parse_message_config(text: str) -> Dict[str, Any]:
-    """
-    Parsea un mensaje que puede contener configuración avanzada
-    
-    Args:
-        text: Texto del mensaje que puede contener __ADVANCED_CONFIG__
-        
-    Returns:
-        Dict con 'text', 'embed_config', 'embed_image_url' y 'attachment_image_url'
-    """
-    config = {
-        'text': text,
-        'embed_config': None,
-        'embed_image_url': None,
-        'attachment_image_url': None
-    }
-    
-    # Buscar configuración avanzada en el texto
-    if '__ADVANCED_CONFIG__:' in text:
-        parts = text.split('__ADVANCED_CONFIG__:', 1)
-        config['text'] = parts[0].strip()
-        
-        try:
-            advanced_config = json.loads(parts[1])
-            config['embed_config'] = advanced_config.get('embed')
-            config['attachment_image_url'] = advanced_config.get('attachment_image_url')
-            
-            # Extraer imagen del embed si existe
-            if config['embed_config'] and config['embed_config'].get('image'):
-                config['embed_image_url'] = config['embed_config']['image']
-                
-        except json.JSONDecodeError:
-            # Si no se puede parsear, ignorar la configuración avanzada
-            pass
-    
-    return config
+from .image_cache import image_cache
+from .models import AutomaticMessage, EmbedConfig
+from .text_processor import CompiledTemplate, compile_template, render_template
 
 def create_color_from_string(color_str: str) -> discord.Color:
     """
@@ -86,52 +49,11 @@ def create_color_from_string(color_str: str) -> discord.Color:
     
     return color_map.get(color_str.lower(), discord.Color.blue())
 
-def _download_image_sync(url: str) -> Optional[discord.File]:
-    """
-    Descarga una imagen desde una URL de forma sincrónica
-    """
-    try:
-        # Validar que la URL sea válida
-        parsed = urllib.parse.urlparse(url)
-        if not parsed.scheme or not parsed.netloc:
-            return None
-        
-        # Descargar la imagen
-        with urllib.request.urlopen(url, timeout=10) as response:
-            if response.status == 200:
-                # Leer el contenido de la imagen
-                image_data = response.read()
-                
-                # Obtener la extensión del archivo desde la URL o Content-Type
-                content_type = response.headers.get('Content-Type', '').lower()
-                filename = 'image.png'  # Default
-                
-                if 'image/png' in content_type:
-                    filename = 'image.png'
-                elif 'image/jpeg' in content_type or 'image/jpg' in content_type:
-                    filename = 'image.jpg'
-                elif 'image/gif' in content_type:
-                    filename = 'image.gif'
-                elif 'image/webp' in content_type:
-                    filename = 'image.webp'
-                else:
-                    # Intentar obtener extensión de la URL
-                    if '.' in url:
-                        ext = url.split('.')[-1].split('?')[0].lower()
-                        if ext in ['png', 'jpg', 'jpeg', 'gif', 'webp']:
-                            filename = f'image.{ext}'
-                
-                # Crear un BytesIO object y el discord.File
-                image_buffer = io.BytesIO(image_data)
-                return discord.File(image_buffer, filename=filename)
-                
-    except Exception as e:
-        print(f"Error descargando imagen desde {url}: {e}")
-        return None
-
 async def download_image(url: str) -> Optional[discord.File]:
     """
-    Descarga una imagen desde una URL de forma asíncrona
+    Descarga una imagen desde una URL de forma asíncrona.
+    Usa la sesión HTTP compartida y la caché en disco, así que una imagen que
+    no ha cambiado no se vuelve a descargar en cada envío.
     
     Args:
         url: URL de la imagen a descargar
@@ -139,68 +61,96 @@ async def download_image(url: str) -> Optional[discord.File]:
     Returns:
         discord.File si se descarga correctamente, None si hay error
     """
-    loop = asyncio.get_event_loop()
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        return await loop.run_in_executor(executor, _download_image_sync, url)
+    image = await image_cache.fetch(url)
+    if image is None:
+        return None
+    
+    # Un discord.File solo se puede enviar una vez: se crea uno nuevo en cada llamada
+    image_data, filename = image
+    return discord.File(io.BytesIO(image_data), filename=filename)
 
-async def send_formatted_message(channel: discord.TextChannel, text: str) -> Optional[discord.Message]:
+@dataclass(frozen=True)
+class MessagePayload:
     """
-    Envía un mensaje formateado que puede incluir embed e imagen
-    
-    Args:
-        channel: Canal donde enviar el mensaje
-        text: Texto del mensaje (puede contener configuración avanzada)
-        
-    Returns:
-        El mensaje enviado o None si hubo error
+    Parte estática de un mensaje automático: el embed sin la descripción
+    dinámica y la plantilla del texto.
     """
-    try:
-        config = parse_message_config(text)
+    text: str
+    template: CompiledTemplate
+    embed: Optional[discord.Embed]
+    embed_has_description: bool
+    attachment_image_url: Optional[str]
+
+
+@lru_cache(maxsize=512)
+def get_payload(text: str, embed_config: Optional[EmbedConfig], attachment_image_url: Optional[str]) -> MessagePayload:
+    """
+    Prepara el envío de un mensaje. Se cachea por su contenido, que cambia con
+    cada edición, así que cada versión del mensaje se prepara una vez.
+    """
+    embed = None
+    if embed_config:
+        embed = discord.Embed()
         
-        # Preparar argumentos base
-        kwargs = {}
+        if embed_config.title:
+            embed.title = embed_config.title
         
-        # Si hay configuración de embed
-        if config['embed_config']:
-            embed = discord.Embed()
-            
-            if config['embed_config']['title']:
-                embed.title = config['embed_config']['title']
-            
-            if config['embed_config']['description']:
-                embed.description = config['embed_config']['description']
-            elif config['text']:  # Solo usar el texto si existe
-                embed.description = config['text']
-            
-            embed.color = create_color_from_string(config['embed_config']['color'])
-            
-            # Si hay imagen del embed, añadirla al embed
-            if config['embed_image_url']:
-                embed.set_image(url=config['embed_image_url'])
-            
-            kwargs['embed'] = embed
-            
-            # Si hay texto y no está en la descripción del embed, enviarlo también
-            if config['text'] and config['text'] != embed.description:
-                kwargs['content'] = config['text']
+        if embed_config.description:
+            embed.description = embed_config.description
         
-        else:
-            # Mensaje simple con o sin imagen
-            if config['text']:  # Solo añadir contenido si hay texto
-                kwargs['content'] = config['text']
+        embed.color = create_color_from_string(embed_config.color)
+        
+        # Si hay imagen del embed, añadirla al embed
+        if embed_config.image_url:
+            embed.set_image(url=embed_config.image_url)
+    
+    return MessagePayload(
+        text=text,
+        template=compile_template(text),
+        embed=embed,
+        embed_has_description=bool(embed_config and embed_config.description),
+        attachment_image_url=attachment_image_url
+    )
+
+
+def _build_send_kwargs(payload: MessagePayload, text: str) -> Dict[str, Any]:
+    kwargs = {}
+    
+    # Si hay configuración de embed
+    if payload.embed is not None:
+        # Copia del esqueleto: el embed se modifica en cada envío
+        embed = payload.embed.copy()
+        if not payload.embed_has_description and text:  # Solo usar el texto si existe
+            embed.description = text
+        
+        kwargs['embed'] = embed
+        
+        # Si hay texto y no está en la descripción del embed, enviarlo también
+        if text and text != embed.description:
+            kwargs['content'] = text
+    
+    elif text:  # Mensaje simple: solo añadir contenido si hay texto
+        kwargs['content'] = text
+    
+    return kwargs
+
+
+async def _send_payload(channel: discord.TextChannel, payload: MessagePayload, text: str) -> Optional[discord.Message]:
+    try:
+        kwargs = _build_send_kwargs(payload, text)
         
         # Manejar imagen de attachment (independiente del embed)
-        if config['attachment_image_url']:
-            image_file = await download_image(config['attachment_image_url'])
+        if payload.attachment_image_url:
+            image_file = await download_image(payload.attachment_image_url)
             if image_file:
                 kwargs['file'] = image_file
             else:
                 # Fallback: mostrar la URL si no se pudo descargar
-                print(f"No se pudo descargar la imagen, mostrando URL: {config['attachment_image_url']}")
+                print(f"No se pudo descargar la imagen, mostrando URL: {payload.attachment_image_url}")
                 if 'content' in kwargs:
-                    kwargs['content'] += f"\n{config['attachment_image_url']}"
+                    kwargs['content'] += f"\n{payload.attachment_image_url}"
                 else:
-                    kwargs['content'] = config['attachment_image_url']
+                    kwargs['content'] = payload.attachment_image_url
         
         # Verificar que hay algo que enviar
         if not any(key in kwargs for key in ['content', 'embed', 'file']):
@@ -211,65 +161,72 @@ async def send_formatted_message(channel: discord.TextChannel, text: str) -> Opt
         
     except Exception as e:
         print(f"Error enviando mensaje formateado: {e}")
-        # Fallback: enviar solo el texto original si existe
+        # Fallback: enviar solo el texto si existe
         try:
-            clean_text = text.split('__ADVANCED_CONFIG__:')[0].strip()
-            if clean_text:  # Solo enviar si hay texto
-                return await channel.send(clean_text)
+            if text:
+                return await channel.send(text)
             else:
                 print("No hay texto de fallback para enviar")
                 return None
         except Exception:
             return None
-        if not any(key in kwargs for key in ['content', 'embed', 'file']):
-            print("Error: No hay contenido para enviar (ni texto, ni embed, ni imagen)")
-            return None
-        
-        return await channel.send(**kwargs)
+
+
+async def send_automatic_message(channel: discord.TextChannel, message: AutomaticMessage) -> Optional[discord.Message]:
+    """
+    Envía un mensaje automático que puede incluir embed e imagen. El embed se
+    toma de la caché y en cada envío solo se renderizan las variables del texto.
+    
+    Args:
+        channel: Canal donde enviar el mensaje
+        message: Mensaje automático a enviar
         
+    Returns:
+        El mensaje enviado o None si hubo error
+    """
+    try:
+        payload = get_payload(message.text, message.embed, message.attachment_image_url)
     except Exception as e:
-        print(f"Error enviando mensaje formateado: {e}")
-        # Fallback: enviar solo el texto original si existe
-        try:
-            clean_text = text.split('__ADVANCED_CONFIG__:')[0].strip()
-            if clean_text:  # Solo enviar si hay texto
-                return await channel.send(clean_text)
-            else:
-                print("No hay texto de fallback para enviar")
-                return None
-        except Exception:
-            return None
+        print(f"Error preparando mensaje automático: {e}")
+        return None
+    
+    try:
+        text = render_template(payload.template, channel)
+    except Exception:
+        # Si hay error en el procesamiento, usar el texto sin procesar
+        text = payload.text
+    return await _send_payload(channel, payload, text)
 
-def format_message_preview(text: str) -> Dict[str, str]:
+def format_message_preview(message: AutomaticMessage) -> Dict[str, str]:
     """
     Crea un preview del mensaje para mostrar en la UI
     
     Args:
-        text: Texto del mensaje
+        message: Mensaje automático
         
     Returns:
         Dict con 'text_preview', 'embed_preview', 'image_preview'
     """
-    config = parse_message_config(text)
+    text = message.text
+    embed = message.embed
     
     preview = {
-        'text_preview': config['text'][:200] + ('...' if len(config['text']) > 200 else '') if config['text'] else '(Sin texto)',
+        'text_preview': text[:200] + ('...' if len(text) > 200 else '') if text else '(Sin texto)',
         'embed_preview': '',
         'image_preview': ''
     }
     
-    if config['embed_config']:
-        title = config['embed_config']['title'] or 'Sin título'
-        color = config['embed_config']['color']
-        preview['embed_preview'] = f"🎨 **Embed**: {title} ({color})"
+    if embed:
+        title = embed.title or 'Sin título'
+        preview['embed_preview'] = f"🎨 **Embed**: {title} ({embed.color})"
     
-    if config['embed_image_url']:
-        preview['image_preview'] = f"🖼️ **Imagen Embed**: {config['embed_image_url'][:50]}..."
+    if embed and embed.image_url:
+        preview['image_preview'] = f"🖼️ **Imagen Embed**: {embed.image_url[:50]}..."
     
-    if config['attachment_image_url']:
+    if message.attachment_image_url:
         if preview['image_preview']:
-            preview['image_preview'] += f"\n📎 **Imagen Attachment**: {config['attachment_image_url'][:50]}..."
+            preview['image_preview'] += f"\n📎 **Imagen Attachment**: {message.attachment_image_url[:50]}..."
         else:
-            preview['image_preview'] = f"📎 **Imagen Attachment**: {config['attachment_image_url'][:50]}..."
+            preview['image_preview'] = f"📎 **Imagen Attachment**: {message.attachment_image_url[:50]}..."
     
     return preview
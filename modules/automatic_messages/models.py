@@ -6,6 +6,27 @@ ScheduleType = Literal["interval", "daily", "weekly", "custom", "on_channel_crea
 IntervalUnit = Literal["seconds", "minutes", "hours"]
 
 
+@dataclass(frozen=True)
+class EmbedConfig:
+    """Configuración del embed de un mensaje automático"""
+    title: Optional[str] = None
+    description: Optional[str] = None
+    color: str = "blue"
+    image_url: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict]) -> Optional["EmbedConfig"]:
+        """Crea la configuración desde el diccionario que construyen las vistas"""
+        if not data:
+            return None
+        return cls(
+            title=data.get('title') or None,
+            description=data.get('description') or None,
+            color=data.get('color') or "blue",
+            image_url=data.get('image') or None,
+        )
+
+
 @dataclass
 class AutomaticMessage:
     id: str
@@ -20,6 +41,8 @@ class AutomaticMessage:
     schedule_type: Optional[ScheduleType] = "interval"
     weekdays: Optional[str] = None  # JSON array de días de la semana
     cron_expression: Optional[str] = None
+    embed: Optional[EmbedConfig] = None
+    attachment_image_url: Optional[str] = None
 
     def __post_init__(self):
         # Validaciones post-inicialización más permisivas para datos existentes
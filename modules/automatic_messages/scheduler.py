@@ -2,11 +2,14 @@
 Programador adicional para funcionalidades específicas de mensajes automáticos
 """
 
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime, timedelta
 import asyncio
 from .models import AutomaticMessage
 from .services import AutomaticMessagesService
+from .tasks import get_scheduler, unschedule_message
+from .timing import build_timeline, next_run_after
+from .cron import CronError, parse_cron
 from modules.core import logger
 import json
 
@@ -20,94 +23,67 @@ class AdvancedScheduler:
     
     async def calculate_next_runs(self, message_id: str) -> Optional[datetime]:
         """Calcula la próxima ejecución de un mensaje automático"""
-        message, error = self.service.get_by_id(message_id)
+        message, error = await self.service.get_by_id(message_id)
         
         if error or not message:
             return None
         
-        now = datetime.now()
-        
         if message.schedule_type == "interval":
-            # Para intervalos no podemos calcular sin saber la última ejecución
-            return None
+            # La próxima ejecución de un intervalo depende del último envío: la conoce el programador
+            scheduler = get_scheduler()
+            return scheduler.get_next_run(message.id) if scheduler else None
         
-        elif message.schedule_type == "daily":
-            if message.hour is not None and message.minute is not None:
-                next_run = now.replace(
-                    hour=message.hour, 
-                    minute=message.minute, 
-                    second=0, 
-                    microsecond=0
-                )
-                
-                if next_run <= now:
-                    next_run += timedelta(days=1)
-                
-                return next_run
+        # Diario, semanal y cron se calculan igual que en el programador
+        return next_run_after(message, datetime.now())
+    
+    async def _interval_anchors(self) -> Dict[str, datetime]:
+        """Próxima ejecución conocida de cada mensaje, para poder predecir los intervalos"""
+        scheduler = get_scheduler()
+        if scheduler:
+            return scheduler.get_next_runs()
+        
+        # Sin programador en marcha se usa el estado guardado en la base de datos
+        states, error = await self.service.get_run_states()
+        if error or not states:
+            return {}
+        return {
+            message_id: next_run_at
+            for message_id, (_, next_run_at) in states.items()
+            if next_run_at is not None
+        }
+    
+    async def get_timeline(
+        self,
+        hours_ahead: int = 24,
+        max_per_message: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> List[Tuple[AutomaticMessage, datetime]]:
+        """
+        Obtiene todas las ejecuciones de las próximas X horas en orden cronológico.
+        Los mensajes se cargan con una sola consulta y se calculan en una pasada.
+        Retorna lista de tuplas (AutomaticMessage, datetime_run)
+        """
+        messages, error = await self.service.get_all()
         
-        elif message.schedule_type == "weekly":
-            # Implementación simplificada para programación semanal
-            if (message.hour is not None and 
-                message.minute is not None and 
-                message.weekdays):
-                
-                try:
-                    weekdays = json.loads(message.weekdays)
-                    
-                    # Encontrar el próximo día válido
-                    current_weekday = now.weekday()
-                    target_time = now.replace(
-                        hour=message.hour,
-                        minute=message.minute,
-                        second=0,
-                        microsecond=0
-                    )
-                    
-                    for days_ahead in range(7):
-                        check_date = now + timedelta(days=days_ahead)
-                        check_weekday = check_date.weekday()
-                        
-                        if check_weekday in weekdays:
-                            next_run = check_date.replace(
-                                hour=message.hour,
-                                minute=message.minute,
-                                second=0,
-                                microsecond=0
-                            )
-                            
-                            if next_run > now:
-                                return next_run
-                    
-                except (json.JSONDecodeError, ValueError):
-                    logger.error("Error procesando días de la semana para mensaje %s", message_id)
-                    return None
+        if error or not messages:
+            return []
         
-        return None
+        now = datetime.now()
+        return build_timeline(
+            messages,
+            now,
+            now + timedelta(hours=hours_ahead),
+            interval_anchors=await self._interval_anchors(),
+            max_per_message=max_per_message,
+            limit=limit
+        )
     
     async def get_upcoming_messages(self, hours_ahead: int = 24) -> List[tuple]:
         """
         Obtiene una lista de mensajes que se ejecutarán en las próximas X horas
         Retorna lista de tuplas (AutomaticMessage, datetime_next_run)
         """
-        messages, error = self.service.get_all()
-        
-        if error or not messages:
-            return []
-        
-        upcoming = []
-        cutoff_time = datetime.now() + timedelta(hours=hours_ahead)
-        
-        for message in messages:
-            if message.schedule_type == "interval":
-                continue  # No podemos predecir intervalos
-            
-            next_run = await self.calculate_next_runs(message.id)
-            if next_run and next_run <= cutoff_time:
-                upcoming.append((message, next_run))
-        
-        # Ordenar por tiempo de ejecución
-        upcoming.sort(key=lambda x: x[1])
-        return upcoming
+        return await self.get_timeline(hours_ahead, max_per_message=1)
     
     async def validate_message_config(self, message: AutomaticMessage) -> List[str]:
         """
@@ -159,13 +135,18 @@ class AdvancedScheduler:
         elif message.schedule_type == "custom":
             if not message.cron_expression:
                 errors.append("La expresión cron es obligatoria para programación personalizada")
-            # TODO: Validar expresión cron
+            else:
+                try:
+                    if parse_cron(message.cron_expression).next_after(datetime.now()) is None:
+                        errors.append("La expresión cron no tiene ninguna ejecución futura")
+                except CronError as e:
+                    errors.append(f"Expresión cron inválida: {e}")
         
         return errors
     
     async def get_message_statistics(self) -> dict:
         """Obtiene estadísticas de los mensajes automáticos"""
-        messages, error = self.service.get_all()
+        messages, error = await self.service.get_all()
         
         if error or not messages:
             return {
@@ -212,7 +193,7 @@ class AdvancedScheduler:
         Elimina mensajes automáticos que apuntan a canales/categorías inexistentes
         Retorna el número de mensajes eliminados
         """
-        messages, error = self.service.get_all()
+        messages, error = await self.service.get_all()
         
         if error or not messages:
             return 0
@@ -241,8 +222,9 @@ class AdvancedScheduler:
                     )
             
             if should_delete:
-                success, error = self.service.delete(message.id)
+                success, error = await self.service.delete(message.id)
                 if success:
+                    unschedule_message(message.id)
                     deleted_count += 1
                 else:
                     logger.error(
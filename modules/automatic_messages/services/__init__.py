@@ -2,9 +2,10 @@
 from .message_service import MessageService
 from .query_service import QueryService
 from .schedule_service import ScheduleService
+from .run_state_service import RunStateService
 
 # Clase principal que mantiene compatibilidad con el código existente
-class AutomaticMessagesService(QueryService, ScheduleService):
+class AutomaticMessagesService(QueryService, ScheduleService, RunStateService):
     """
     Servicio principal que combina todas las funcionalidades.
     Mantiene compatibilidad con el código existente.
@@ -16,5 +17,6 @@ __all__ = [
     'MessageService',
     'QueryService', 
     'ScheduleService',
+    'RunStateService',
     'AutomaticMessagesService'
 ]
@@ -1,11 +1,22 @@
 from typing import Optional, Tuple
 from database import Database
 from modules.core import logger
-from ..models import AutomaticMessage
+from ..models import AutomaticMessage, EmbedConfig
 
 
 class MessageService:
     """Servicio básico para CRUD de mensajes automáticos"""
+
+    MESSAGE_SELECT_SQL = """
+        SELECT id, channel_id, category_id, text, name, interval, interval_unit,
+               hour, minute, schedule_type, weekdays, cron_expression,
+               has_embed, embed_title, embed_description, embed_color, embed_image_url,
+               attachment_image_url
+        FROM automatic_messages
+    """
+    MESSAGE_SELECT_BY_ID_SQL = MESSAGE_SELECT_SQL + "WHERE id = ?"
+    MESSAGE_SELECT_BY_CHANNEL_SQL = MESSAGE_SELECT_SQL + "WHERE channel_id = ? ORDER BY name, id"
+    MESSAGE_SELECT_BY_CATEGORY_SQL = MESSAGE_SELECT_SQL + "WHERE category_id = ? ORDER BY name, id"
     
     def __init__(self):
         self.db = Database()
@@ -25,17 +36,38 @@ class MessageService:
             if message_data.get('interval_unit') is None:
                 message_data['interval_unit'] = 'minutes'
         
+        # Las columnas del embed se agrupan en un EmbedConfig
+        has_embed = message_data.pop('has_embed', 0)
+        embed_title = message_data.pop('embed_title', None)
+        embed_description = message_data.pop('embed_description', None)
+        embed_color = message_data.pop('embed_color', None)
+        embed_image_url = message_data.pop('embed_image_url', None)
+        if has_embed:
+            message_data['embed'] = EmbedConfig(
+                title=embed_title,
+                description=embed_description,
+                color=embed_color or "blue",
+                image_url=embed_image_url
+            )
+        
         return message_data
     
-    def get_by_id(self, message_id: str) -> Tuple[Optional[AutomaticMessage], Optional[str]]:
+    def _advanced_config_values(self, message: AutomaticMessage) -> tuple:
+        """Valores de las columnas de configuración avanzada de un mensaje"""
+        embed = message.embed
+        return (
+            1 if embed else 0,
+            embed.title if embed else None,
+            embed.description if embed else None,
+            embed.color if embed else None,
+            embed.image_url if embed else None,
+            message.attachment_image_url
+        )
+    
+    async def get_by_id(self, message_id: str) -> Tuple[Optional[AutomaticMessage], Optional[str]]:
         """Obtiene un mensaje automático por ID"""
         try:
-            row = self.db.single("""
-                SELECT id, channel_id, category_id, text, name, interval, interval_unit,
-                       hour, minute, schedule_type, weekdays, cron_expression
-                FROM automatic_messages 
-                WHERE id = ?
-            """, (message_id,))
+            row = await self.db.single_async(MessageService.MESSAGE_SELECT_BY_ID_SQL, (message_id,))
             if not row:
                 return None, None
             
@@ -47,14 +79,16 @@ class MessageService:
             logger.error("Error al obtener el mensaje automático: %s", error)
             return None, error
     
-    def add(self, message: AutomaticMessage) -> Tuple[bool, Optional[str]]:
+    async def add(self, message: AutomaticMessage) -> Tuple[bool, Optional[str]]:
         """Añade un nuevo mensaje automático"""
         try:
-            self.db.execute("""
+            await self.db.execute_async("""
                 INSERT INTO automatic_messages 
                 (id, channel_id, category_id, text, name, interval, interval_unit, 
-                 hour, minute, schedule_type, weekdays, cron_expression)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                 hour, minute, schedule_type, weekdays, cron_expression,
+                 has_embed, embed_title, embed_description, embed_color, embed_image_url,
+                 attachment_image_url)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 message.id,
                 message.channel_id,
@@ -67,7 +101,8 @@ class MessageService:
                 message.minute,
                 message.schedule_type,
                 message.weekdays,
-                message.cron_expression
+                message.cron_expression,
+                *self._advanced_config_values(message)
             ))
             return True, None
         except Exception as e:
@@ -75,14 +110,16 @@ class MessageService:
             logger.error("Error al crear mensaje automático: %s", error)
             return False, error
     
-    def update(self, message: AutomaticMessage) -> Tuple[bool, Optional[str]]:
+    async def update(self, message: AutomaticMessage) -> Tuple[bool, Optional[str]]:
         """Actualiza un mensaje automático existente"""
         try:
-            self.db.execute("""
+            await self.db.execute_async("""
                 UPDATE automatic_messages 
                 SET channel_id = ?, category_id = ?, text = ?, name = ?, 
                     interval = ?, interval_unit = ?, hour = ?, minute = ?,
-                    schedule_type = ?, weekdays = ?, cron_expression = ?
+                    schedule_type = ?, weekdays = ?, cron_expression = ?,
+                    has_embed = ?, embed_title = ?, embed_description = ?, embed_color = ?,
+                    embed_image_url = ?, attachment_image_url = ?
                 WHERE id = ?
             """, (
                 message.channel_id,
@@ -96,6 +133,7 @@ class MessageService:
                 message.schedule_type,
                 message.weekdays,
                 message.cron_expression,
+                *self._advanced_config_values(message),
                 message.id
             ))
             return True, None
@@ -104,20 +142,20 @@ class MessageService:
             logger.error("Error al actualizar mensaje automático: %s", error)
             return False, error
     
-    def delete(self, message_id: str) -> Tuple[bool, Optional[str]]:
+    async def delete(self, message_id: str) -> Tuple[bool, Optional[str]]:
         """Elimina un mensaje automático"""
         try:
-            self.db.execute("DELETE FROM automatic_messages WHERE id = ?", (message_id,))
+            await self.db.execute_async("DELETE FROM automatic_messages WHERE id = ?", (message_id,))
             return True, None
         except Exception as e:
             error = str(e)
             logger.error("Error al eliminar mensaje automático: %s", error)
             return False, error
     
-    def exists(self, message_id: str) -> bool:
+    async def exists(self, message_id: str) -> bool:
         """Verifica si existe un mensaje automático con el ID dado"""
         try:
-            row = self.db.single("SELECT 1 FROM automatic_messages WHERE id = ?", (message_id,))
+            row = await self.db.single_async("SELECT 1 FROM automatic_messages WHERE id = ?", (message_id,))
             return row is not None
         except Exception as e:
             logger.error("Error al verificar existencia del mensaje: %s", str(e))
@@ -7,12 +7,14 @@ from .message_service import MessageService
 class QueryService(MessageService):
     """Servicio para consultas específicas y filtros de mensajes automáticos"""
     
-    def get_all(self) -> Tuple[Optional[List[AutomaticMessage]], Optional[str]]:
+    async def get_all(self) -> Tuple[Optional[List[AutomaticMessage]], Optional[str]]:
         """Obtiene todos los mensajes automáticos"""
         try:
-            rows = self.db.select("""
+            rows = await self.db.select_async("""
                 SELECT id, channel_id, category_id, text, name, interval, interval_unit, 
-                       hour, minute, schedule_type, weekdays, cron_expression
+                       hour, minute, schedule_type, weekdays, cron_expression,
+                       has_embed, embed_title, embed_description, embed_color, embed_image_url,
+                       attachment_image_url
                 FROM automatic_messages
                 ORDER BY name, id
             """)
@@ -32,16 +34,10 @@ class QueryService(MessageService):
             logger.error("Error al obtener los mensajes automáticos: %s", error)
             return None, error
     
-    def get_by_channel_id(self, channel_id: int) -> Tuple[Optional[List[AutomaticMessage]], Optional[str]]:
+    async def get_by_channel_id(self, channel_id: int) -> Tuple[Optional[List[AutomaticMessage]], Optional[str]]:
         """Obtiene todos los mensajes automáticos de un canal específico"""
         try:
-            rows = self.db.select("""
-                SELECT id, channel_id, category_id, text, name, interval, interval_unit,
-                       hour, minute, schedule_type, weekdays, cron_expression
-                FROM automatic_messages 
-                WHERE channel_id = ?
-                ORDER BY name, id
-            """, (channel_id,))
+            rows = await self.db.select_async(MessageService.MESSAGE_SELECT_BY_CHANNEL_SQL, (channel_id,))
             
             messages = []
             for row in rows:
@@ -59,16 +55,10 @@ class QueryService(MessageService):
             logger.error("Error al obtener mensajes por canal: %s", error)
             return None, error
     
-    def get_by_category_id(self, category_id: int) -> Tuple[Optional[List[AutomaticMessage]], Optional[str]]:
+    async def get_by_category_id(self, category_id: int) -> Tuple[Optional[List[AutomaticMessage]], Optional[str]]:
         """Obtiene todos los mensajes automáticos de una categoría específica"""
         try:
-            rows = self.db.select("""
-                SELECT id, channel_id, category_id, text, name, interval, interval_unit,
-                       hour, minute, schedule_type, weekdays, cron_expression
-                FROM automatic_messages 
-                WHERE category_id = ?
-                ORDER BY name, id
-            """, (category_id,))
+            rows = await self.db.select_async(MessageService.MESSAGE_SELECT_BY_CATEGORY_SQL, (category_id,))
             
             messages = []
             for row in rows:
@@ -86,12 +76,14 @@ class QueryService(MessageService):
             logger.error("Error al obtener mensajes por categoría: %s", error)
             return None, error
     
-    def get_by_schedule_type(self, schedule_type: str) -> Tuple[Optional[List[AutomaticMessage]], Optional[str]]:
+    async def get_by_schedule_type(self, schedule_type: str) -> Tuple[Optional[List[AutomaticMessage]], Optional[str]]:
         """Obtiene mensajes por tipo de programación"""
         try:
-            rows = self.db.select("""
+            rows = await self.db.select_async("""
                 SELECT id, channel_id, category_id, text, name, interval, interval_unit,
-                       hour, minute, schedule_type, weekdays, cron_expression
+                       hour, minute, schedule_type, weekdays, cron_expression,
+                       has_embed, embed_title, embed_description, embed_color, embed_image_url,
+                       attachment_image_url
                 FROM automatic_messages 
                 WHERE schedule_type = ?
                 ORDER BY name, id
@@ -112,3 +104,32 @@ class QueryService(MessageService):
             error = str(e)
             logger.error("Error al obtener mensajes por tipo de programación: %s", error)
             return None, error
+    
+    async def get_with_images(self) -> Tuple[Optional[List[AutomaticMessage]], Optional[str]]:
+        """Obtiene los mensajes que incluyen alguna imagen (del embed o como attachment)"""
+        try:
+            rows = await self.db.select_async("""
+                SELECT id, channel_id, category_id, text, name, interval, interval_unit,
+                       hour, minute, schedule_type, weekdays, cron_expression,
+                       has_embed, embed_title, embed_description, embed_color, embed_image_url,
+                       attachment_image_url
+                FROM automatic_messages 
+                WHERE embed_image_url IS NOT NULL OR attachment_image_url IS NOT NULL
+                ORDER BY name, id
+            """)
+            
+            messages = []
+            for row in rows:
+                try:
+                    message_data = self._normalize_message_data(row)
+                    message = AutomaticMessage(**message_data)
+                    messages.append(message)
+                except Exception as e:
+                    logger.warning(f"Error procesando mensaje {row.get('id', 'unknown')}: {e}")
+                    continue
+            
+            return messages, None
+        except Exception as e:
+            error = str(e)
+            logger.error("Error al obtener mensajes con imágenes: %s", error)
+            return None, error
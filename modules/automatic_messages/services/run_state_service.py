@@ -0,0 +1,51 @@
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+from modules.core import logger
+from .message_service import MessageService
+
+RunState = Tuple[Optional[datetime], Optional[datetime]]
+
+
+def _parse_timestamp(value) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+class RunStateService(MessageService):
+    """Servicio para el estado de ejecución (último envío y próxima ejecución) de los mensajes"""
+
+    async def get_run_states(self) -> Tuple[Optional[Dict[str, RunState]], Optional[str]]:
+        """Obtiene last_sent_at y next_run_at de todos los mensajes que tienen alguno"""
+        try:
+            rows = await self.db.select_async("""
+                SELECT id, last_sent_at, next_run_at
+                FROM automatic_messages
+                WHERE last_sent_at IS NOT NULL OR next_run_at IS NOT NULL
+            """)
+            states = {
+                row["id"]: (_parse_timestamp(row["last_sent_at"]), _parse_timestamp(row["next_run_at"]))
+                for row in rows
+            }
+            return states, None
+        except Exception as e:
+            error = str(e)
+            logger.error("Error al obtener el estado de los mensajes automáticos: %s", error)
+            return None, error
+
+    async def save_run_states(self, states: Iterable[Tuple[str, Optional[datetime], Optional[datetime]]]) -> Tuple[bool, Optional[str]]:
+        """Guarda en una sola operación el estado de varios mensajes (id, last_sent_at, next_run_at)"""
+        try:
+            await self.db.executemany_async("""
+                UPDATE automatic_messages
+                SET last_sent_at = ?, next_run_at = ?
+                WHERE id = ?
+            """, [(last_sent_at, next_run_at, message_id) for message_id, last_sent_at, next_run_at in states])
+            return True, None
+        except Exception as e:
+            error = str(e)
+            logger.error("Error al guardar el estado de los mensajes automáticos: %s", error)
+            return False, error
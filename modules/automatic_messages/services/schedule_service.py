@@ -7,12 +7,14 @@ from .message_service import MessageService
 class ScheduleService(MessageService):
     """Servicio especializado para mensajes con programación específica"""
     
-    def get_interval_messages(self) -> Tuple[Optional[List[AutomaticMessage]], Optional[str]]:
+    async def get_interval_messages(self) -> Tuple[Optional[List[AutomaticMessage]], Optional[str]]:
         """Obtiene todos los mensajes con programación por intervalo"""
         try:
-            rows = self.db.select("""
+            rows = await self.db.select_async("""
                 SELECT id, channel_id, category_id, text, name, interval, interval_unit,
-                       hour, minute, schedule_type, weekdays, cron_expression
+                       hour, minute, schedule_type, weekdays, cron_expression,
+                       has_embed, embed_title, embed_description, embed_color, embed_image_url,
+                       attachment_image_url
                 FROM automatic_messages 
                 WHERE schedule_type = 'interval' AND channel_id IS NOT NULL
                 ORDER BY name, id
@@ -34,12 +36,14 @@ class ScheduleService(MessageService):
             logger.error("Error al obtener mensajes por intervalo: %s", error)
             return None, error
     
-    def get_scheduled_messages(self) -> Tuple[Optional[List[AutomaticMessage]], Optional[str]]:
+    async def get_scheduled_messages(self) -> Tuple[Optional[List[AutomaticMessage]], Optional[str]]:
         """Obtiene todos los mensajes con programación por hora/cron"""
         try:
-            rows = self.db.select("""
+            rows = await self.db.select_async("""
                 SELECT id, channel_id, category_id, text, name, interval, interval_unit,
-                       hour, minute, schedule_type, weekdays, cron_expression
+                       hour, minute, schedule_type, weekdays, cron_expression,
+                       has_embed, embed_title, embed_description, embed_color, embed_image_url,
+                       attachment_image_url
                 FROM automatic_messages 
                 WHERE schedule_type IN ('daily', 'weekly', 'custom') AND channel_id IS NOT NULL
                 ORDER BY name, id
@@ -61,12 +65,14 @@ class ScheduleService(MessageService):
             logger.error("Error al obtener mensajes programados: %s", error)
             return None, error
     
-    def get_channel_create_messages(self) -> Tuple[Optional[List[AutomaticMessage]], Optional[str]]:
+    async def get_channel_create_messages(self) -> Tuple[Optional[List[AutomaticMessage]], Optional[str]]:
         """Obtiene mensajes que se envían al crear canales"""
         try:
-            rows = self.db.select("""
+            rows = await self.db.select_async("""
                 SELECT id, channel_id, category_id, text, name, interval, interval_unit,
-                       hour, minute, schedule_type, weekdays, cron_expression
+                       hour, minute, schedule_type, weekdays, cron_expression,
+                       has_embed, embed_title, embed_description, embed_color, embed_image_url,
+                       attachment_image_url
                 FROM automatic_messages 
                 WHERE schedule_type = 'on_channel_create'
                 ORDER BY name, id
@@ -88,12 +94,14 @@ class ScheduleService(MessageService):
             logger.error("Error al obtener mensajes de creación de canal: %s", error)
             return None, error
     
-    def get_daily_messages(self) -> Tuple[Optional[List[AutomaticMessage]], Optional[str]]:
+    async def get_daily_messages(self) -> Tuple[Optional[List[AutomaticMessage]], Optional[str]]:
         """Obtiene mensajes programados diariamente"""
         try:
-            rows = self.db.select("""
+            rows = await self.db.select_async("""
                 SELECT id, channel_id, category_id, text, name, interval, interval_unit,
-                       hour, minute, schedule_type, weekdays, cron_expression
+                       hour, minute, schedule_type, weekdays, cron_expression,
+                       has_embed, embed_title, embed_description, embed_color, embed_image_url,
+                       attachment_image_url
                 FROM automatic_messages 
                 WHERE schedule_type = 'daily' AND channel_id IS NOT NULL
                 ORDER BY hour, minute, name
@@ -115,12 +123,14 @@ class ScheduleService(MessageService):
             logger.error("Error al obtener mensajes diarios: %s", error)
             return None, error
     
-    def get_weekly_messages(self) -> Tuple[Optional[List[AutomaticMessage]], Optional[str]]:
+    async def get_weekly_messages(self) -> Tuple[Optional[List[AutomaticMessage]], Optional[str]]:
         """Obtiene mensajes programados semanalmente"""
         try:
-            rows = self.db.select("""
+            rows = await self.db.select_async("""
                 SELECT id, channel_id, category_id, text, name, interval, interval_unit,
-                       hour, minute, schedule_type, weekdays, cron_expression
+                       hour, minute, schedule_type, weekdays, cron_expression,
+                       has_embed, embed_title, embed_description, embed_color, embed_image_url,
+                       attachment_image_url
                 FROM automatic_messages 
                 WHERE schedule_type = 'weekly' AND channel_id IS NOT NULL
                 ORDER BY hour, minute, name
@@ -177,11 +177,11 @@ class AutomaticMessagesCommands(commands.GroupCog, name="mensajes_automaticos"):
         
         # Obtener mensajes según los filtros
         if canal:
-            messages, error = self.service.get_by_channel_id(canal.id)
+            messages, error = await self.service.get_by_channel_id(canal.id)
         elif categoria:
-            messages, error = self.service.get_by_category_id(categoria.id)
+            messages, error = await self.service.get_by_category_id(categoria.id)
         else:
-            messages, error = self.service.get_all()
+            messages, error = await self.service.get_all()
         
         if error:
             await send_error_message(interaction, constants.ERROR_GETTING_MESSAGES)
@@ -225,11 +225,11 @@ class AutomaticMessagesCommands(commands.GroupCog, name="mensajes_automaticos"):
         
         # Obtener mensajes según los filtros
         if canal:
-            messages, error = self.service.get_by_channel_id(canal.id)
+            messages, error = await self.service.get_by_channel_id(canal.id)
         elif categoria:
-            messages, error = self.service.get_by_category_id(categoria.id)
+            messages, error = await self.service.get_by_category_id(categoria.id)
         else:
-            messages, error = self.service.get_all()
+            messages, error = await self.service.get_all()
         
         if error:
             await send_error_message(interaction, constants.ERROR_GETTING_MESSAGES)
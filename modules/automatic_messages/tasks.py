@@ -1,60 +1,167 @@
 """
-Tareas programadas para el módulo de mensajes automáticos usando schedule
+Tareas programadas para el módulo de mensajes automáticos
 """
 
 import asyncio
-import threading
-import time
-import schedule
+import heapq
+from itertools import count
 from datetime import datetime
-from typing import Dict, Optional
-import json
+from datetime import timedelta
+from typing import Dict, List, Optional, Set, Tuple
+from settings import automatic_messages_profile
 from modules.core import logger
 from .services import AutomaticMessagesService
 from .models import AutomaticMessage
-from .text_processor import process_message_text
+from .message_formatter import get_payload, send_automatic_message
+from .timing import first_run_after, next_run_after
+
+# Espera máxima entre comprobaciones del reloj (segundos). Solo limita cuánto
+# tarda en notarse un cambio de hora del sistema; los envíos no dependen de ella.
+MAX_SLEEP = 300
+
+# Entradas obsoletas toleradas en el montículo antes de compactarlo
+MIN_STALE_TO_COMPACT = 64
+
+# Margen que tienen los envíos en curso para terminar al detener el programador (segundos)
+STOP_SEND_TIMEOUT = 5
+
+SCHEDULED_TYPES = ("interval", "daily", "weekly", "custom")
+
+# Política para las ejecuciones perdidas mientras el bot estaba apagado; se puede
+# sobrescribir con la clave "automatic_messages" de config.json
+DEFAULT_RUN_POLICY = {
+    "missed_run_policy": "catch_up",
+    "catch_up_window": 3600,  # segundos
+    "state_flush_interval": 30,  # segundos
+    "max_concurrent_sends": 5,  # envíos simultáneos al crearse canales en una categoría
+}
+MISSED_RUN_POLICIES = ("catch_up", "skip")
+
+
+def _schedule_signature(message: AutomaticMessage) -> tuple:
+    """Campos que determinan cuándo se envía un mensaje"""
+    return (
+        message.schedule_type,
+        message.interval,
+        message.interval_unit,
+        message.hour,
+        message.minute,
+        message.weekdays,
+        message.cron_expression,
+    )
 
 
 class AutomaticMessagesScheduler:
-    """Programador de mensajes automáticos usando schedule (cron-like)"""
+    """
+    Programador de mensajes automáticos.
+
+    Mantiene un montículo (min-heap) con la próxima ejecución de cada mensaje y
+    una única tarea del event loop que duerme hasta la más cercana, así que no
+    hay sondeo periódico ni hilos aparte.
+
+    Cada entrada lleva la versión del mensaje en el momento de programarse.
+    Editar o eliminar un mensaje solo incrementa su versión, y las entradas
+    antiguas se descartan al salir del montículo, de modo que los cambios son
+    O(log n) y no alteran la próxima ejecución del resto de mensajes.
+
+    El último envío y la próxima ejecución de cada mensaje se guardan en la base
+    de datos por lotes, para retomar la programación exacta tras un reinicio.
+    """
     
     def __init__(self, bot):
         self.bot = bot
         self.service = AutomaticMessagesService()
         self.interval_trackers: Dict[str, datetime] = {}
         self.running = False
-        self.scheduler_thread = None
+        self._jobs: Dict[str, AutomaticMessage] = {}
+        self._versions: Dict[str, int] = {}
+        self._heap: List[Tuple[datetime, int, str, int]] = []
+        self._stale = 0
+        self._sequence = count()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._sending: Set[asyncio.Task] = set()
+        self._next_runs: Dict[str, datetime] = {}
+        self._resume: Dict[str, Tuple[Optional[datetime], Optional[datetime]]] = {}
+        self._dirty: Set[str] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        # Mensajes on_channel_create por categoría, para no consultar la base de datos en cada canal nuevo
+        self._category_messages: Dict[int, Dict[str, AutomaticMessage]] = {}
+        self._message_categories: Dict[str, int] = {}
+        self._category_index_ready = False
+
+        profile = {**DEFAULT_RUN_POLICY, **automatic_messages_profile}
+        self.missed_run_policy = str(profile["missed_run_policy"])
+        if self.missed_run_policy not in MISSED_RUN_POLICIES:
+            logger.warning("Política de ejecuciones perdidas no válida: %s", self.missed_run_policy)
+            self.missed_run_policy = DEFAULT_RUN_POLICY["missed_run_policy"]
+        self.catch_up_window = timedelta(seconds=float(profile["catch_up_window"]))
+        self.state_flush_interval = float(profile["state_flush_interval"])
+        # Limita las peticiones simultáneas a Discord; los 429 los reintenta discord.py
+        self._send_semaphore = asyncio.Semaphore(max(1, int(profile["max_concurrent_sends"])))
     
-    def start(self):
+    async def start(self):
         """Inicia el programador de mensajes"""
         if not self.running:
             self.running = True
 
-            self._setup_scheduled_jobs()
-            self._start_scheduler_thread()
+            await self._load_run_states()
+            await self._setup_scheduled_jobs()
+            self._task = asyncio.create_task(self._run())
+            self._flush_task = asyncio.create_task(self._flush_loop())
     
-    def stop(self):
-        """Detiene el programador de mensajes"""
+    async def stop(self):
+        """Detiene el programador de mensajes y guarda el estado pendiente"""
         if self.running:
             self.running = False
-            schedule.clear()
-            if self.scheduler_thread and self.scheduler_thread.is_alive():
-                self.scheduler_thread.join(timeout=5)
+            loops = [task for task in (self._task, self._flush_task) if task]
+            self._task = None
+            self._flush_task = None
+            for task in loops:
+                task.cancel()
+            await asyncio.gather(*loops, return_exceptions=True)
+
+            # Los envíos en curso actualizan el último envío; se les da un margen para terminar
+            if self._sending:
+                _, pending = await asyncio.wait(set(self._sending), timeout=STOP_SEND_TIMEOUT)
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+            # Último guardado del estado pendiente, antes de vaciar la programación
+            await self.flush_run_states()
+            self._jobs.clear()
+            self._next_runs.clear()
+            self._versions.clear()
+            self._heap.clear()
+            self._stale = 0
+            self._category_messages.clear()
+            self._message_categories.clear()
+            self._category_index_ready = False
             logger.info("Programador de mensajes automáticos detenido")
     
-    def _setup_scheduled_jobs(self):
-        """Configura todos los trabajos programados basados en la base de datos"""
-        # Limpiar trabajos anteriores
-        schedule.clear()
-        
+    async def _setup_scheduled_jobs(self):
+        """
+        Sincroniza los trabajos programados con la base de datos.
+        Los mensajes cuya programación no ha cambiado conservan su próxima ejecución.
+        """
         # Obtener todos los mensajes programados
-        messages, error = self.service.get_all()
+        messages, error = await self.service.get_all()
         logger.info("Cargando mensajes automáticos - Error: %s, Total mensajes: %s", 
                    error, len(messages) if messages else 0)
         
-        if error or not messages:
-            logger.warning("No se pudieron cargar mensajes automáticos: %s", error or "Sin mensajes")
+        if error:
+            logger.warning("No se pudieron cargar mensajes automáticos: %s", error)
             return
+
+        messages = messages or []
+        loaded_ids = {message.id for message in messages}
+        for message_id in [job_id for job_id in self._jobs if job_id not in loaded_ids]:
+            self.remove_message_schedule(message_id)
+        
+        self._category_messages.clear()
+        self._message_categories.clear()
+        self._category_index_ready = True
         
         for message in messages:
             try:
@@ -66,110 +173,133 @@ class AutomaticMessagesScheduler:
                 logger.error("Error programando mensaje %s: %s", message.id, str(e))
     
     def _schedule_message(self, message: AutomaticMessage):
-        """Programa un mensaje específico usando schedule"""
-        if message.schedule_type == "interval":
-            self._schedule_interval_message(message)
-        elif message.schedule_type == "daily":
-            self._schedule_daily_message(message)
-        elif message.schedule_type == "weekly":
-            self._schedule_weekly_message(message)
+        """Programa (o reprograma) la próxima ejecución de un mensaje"""
+        self._index_category_message(message)
+
+        current = self._jobs.get(message.id)
+        if current is not None and _schedule_signature(current) == _schedule_signature(message):
+            # Misma programación: se actualiza el contenido y se conserva la próxima ejecución
+            self._jobs[message.id] = message
+            return
+
+        self._unschedule(message.id)
+
         # on_channel_create no necesita programación, se maneja por eventos
-    
-    def _schedule_interval_message(self, message: AutomaticMessage):
-        """Programa un mensaje con intervalo"""
-        if not message.interval or not message.interval_unit:
-            logger.error("Mensaje %s sin datos de intervalo válidos", message.id)
+        if message.schedule_type not in SCHEDULED_TYPES:
             return
-        
-        def job_func():
-            if self.bot.loop and not self.bot.loop.is_closed():
-                asyncio.run_coroutine_threadsafe(
-                    self._send_message_safe(message), 
-                    self.bot.loop
-                )
-            else:
-                logger.error("Loop del bot no disponible para mensaje %s", message.id)
-        
-        if message.interval_unit == "seconds":
-            schedule.every(message.interval).seconds.do(job_func).tag(message.id)
-        elif message.interval_unit == "minutes":
-            schedule.every(message.interval).minutes.do(job_func).tag(message.id)
-        elif message.interval_unit == "hours":
-            schedule.every(message.interval).hours.do(job_func).tag(message.id)
-        
-        logger.debug("Programado mensaje intervalo %s cada %d %s", 
-                    message.id, message.interval, message.interval_unit)
-    
-    def _schedule_daily_message(self, message: AutomaticMessage):
-        """Programa un mensaje diario"""
-        if message.hour is None or message.minute is None:
-            logger.error("Mensaje %s sin hora válida", message.id)
+
+        now = datetime.now()
+        next_run = self._resume_run(message, now) or next_run_after(message, now)
+        if next_run is None:
+            logger.error("Mensaje %s sin datos de programación válidos", message.id)
             return
-        
-        time_str = f"{message.hour:02d}:{message.minute:02d}"
-        
-        # Función que se ejecutará en el scheduler
-        def job_func():
-            # Programar la corrutina en el loop del bot
-            if self.bot.loop and not self.bot.loop.is_closed():
-                asyncio.run_coroutine_threadsafe(
-                    self._send_message_safe(message), 
-                    self.bot.loop
-                )
-            else:
-                logger.error("Loop del bot no disponible para mensaje %s", message.id)
-        
-        schedule.every().day.at(time_str).do(job_func).tag(message.id)
-        logger.info("✅ Programado mensaje diario %s para las %s - Canal ID: %s", 
-                   message.id, time_str, message.channel_id)
-    
-    def _schedule_weekly_message(self, message: AutomaticMessage):
-        """Programa un mensaje semanal"""
-        if message.hour is None or message.minute is None or not message.weekdays:
-            logger.error("Mensaje %s sin datos semanales válidos", message.id)
+
+        self._jobs[message.id] = message
+        self._push(next_run, message.id)
+        logger.info("✅ Programado mensaje %s (%s) para %s - Canal ID: %s",
+                   message.id, message.schedule_type,
+                   next_run.strftime("%Y-%m-%d %H:%M:%S"), message.channel_id)
+
+    def _index_category_message(self, message: AutomaticMessage):
+        """Actualiza el índice de categorías con un mensaje nuevo o editado"""
+        self._unindex_category_message(message.id)
+        if message.schedule_type != "on_channel_create" or message.category_id is None:
             return
-        
+
+        self._category_messages.setdefault(message.category_id, {})[message.id] = message
+        self._message_categories[message.id] = message.category_id
         try:
-            weekdays = json.loads(message.weekdays)
-        except (json.JSONDecodeError, TypeError):
-            logger.error("Formato de días inválido para mensaje %s", message.id)
+            # Dejar preparado el envío para cuando se cree el canal
+            get_payload(message.text, message.embed, message.attachment_image_url)
+        except Exception as e:
+            logger.error("Error preparando mensaje de categoría %s: %s", message.id, str(e))
+
+    def _unindex_category_message(self, message_id: str):
+        category_id = self._message_categories.pop(message_id, None)
+        if category_id is None:
             return
-        
-        time_str = f"{message.hour:02d}:{message.minute:02d}"
-        
-        def job_func():
-            if self.bot.loop and not self.bot.loop.is_closed():
-                asyncio.run_coroutine_threadsafe(
-                    self._send_message_safe(message), 
-                    self.bot.loop
-                )
+        messages = self._category_messages.get(category_id)
+        if messages is not None:
+            messages.pop(message_id, None)
+            if not messages:
+                del self._category_messages[category_id]
+
+    def _resume_run(self, message: AutomaticMessage, now: datetime) -> Optional[datetime]:
+        """Próxima ejecución guardada antes del reinicio, aplicando la política de ejecuciones perdidas"""
+        last_sent_at, next_run_at = self._resume.pop(message.id, (None, None))
+        if next_run_at is None and last_sent_at is not None:
+            next_run_at = next_run_after(message, last_sent_at)
+        if next_run_at is None or next_run_at > now:
+            return next_run_at
+
+        # Se perdieron una o más ejecuciones: como mucho se recupera una, nunca una ráfaga
+        if self.missed_run_policy == "catch_up" and now - next_run_at <= self.catch_up_window:
+            logger.info("Recuperando ejecución perdida del mensaje %s (%s)",
+                       message.id, next_run_at.strftime("%Y-%m-%d %H:%M:%S"))
+            return now
+
+        logger.info("Saltando ejecuciones perdidas del mensaje %s", message.id)
+        return first_run_after(message, next_run_at, now)
+
+    def _push(self, run_at: datetime, message_id: str):
+        # El contador desempata ejecuciones a la misma hora sin comparar ids
+        version = self._versions.get(message_id, 0)
+        heapq.heappush(self._heap, (run_at, next(self._sequence), message_id, version))
+        self._next_runs[message_id] = run_at
+        self._dirty.add(message_id)
+        # Despertar al bucle por si la nueva ejecución es anterior a la que espera
+        self._wakeup.set()
+
+    def _is_current(self, message_id: str, version: int) -> bool:
+        return message_id in self._jobs and self._versions.get(message_id, 0) == version
+
+    def _compact(self):
+        """Elimina del montículo las entradas de versiones antiguas"""
+        self._heap = [entry for entry in self._heap if self._is_current(entry[2], entry[3])]
+        heapq.heapify(self._heap)
+        self._stale = 0
+
+    async def _run(self):
+        """Bucle principal: duerme hasta la próxima ejecución y lanza los envíos"""
+        while self.running:
+            self._wakeup.clear()
+
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            run_at, _, message_id, version = self._heap[0]
+            if not self._is_current(message_id, version):
+                heapq.heappop(self._heap)
+                self._stale = max(self._stale - 1, 0)
+                continue
+
+            now = datetime.now()
+            delay = (run_at - now).total_seconds()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=min(delay, MAX_SLEEP))
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._heap)
+            message = self._jobs[message_id]
+
+            # Si el bot estuvo bloqueado más de un periodo no se acumulan envíos:
+            # se salta a la siguiente ejecución posterior a ahora
+            next_run = next_run_after(message, run_at)
+            if next_run is not None and next_run <= now:
+                next_run = first_run_after(message, next_run, now)
+            if next_run is not None:
+                self._push(next_run, message_id)
             else:
-                logger.error("Loop del bot no disponible para mensaje %s", message.id)
-        
-        # Mapeo de días (0=lunes -> schedule usa nombres)
-        day_names = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-        
-        for weekday in weekdays:
-            if 0 <= weekday <= 6:
-                day_name = day_names[weekday]
-                getattr(schedule.every(), day_name).at(time_str).do(job_func).tag(message.id)
-                logger.info("✅ Programado mensaje semanal %s para %s a las %s", 
-                           message.id, day_name, time_str)
-    
-    def _start_scheduler_thread(self):
-        def run_scheduler():
-            while self.running:
-                # Ejecutar trabajos pendientes
-                jobs_run = schedule.run_pending()
-                if jobs_run:
-                    logger.info("⏰ Ejecutados %d trabajos a las %s", 
-                               len([j for j in schedule.jobs if j.should_run]), 
-                               datetime.now().strftime("%H:%M:%S"))
-                time.sleep(1)  # Verificar cada segundo
-            logger.info("🛑 Hilo del scheduler detenido")
-        
-        self.scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
-        self.scheduler_thread.start()
+                self._next_runs.pop(message_id, None)
+                self._dirty.add(message_id)
+
+            task = asyncio.create_task(self._send_message_safe(message))
+            self._sending.add(task)
+            task.add_done_callback(self._sending.discard)
     
     async def _send_message_safe(self, message: AutomaticMessage):
         try:
@@ -177,19 +307,77 @@ class AutomaticMessagesScheduler:
         except Exception as e:
             logger.error("Error enviando mensaje %s: %s", message.id, str(e))
     
-    def reload_schedules(self):
+    async def _load_run_states(self):
+        """Carga el estado guardado para retomar la programación tras un reinicio"""
+        states, error = await self.service.get_run_states()
+        if error:
+            logger.warning("No se pudo cargar el estado de los mensajes automáticos: %s", error)
+            return
+
+        self._resume = states or {}
+        for message_id, (last_sent_at, _) in self._resume.items():
+            if last_sent_at is not None:
+                self.interval_trackers[message_id] = last_sent_at
+
+    async def _flush_loop(self):
+        while self.running:
+            await asyncio.sleep(self.state_flush_interval)
+            await self.flush_run_states()
+
+    async def flush_run_states(self):
+        """Guarda en un solo lote el estado de los mensajes modificados desde el último guardado"""
+        if not self._dirty:
+            return
+
+        states = self._take_dirty_states()
+        success, error = await self.service.save_run_states(states)
+        if not success:
+            # Se reintenta en el siguiente guardado
+            self._dirty.update(message_id for message_id, _, _ in states)
+            logger.error("Error guardando el estado de %d mensajes automáticos: %s", len(states), error)
+
+    def _take_dirty_states(self) -> List[Tuple[str, Optional[datetime], Optional[datetime]]]:
+        dirty, self._dirty = self._dirty, set()
+        return [
+            (message_id, self.interval_trackers.get(message_id), self._next_runs.get(message_id))
+            for message_id in dirty
+        ]
+
+    def get_next_run(self, message_id: str) -> Optional[datetime]:
+        """Próxima ejecución programada de un mensaje, o None si no está programado"""
+        return self._next_runs.get(message_id)
+
+    def get_next_runs(self) -> Dict[str, datetime]:
+        """Próxima ejecución de todos los mensajes programados"""
+        return dict(self._next_runs)
+    
+    async def reload_schedules(self):
         """Recarga todos los trabajos programados desde la base de datos"""
         if self.running:
             logger.info("Recargando trabajos programados...")
-            self._setup_scheduled_jobs()
+            await self._setup_scheduled_jobs()
     
     def remove_message_schedule(self, message_id: str):
         """Elimina la programación de un mensaje específico"""
-        schedule.clear(message_id)
+        self._unindex_category_message(message_id)
+        self._unschedule(message_id)
+
+    def _unschedule(self, message_id: str):
+        if self._jobs.pop(message_id, None) is None:
+            return
+
+        self._next_runs.pop(message_id, None)
+        self._dirty.add(message_id)
+
+        # La entrada del montículo queda obsoleta y se descarta al llegar su turno
+        self._versions[message_id] = self._versions.get(message_id, 0) + 1
+        self._stale += 1
+        if self._stale > max(MIN_STALE_TO_COMPACT, len(self._jobs)):
+            self._compact()
         logger.debug("Eliminada programación para mensaje %s", message_id)
     
     def add_message_schedule(self, message: AutomaticMessage):
-        """Agrega la programación para un nuevo mensaje"""
+        """Agrega o actualiza la programación de un mensaje"""
         try:
             logger.info("Agregando programación para mensaje: ID=%s, Tipo=%s", 
                        message.id, message.schedule_type)
@@ -217,16 +405,14 @@ class AutomaticMessagesScheduler:
                 )
                 return
             
-            # Procesar el texto del mensaje (variables, menciones, etc.)
-            processed_text = process_message_text(message.text, channel, self.bot)
-            
-            # Usar el nuevo formatter para enviar mensajes con embeds e imágenes
-            from .message_formatter import send_formatted_message
-            sent_message = await send_formatted_message(channel, processed_text)
+            # La configuración y el embed se preparan una vez por versión del
+            # mensaje; en cada envío solo se procesan las variables y menciones
+            sent_message = await send_automatic_message(channel, message)
             
             if sent_message:
-                # Actualizar el tracker para evitar duplicados
+                # Registrar el envío; se guarda con el siguiente lote de estado
                 self.interval_trackers[message.id] = datetime.now()
+                self._dirty.add(message.id)
                 
                 logger.info(
                     "Mensaje automático enviado: %s en canal %s", 
@@ -242,47 +428,61 @@ class AutomaticMessagesScheduler:
             )
     
     async def send_category_message(self, category_id: int, new_channel):
-        """Envía mensajes automáticos cuando se crea un canal en una categoría"""
+        """Envía los mensajes automáticos de una categoría cuando se crea un canal en ella"""
         try:
-            messages, error = self.service.get_by_category_id(category_id)
-            
-            if error or not messages:
+            messages = await self._get_category_messages(category_id)
+            if not messages:
                 return
             
-            for message in messages:
-                if message.schedule_type == "on_channel_create":
-                    processed_text = process_message_text(message.text, new_channel, self.bot)
-                    
-                    # Usar el nuevo formatter para enviar mensajes con embeds e imágenes
-                    from .message_formatter import send_formatted_message
-                    sent_message = await send_formatted_message(new_channel, processed_text)
-                    
-                    if sent_message:
-                        logger.info(
-                            "Mensaje automático de categoría enviado: %s en canal %s", 
-                            message.display_name, new_channel.name
-                        )
-                    else:
-                        logger.error("No se pudo enviar mensaje de categoría %s", message.id)
+            # Los envíos se hacen a la vez, limitados por el semáforo compartido
+            # entre todos los canales que se estén creando
+            await asyncio.gather(*(
+                self._send_category_message(message, new_channel) for message in messages
+            ))
                     
         except Exception as e:
             logger.error(
                 "Error enviando mensajes de categoría %s: %s", 
                 category_id, str(e)
             )
+    
+    async def _get_category_messages(self, category_id: int) -> List[AutomaticMessage]:
+        if self._category_index_ready:
+            return list(self._category_messages.get(category_id, {}).values())
+        
+        # Sin índice (la carga inicial falló) se consulta la base de datos
+        messages, error = await self.service.get_by_category_id(category_id)
+        if error or not messages:
+            return []
+        return [message for message in messages if message.schedule_type == "on_channel_create"]
+    
+    async def _send_category_message(self, message: AutomaticMessage, new_channel):
+        try:
+            async with self._send_semaphore:
+                sent_message = await send_automatic_message(new_channel, message)
+            
+            if sent_message:
+                logger.info(
+                    "Mensaje automático de categoría enviado: %s en canal %s", 
+                    message.display_name, new_channel.name
+                )
+            else:
+                logger.error("No se pudo enviar mensaje de categoría %s", message.id)
+        except Exception as e:
+            logger.error("Error enviando mensaje de categoría %s: %s", message.id, str(e))
 
 
 # Instancia global del programador
 _scheduler = None
 
 
-def setup_automatic_messages(bot):
+async def setup_automatic_messages(bot):
     """Configura e inicia el sistema de mensajes automáticos"""
     global _scheduler
     
     if _scheduler is None:
         _scheduler = AutomaticMessagesScheduler(bot)
-        _scheduler.start()
+        await _scheduler.start()
 
 
 def get_scheduler():
@@ -290,17 +490,29 @@ def get_scheduler():
     return _scheduler
 
 
-def stop_automatic_messages():
+async def stop_automatic_messages():
     """Detiene el sistema de mensajes automáticos"""
     global _scheduler
     
     if _scheduler:
-        _scheduler.stop()
+        await _scheduler.stop()
         _scheduler = None
 
 
-def reload_all_schedules():
+async def reload_all_schedules():
     """Recarga todos los trabajos programados"""
     global _scheduler
     if _scheduler:
-        _scheduler.reload_schedules()
+        await _scheduler.reload_schedules()
+
+
+def schedule_message(message: AutomaticMessage):
+    """Programa un mensaje nuevo o editado sin recargar el resto"""
+    if _scheduler:
+        _scheduler.add_message_schedule(message)
+
+
+def unschedule_message(message_id: str):
+    """Quita la programación de un mensaje eliminado"""
+    if _scheduler:
+        _scheduler.remove_message_schedule(message_id)
@@ -1,19 +1,213 @@
 """
 Procesador de texto para mensajes automáticos
 Permite usar variables y formateo especial en los mensajes
+
+El texto se compila una sola vez en una lista de nodos (literales, variables,
+menciones y formateo) y cada envío solo la recorre. Las plantillas compiladas
+se guardan por texto, así que editar un mensaje genera una entrada nueva.
 """
 
 import re
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from discord import TextChannel
+from .mentions import mention_index
+
+# Tipos de nodo de una plantilla compilada
+LITERAL, VARIABLE, ROLE_MENTION, USER_MENTION, FORMAT = range(5)
+
+Node = Tuple[Any, ...]
+
+# Variables disponibles; se calculan solo si la plantilla las usa
+VARIABLES: Dict[str, Callable[["_ChannelContext"], str]] = {
+    'channel': lambda ctx: ctx.channel.name,
+    'channel_mention': lambda ctx: ctx.channel.mention,
+    'server': lambda ctx: ctx.guild.name if ctx.guild else 'Servidor Desconocido',
+    'date': lambda ctx: ctx.now.strftime('%d/%m/%Y'),
+    'time': lambda ctx: ctx.now.strftime('%H:%M'),
+    'datetime': lambda ctx: ctx.now.strftime('%d/%m/%Y %H:%M'),
+    'member_count': lambda ctx: str(ctx.guild.member_count) if ctx.guild else '0',
+    'channel_count': lambda ctx: str(len(ctx.guild.channels)) if ctx.guild else '0',
+}
+
+# {formato:texto} -> marcador + texto + marcador
+FORMAT_MARKERS = {
+    'bold': '**',
+    'italic': '*',
+    'code': '`',
+    'codeblock': '```',
+    'underline': '__',
+    'strikethrough': '~~',
+    'spoiler': '||',
+}
+
+_TOKEN_PATTERN = re.compile(
+    r'\{(?P<variable>' + '|'.join(VARIABLES) + r')\}'
+    r'|@(?P<mention>role|user)\{(?P<name>[^}]+)\}'
+    r'|\{(?P<format>' + '|'.join(FORMAT_MARKERS) + r'):'
+    r'|(?P<close>\})'
+    r'|(?P<newline>\\n)'
+)
+
+
+def _append_literal(nodes: List[Node], text: str) -> None:
+    if nodes and nodes[-1][0] == LITERAL:
+        nodes[-1] = (LITERAL, nodes[-1][1] + text)
+    else:
+        nodes.append((LITERAL, text))
+
+
+def _parse(text: str) -> Tuple[Node, ...]:
+    """Convierte el texto en nodos. El formateo puede contener variables, menciones y otro formateo."""
+    nodes: List[Node] = []
+    # Formatos abiertos: (nombre, texto de apertura, nodos del nivel superior)
+    stack: List[Tuple[str, str, List[Node]]] = []
+    position = 0
+
+    for match in _TOKEN_PATTERN.finditer(text):
+        if match.start() > position:
+            _append_literal(nodes, text[position:match.start()])
+        position = match.end()
+
+        if match['variable']:
+            nodes.append((VARIABLE, match['variable']))
+        elif match['mention']:
+            kind = ROLE_MENTION if match['mention'] == 'role' else USER_MENTION
+            nodes.append((kind, match['name'], match.group()))
+        elif match['newline']:
+            _append_literal(nodes, '\n')
+        elif match['format']:
+            stack.append((match['format'], match.group(), nodes))
+            nodes = []
+        elif stack and nodes:
+            name, _, parent = stack.pop()
+            parent.append((FORMAT, FORMAT_MARKERS[name], tuple(nodes)))
+            nodes = parent
+        elif stack:
+            # Formato vacío ({bold:}): se deja tal cual
+            _, opening, parent = stack.pop()
+            _append_literal(parent, opening + '}')
+            nodes = parent
+        else:
+            _append_literal(nodes, '}')
+
+    if position < len(text):
+        _append_literal(nodes, text[position:])
+
+    # Formatos sin cerrar: se conservan como texto
+    while stack:
+        _, opening, parent = stack.pop()
+        _append_literal(parent, opening)
+        for node in nodes:
+            if node[0] == LITERAL:
+                _append_literal(parent, node[1])
+            else:
+                parent.append(node)
+        nodes = parent
+
+    return tuple(nodes)
+
+
+class CompiledTemplate:
+    """Texto de un mensaje automático listo para renderizar"""
+
+    __slots__ = ('nodes',)
+
+    def __init__(self, nodes: Tuple[Node, ...]):
+        self.nodes = nodes
+
+    def render(self, context: Any) -> str:
+        parts: List[str] = []
+        _render_nodes(self.nodes, context, parts)
+        return ''.join(parts)
+
+
+def _render_nodes(nodes: Tuple[Node, ...], context: Any, parts: List[str]) -> None:
+    for node in nodes:
+        kind = node[0]
+        if kind == LITERAL:
+            parts.append(node[1])
+        elif kind == VARIABLE:
+            parts.append(context.variable(node[1]))
+        elif kind == ROLE_MENTION:
+            parts.append(context.role_mention(node[1], node[2]))
+        elif kind == USER_MENTION:
+            parts.append(context.user_mention(node[1], node[2]))
+        else:
+            parts.append(node[1])
+            _render_nodes(node[2], context, parts)
+            parts.append(node[1])
+
+
+@lru_cache(maxsize=512)
+def compile_template(text: str) -> CompiledTemplate:
+    """Compila el texto de un mensaje automático"""
+    return CompiledTemplate(_parse(text))
+
+
+class _ChannelContext:
+    """Valores de un envío concreto; cada variable se calcula como mucho una vez"""
+
+    def __init__(self, channel: TextChannel):
+        self.channel = channel
+        self.guild = channel.guild
+        self._now: Optional[datetime] = None
+        self._values: Dict[str, str] = {}
+
+    @property
+    def now(self) -> datetime:
+        if self._now is None:
+            self._now = datetime.now()
+        return self._now
+
+    def variable(self, name: str) -> str:
+        value = self._values.get(name)
+        if value is None:
+            value = VARIABLES[name](self)
+            self._values[name] = value
+        return value
+
+    def role_mention(self, role_name: str, raw: str) -> str:
+        if not self.guild:
+            return raw
+        # Buscar el rol por nombre (case insensitive)
+        role = mention_index.find_role(self.guild, role_name)
+        return role.mention if role else f"@{role_name}"
+
+    def user_mention(self, username: str, raw: str) -> str:
+        if not self.guild:
+            return raw
+        # Buscar el miembro por nombre o nickname
+        member = mention_index.find_member(self.guild, username)
+        return member.mention if member else f"@{username}"
+
+
+class _PreviewContext:
+    """Valores de ejemplo para la vista previa; las menciones se simplifican"""
+
+    def __init__(self, variables: Dict[str, str]):
+        self._variables = variables
+
+    def variable(self, name: str) -> str:
+        return self._variables[name]
+
+    def role_mention(self, role_name: str, raw: str) -> str:
+        return f"@{role_name}"
+
+    def user_mention(self, username: str, raw: str) -> str:
+        return f"@{username}"
+
+
+def render_template(template: CompiledTemplate, channel: TextChannel) -> str:
+    """Renderiza una plantilla ya compilada con los valores actuales del canal"""
+    return template.render(_ChannelContext(channel))
 
 
 def process_message_text(text: str, channel: TextChannel, bot: Any) -> str:
     """
     Procesa el texto del mensaje reemplazando variables especiales
-    MANTIENE la configuración avanzada (__ADVANCED_CONFIG__) intacta
-    
+
     Variables disponibles:
     - {channel} - Nombre del canal
     - {channel_mention} - Mención del canal
@@ -24,132 +218,17 @@ def process_message_text(text: str, channel: TextChannel, bot: Any) -> str:
     - {member_count} - Cantidad de miembros del servidor
     - {channel_count} - Cantidad de canales del servidor
     """
-    
+
     if not text:
         return text
-    
+
     try:
-        # Separar el texto principal de la configuración avanzada
-        main_text = text
-        advanced_config = ""
-        
-        if '__ADVANCED_CONFIG__:' in text:
-            parts = text.split('__ADVANCED_CONFIG__:', 1)
-            main_text = parts[0].strip()
-            advanced_config = f"__ADVANCED_CONFIG__:{parts[1]}"
-        
-        guild = channel.guild
-        now = datetime.now()
-        
-        # Diccionario de variables disponibles
-        variables = {
-            'channel': channel.name,
-            'channel_mention': channel.mention,
-            'server': guild.name if guild else 'Servidor Desconocido',
-            'date': now.strftime('%d/%m/%Y'),
-            'time': now.strftime('%H:%M'),
-            'datetime': now.strftime('%d/%m/%Y %H:%M'),
-            'member_count': str(guild.member_count) if guild else '0',
-            'channel_count': str(len(guild.channels)) if guild else '0',
-        }
-        
-        # Reemplazar variables en el texto PRINCIPAL solamente
-        processed_text = main_text
-        for var_name, var_value in variables.items():
-            pattern = f'{{{var_name}}}'
-            processed_text = processed_text.replace(pattern, var_value)
-        
-        # Procesar menciones especiales
-        processed_text = _process_mentions(processed_text, guild)
-        
-        # Procesar formateo especial
-        processed_text = _process_formatting(processed_text)
-        
-        # Recomponer el texto con la configuración avanzada si existe
-        if advanced_config:
-            return f"{processed_text}\n{advanced_config}"
-        else:
-            return processed_text
-        
+        return render_template(compile_template(text), channel)
     except Exception:
         # Si hay error en el procesamiento, devolver el texto original
         return text
 
 
-def _process_mentions(text: str, guild) -> str:
-    """Procesa menciones especiales en el texto"""
-    if not guild:
-        return text
-    
-    # Patrón para menciones de roles por nombre: @role{nombre_rol}
-    role_pattern = r'@role\{([^}]+)\}'
-    
-    def replace_role_mention(match):
-        role_name = match.group(1)
-        role = None
-        
-        # Buscar el rol por nombre (case insensitive)
-        for r in guild.roles:
-            if r.name.lower() == role_name.lower():
-                role = r
-                break
-        
-        return role.mention if role else f"@{role_name}"
-    
-    text = re.sub(role_pattern, replace_role_mention, text)
-    
-    # Patrón para menciones de usuarios por nombre: @user{nombre_usuario}
-    user_pattern = r'@user\{([^}]+)\}'
-    
-    def replace_user_mention(match):
-        username = match.group(1)
-        member = None
-        
-        # Buscar el miembro por nombre o nickname
-        for m in guild.members:
-            if (m.name.lower() == username.lower() or 
-                (m.nick and m.nick.lower() == username.lower())):
-                member = m
-                break
-        
-        return member.mention if member else f"@{username}"
-    
-    text = re.sub(user_pattern, replace_user_mention, text)
-    
-    return text
-
-
-def _process_formatting(text: str) -> str:
-    """Procesa formateo especial en el texto"""
-    
-    # Reemplazar saltos de línea explícitos
-    text = text.replace('\\n', '\n')
-    
-    # Procesar formateo de Discord
-    # {bold:texto} -> **texto**
-    text = re.sub(r'\{bold:([^}]+)\}', r'**\1**', text)
-    
-    # {italic:texto} -> *texto*
-    text = re.sub(r'\{italic:([^}]+)\}', r'*\1*', text)
-    
-    # {code:texto} -> `texto`
-    text = re.sub(r'\{code:([^}]+)\}', r'`\1`', text)
-    
-    # {codeblock:texto} -> ```texto```
-    text = re.sub(r'\{codeblock:([^}]+)\}', r'```\1```', text)
-    
-    # {underline:texto} -> __texto__
-    text = re.sub(r'\{underline:([^}]+)\}', r'__\1__', text)
-    
-    # {strikethrough:texto} -> ~~texto~~
-    text = re.sub(r'\{strikethrough:([^}]+)\}', r'~~\1~~', text)
-    
-    # {spoiler:texto} -> ||texto||
-    text = re.sub(r'\{spoiler:([^}]+)\}', r'||\1||', text)
-    
-    return text
-
-
 def get_available_variables() -> dict:
     """Retorna un diccionario con las variables disponibles y sus descripciones"""
     return {
@@ -179,7 +258,7 @@ def preview_processed_text(text: str, channel_name: str = "ejemplo", server_name
     Genera una vista previa del texto procesado para mostrar al usuario
     """
     now = datetime.now()
-    
+
     preview_variables = {
         'channel': channel_name,
         'channel_mention': f'#{channel_name}',
@@ -190,17 +269,5 @@ def preview_processed_text(text: str, channel_name: str = "ejemplo", server_name
         'member_count': '150',
         'channel_count': '25',
     }
-    
-    processed_text = text
-    for var_name, var_value in preview_variables.items():
-        pattern = f'{{{var_name}}}'
-        processed_text = processed_text.replace(pattern, var_value)
-    
-    # Procesar formateo
-    processed_text = _process_formatting(processed_text)
-    
-    # Simplificar menciones para preview
-    processed_text = re.sub(r'@role\{([^}]+)\}', r'@\1', processed_text)
-    processed_text = re.sub(r'@user\{([^}]+)\}', r'@\1', processed_text)
-    
-    return processed_text
+
+    return compile_template(text).render(_PreviewContext(preview_variables))
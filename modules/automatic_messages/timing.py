@@ -0,0 +1,159 @@
+"""
+Cálculo de la próxima ejecución de un mensaje automático
+"""
+
+import heapq
+import json
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice, takewhile
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+from modules.core import logger
+from .models import AutomaticMessage
+from .cron import cron_next_run
+
+INTERVAL_UNIT_SECONDS = {
+    "seconds": 1,
+    "minutes": 60,
+    "hours": 3600,
+}
+
+ALL_WEEKDAYS = frozenset(range(7))
+
+
+def interval_delta(message: AutomaticMessage) -> Optional[timedelta]:
+    """Duración del intervalo de un mensaje, o None si no es válido"""
+    seconds = INTERVAL_UNIT_SECONDS.get(message.interval_unit)
+    if not seconds or not message.interval or message.interval <= 0:
+        return None
+    return timedelta(seconds=message.interval * seconds)
+
+
+@lru_cache(maxsize=256)
+def _weekdays_from_json(weekdays_json: Optional[str]) -> Optional[FrozenSet[int]]:
+    try:
+        weekdays = json.loads(weekdays_json)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if not isinstance(weekdays, list):
+        return None
+    return frozenset(day for day in weekdays if isinstance(day, int) and 0 <= day <= 6)
+
+
+def parse_weekdays(message: AutomaticMessage) -> Optional[FrozenSet[int]]:
+    """Días de la semana (0=lunes) de un mensaje semanal, o None si no son válidos"""
+    # El JSON se decodifica una vez por valor distinto, no en cada cálculo
+    return _weekdays_from_json(message.weekdays)
+
+
+def _next_time_of_day(message: AutomaticMessage, after: datetime, weekdays: FrozenSet[int]) -> Optional[datetime]:
+    candidate = after.replace(hour=message.hour, minute=message.minute, second=0, microsecond=0)
+    # 8 días para cubrir el caso de un único día que es hoy pero a una hora ya pasada
+    for _ in range(8):
+        if candidate > after and candidate.weekday() in weekdays:
+            return candidate
+        candidate += timedelta(days=1)
+    return None
+
+
+def next_run_after(message: AutomaticMessage, after: datetime) -> Optional[datetime]:
+    """
+    Primera ejecución del mensaje estrictamente posterior a `after`.
+    Para los intervalos se cuenta desde `after`. Devuelve None si el mensaje
+    no se programa por tiempo o su configuración no es válida.
+    """
+    if message.schedule_type == "interval":
+        delta = interval_delta(message)
+        return after + delta if delta else None
+
+    if message.schedule_type == "custom":
+        next_run, error = cron_next_run(message.cron_expression, after)
+        if error:
+            logger.error("Expresión cron inválida para mensaje %s: %s", message.id, error)
+        return next_run
+
+    if message.schedule_type not in ("daily", "weekly"):
+        return None
+
+    if message.hour is None or message.minute is None:
+        return None
+
+    if message.schedule_type == "daily":
+        return _next_time_of_day(message, after, ALL_WEEKDAYS)
+
+    weekdays = parse_weekdays(message)
+    if not weekdays:
+        logger.error("Formato de días inválido para mensaje %s", message.id)
+        return None
+    return _next_time_of_day(message, after, weekdays)
+
+
+def first_run_after(message: AutomaticMessage, anchor: datetime, now: datetime) -> Optional[datetime]:
+    """
+    Primera ejecución posterior a `now` siguiendo la cadencia que empieza en `anchor`.
+    Se usa al saltarse ejecuciones perdidas: un intervalo conserva su fase en lugar
+    de empezar a contar desde `now`.
+    """
+    if anchor > now:
+        return anchor
+
+    delta = interval_delta(message) if message.schedule_type == "interval" else None
+    if delta is None:
+        return next_run_after(message, now)
+
+    missed = (now - anchor) // delta + 1
+    return anchor + missed * delta
+
+
+def iter_runs(message: AutomaticMessage, after: datetime, first: Optional[datetime] = None) -> Iterator[datetime]:
+    """Ejecuciones sucesivas del mensaje posteriores a `after`, empezando por `first` si se conoce"""
+    run = first if first is not None else next_run_after(message, after)
+    while run is not None:
+        yield run
+        run = next_run_after(message, run)
+
+
+def _tagged_runs(runs: Iterable[datetime], order: int, message: AutomaticMessage):
+    for run in runs:
+        yield run, order, message
+
+
+def build_timeline(
+    messages: Iterable[AutomaticMessage],
+    start: datetime,
+    end: datetime,
+    interval_anchors: Optional[Dict[str, datetime]] = None,
+    max_per_message: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> List[Tuple[AutomaticMessage, datetime]]:
+    """
+    Ejecuciones de todos los mensajes entre `start` y `end`, ordenadas por fecha.
+
+    Los intervalos solo se pueden predecir si se conoce una ejecución de referencia
+    (`interval_anchors`, normalmente la próxima ejecución del programador); sin ella
+    se omiten. Cada mensaje genera sus ejecuciones de forma perezosa y se mezclan con
+    un montículo, así que `max_per_message` y `limit` cortan el cálculo en cuanto se alcanzan.
+    """
+    interval_anchors = interval_anchors or {}
+    streams = []
+
+    for order, message in enumerate(messages):
+        first = None
+        if message.schedule_type == "interval":
+            anchor = interval_anchors.get(message.id)
+            if anchor is None:
+                continue
+            first = first_run_after(message, anchor, start)
+        elif message.schedule_type not in ("daily", "weekly", "custom"):
+            continue
+
+        runs = takewhile(lambda run: run <= end, iter_runs(message, start, first))
+        if max_per_message is not None:
+            runs = islice(runs, max_per_message)
+        streams.append(_tagged_runs(runs, order, message))
+
+    # El orden de entrada desempata ejecuciones simultáneas sin comparar mensajes
+    merged = heapq.merge(*streams)
+    if limit is not None:
+        merged = islice(merged, limit)
+    return [(message, run) for run, _, message in merged]
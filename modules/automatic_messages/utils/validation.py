@@ -1,31 +1,15 @@
 import json
-import re
+from datetime import datetime
 from .. import constants
+from ..cron import CronError, parse_cron
 
 
 def validate_cron_expression(cron_expr: str) -> bool:
-    """Valida una expresión cron básica (formato: min hour day month weekday)"""
-    if not cron_expr or not isinstance(cron_expr, str):
-        return False
-    
-    parts = cron_expr.strip().split()
-    if len(parts) != 5:
+    """Valida una expresión cron (formato: min hour day month weekday) y que tenga alguna ejecución"""
+    try:
+        return parse_cron(cron_expr).next_after(datetime.now()) is not None
+    except CronError:
         return False
-    
-    # Patrones básicos para validación
-    patterns = [
-        r'^(\*|([0-5]?[0-9])(,([0-5]?[0-9]))*|\*/([0-5]?[0-9])|([0-5]?[0-9])-([0-5]?[0-9]))$',  # minutos
-        r'^(\*|([01]?[0-9]|2[0-3])(,([01]?[0-9]|2[0-3]))*|\*/([01]?[0-9]|2[0-3])|([01]?[0-9]|2[0-3])-([01]?[0-9]|2[0-3]))$',  # horas
-        r'^(\*|([1-9]|[12][0-9]|3[01])(,([1-9]|[12][0-9]|3[01]))*|\*/([1-9]|[12][0-9]|3[01])|([1-9]|[12][0-9]|3[01])-([1-9]|[12][0-9]|3[01]))$',  # día del mes
-        r'^(\*|([1-9]|1[0-2])(,([1-9]|1[0-2]))*|\*/([1-9]|1[0-2])|([1-9]|1[0-2])-([1-9]|1[0-2]))$',  # mes
-        r'^(\*|[0-6](,[0-6])*|\*/[0-6]|[0-6]-[0-6])$'  # día de la semana
-    ]
-    
-    for i, part in enumerate(parts):
-        if not re.match(patterns[i], part):
-            return False
-    
-    return True
 
 
 def validate_weekdays_json(weekdays_str: str) -> bool:
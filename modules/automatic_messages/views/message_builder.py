@@ -1,15 +1,14 @@
 from typing import Optional
 from uuid import uuid4
 import discord
-import json
 import asyncio
 from discord import Interaction
 from discord.ui import View, Modal, TextInput
-from modules.automatic_messages.models import AutomaticMessage
+from modules.automatic_messages.models import AutomaticMessage, EmbedConfig
 from modules.automatic_messages.services import AutomaticMessagesService
 from modules.automatic_messages.utils import send_error_message
 from modules.automatic_messages import constants
-from modules.automatic_messages.tasks import reload_all_schedules
+from modules.automatic_messages.tasks import schedule_message
 
 
 class MessageBuilderView(View):
@@ -226,23 +225,14 @@ class MessageBuilderView(View):
             # Generar ID único
             message_id = str(uuid4())
             
-            # Preparar el texto con configuración avanzada si existe
-            final_text = self.message_data.get('text', '')
-            if self.message_data.get('embed_config') or self.message_data.get('attachment_image_url'):
-                advanced_config = {}
-                if self.message_data.get('embed_config'):
-                    advanced_config['embed'] = self.message_data['embed_config']
-                if self.message_data.get('attachment_image_url'):
-                    advanced_config['attachment_image_url'] = self.message_data['attachment_image_url']
-                
-                final_text = f"{final_text}\n__ADVANCED_CONFIG__:{json.dumps(advanced_config)}"
-            
             # Crear el mensaje automático
             new_message = AutomaticMessage(
                 id=message_id,
                 channel_id=self.message_data.get('channel_id'),
                 category_id=self.message_data.get('category_id'),
-                text=final_text,
+                text=self.message_data.get('text', ''),
+                embed=EmbedConfig.from_dict(self.message_data.get('embed_config')),
+                attachment_image_url=self.message_data.get('attachment_image_url'),
                 name=self.message_data.get('name') or f"Mensaje {message_id[:8]}",
                 interval=None,
                 interval_unit=None,
@@ -255,7 +245,7 @@ class MessageBuilderView(View):
             
             # Guardar en la base de datos
             service = AutomaticMessagesService()
-            success, error = service.add(new_message)
+            success, error = await service.add(new_message)
             
             if error or not success:
                 await interaction.followup.send(
@@ -268,8 +258,8 @@ class MessageBuilderView(View):
                 )
                 return
             
-            # Recargar el scheduler
-            reload_all_schedules()
+            # Programar solo este mensaje
+            schedule_message(new_message)
             
             # Mostrar confirmación
             embed = discord.Embed(
@@ -298,23 +288,14 @@ class MessageBuilderView(View):
             # Generar ID único
             message_id = str(uuid4())
             
-            # Preparar el texto con configuración avanzada si existe
-            final_text = self.message_data.get('text', '')
-            if self.message_data.get('embed_config') or self.message_data.get('attachment_image_url'):
-                advanced_config = {}
-                if self.message_data.get('embed_config'):
-                    advanced_config['embed'] = self.message_data['embed_config']
-                if self.message_data.get('attachment_image_url'):
-                    advanced_config['attachment_image_url'] = self.message_data['attachment_image_url']
-                
-                final_text = f"{final_text}\n__ADVANCED_CONFIG__:{json.dumps(advanced_config)}"
-            
             # Crear el mensaje automático
             new_message = AutomaticMessage(
                 id=message_id,
                 channel_id=self.message_data.get('channel_id'),
                 category_id=self.message_data.get('category_id'),
-                text=final_text,
+                text=self.message_data.get('text', ''),
+                embed=EmbedConfig.from_dict(self.message_data.get('embed_config')),
+                attachment_image_url=self.message_data.get('attachment_image_url'),
                 name=self.message_data.get('name') or f"Mensaje {message_id[:8]}",
                 interval=None,
                 interval_unit=None,
@@ -327,14 +308,14 @@ class MessageBuilderView(View):
             
             # Guardar en la base de datos
             service = AutomaticMessagesService()
-            success, error = service.add(new_message)
+            success, error = await service.add(new_message)
             
             if error or not success:
                 await send_error_message(interaction, constants.ERROR_CREATING_MESSAGE)
                 return
             
-            # Recargar el scheduler
-            reload_all_schedules()
+            # Programar solo este mensaje
+            schedule_message(new_message)
             
             # Mostrar confirmación
             embed = discord.Embed(
@@ -1,14 +1,13 @@
 from typing import Optional
 from uuid import uuid4
 import discord
-import json
 from discord import Interaction
 from discord.ui import View, Modal, TextInput
-from modules.automatic_messages.models import AutomaticMessage
+from modules.automatic_messages.models import AutomaticMessage, EmbedConfig
 from modules.automatic_messages.services import AutomaticMessagesService
 from modules.automatic_messages.utils import send_error_message, validate_message_content
 from modules.automatic_messages import constants
-from modules.automatic_messages.tasks import reload_all_schedules
+from modules.automatic_messages.tasks import schedule_message
 
 
 class ProgramMessageTextModal(Modal):
@@ -152,21 +151,13 @@ class MessageConfigOptionsView(View):
             
             message_id = str(uuid4())
             
-            final_text = message_data['text']
-            if message_data.get('embed_config') or message_data.get('attachment_image_url'):
-                advanced_config = {}
-                if message_data.get('embed_config'):
-                    advanced_config['embed'] = message_data['embed_config']
-                if message_data.get('attachment_image_url'):
-                    advanced_config['attachment_image_url'] = message_data['attachment_image_url']
-                
-                final_text = f"{final_text}\n__ADVANCED_CONFIG__:{json.dumps(advanced_config)}"
-            
             new_message = AutomaticMessage(
                 id=message_id,
                 channel_id=message_data.get('channel_id'),
                 category_id=message_data.get('category_id'),
-                text=final_text,
+                text=message_data['text'],
+                embed=EmbedConfig.from_dict(message_data.get('embed_config')),
+                attachment_image_url=message_data.get('attachment_image_url'),
                 name=message_data.get('name') or f"Mensaje {message_id[:8]}",
                 interval=None,
                 interval_unit=None,
@@ -178,13 +169,13 @@ class MessageConfigOptionsView(View):
             )
             
             service = AutomaticMessagesService()
-            success, error = service.add(new_message)
+            success, error = await service.add(new_message)
             
             if error or not success:
                 await send_error_message(interaction, constants.ERROR_CREATING_MESSAGE)
                 return
             
-            reload_all_schedules()
+            schedule_message(new_message)
             
             embed = discord.Embed(
                 title=f"{constants.EMOJI_SUCCESS} {constants.SUCCESS_MESSAGE_CREATED}",
@@ -6,7 +6,7 @@ from ..models import AutomaticMessage
 from ..services import AutomaticMessagesService
 from ..utils import format_message_for_embed, send_error_message
 from .. import constants
-from ..tasks import reload_all_schedules
+from ..tasks import unschedule_message
 
 
 class MessageSelectView(View):
@@ -71,7 +71,7 @@ class MessageSelect(Select):
     
     async def callback(self, interaction: Interaction):
         message_id = self.values[0]
-        message, error = self.service.get_by_id(message_id)
+        message, error = await self.service.get_by_id(message_id)
         
         if error or not message:
             await send_error_message(
@@ -109,14 +109,14 @@ class ConfirmDeleteView(View):
         emoji="✅"
     )
     async def confirm_delete(self, interaction: Interaction, button: Button):
-        success, error = self.service.delete(self.message.id)
+        success, error = await self.service.delete(self.message.id)
         
         if error or not success:
             await send_error_message(interaction, constants.ERROR_DELETING_MESSAGE)
             return
         
-        # IMPORTANTE: Recargar el scheduler después de eliminar el mensaje
-        reload_all_schedules()
+        # IMPORTANTE: Quitar la programación del mensaje eliminado
+        unschedule_message(self.message.id)
         
         embed = discord.Embed(
             title=constants.SUCCESS_MESSAGE_DELETED,
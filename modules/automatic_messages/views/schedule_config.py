@@ -2,11 +2,11 @@ from uuid import uuid4
 import discord
 from discord import Interaction, SelectOption
 from discord.ui import View, Modal, TextInput
-from ..models import AutomaticMessage
+from ..models import AutomaticMessage, EmbedConfig
 from ..services import AutomaticMessagesService
 from ..utils import send_error_message, validate_message_content
 from .. import constants
-from ..tasks import reload_all_schedules
+from ..tasks import schedule_message
 
 
 class ProgramMessageModal(Modal):
@@ -191,6 +191,8 @@ class ScheduleConfigView(View):
                 channel_id=self.message_data.get('channel_id'),
                 category_id=self.message_data.get('category_id'),
                 text=self.message_data['text'],
+                embed=EmbedConfig.from_dict(self.message_data.get('embed_config')),
+                attachment_image_url=self.message_data.get('attachment_image_url'),
                 name=self.message_data.get('name'),
                 interval=None,
                 interval_unit=None,
@@ -203,14 +205,14 @@ class ScheduleConfigView(View):
             
             # Guardar en la base de datos
             service = AutomaticMessagesService()
-            success, error = service.add(new_message)
+            success, error = await service.add(new_message)
             
             if error or not success:
                 await send_error_message(interaction, constants.ERROR_CREATING_MESSAGE)
                 return
             
-            # IMPORTANTE: Recargar el scheduler después de crear el mensaje
-            reload_all_schedules()
+            # IMPORTANTE: Programar el mensaje recién creado
+            schedule_message(new_message)
             
             # Mostrar confirmación
             embed = discord.Embed(
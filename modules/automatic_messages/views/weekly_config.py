@@ -3,11 +3,11 @@ import discord
 import json
 from discord import Interaction, SelectOption
 from discord.ui import View, Select, Modal, TextInput
-from ..models import AutomaticMessage
+from ..models import AutomaticMessage, EmbedConfig
 from ..services import AutomaticMessagesService
 from ..utils import send_error_message, validate_message_content
 from .. import constants
-from ..tasks import reload_all_schedules
+from ..tasks import schedule_message
 
 
 class WeekdaySelectionView(View):
@@ -52,23 +52,14 @@ class WeekdaySelectionView(View):
                 await send_error_message(interaction, error_msg)
                 return
             
-            # Preparar el texto con configuración avanzada si existe
-            final_text = self.message_data['text']
-            if self.message_data.get('embed_config') or self.message_data.get('attachment_image_url'):
-                advanced_config = {}
-                if self.message_data.get('embed_config'):
-                    advanced_config['embed'] = self.message_data['embed_config']
-                if self.message_data.get('attachment_image_url'):
-                    advanced_config['attachment_image_url'] = self.message_data['attachment_image_url']
-                
-                final_text = f"{final_text}\n__ADVANCED_CONFIG__:{json.dumps(advanced_config)}"
-            
             # Crear el objeto del mensaje
             new_message = AutomaticMessage(
                 id=str(uuid4()),
                 channel_id=self.message_data.get('channel_id'),
                 category_id=self.message_data.get('category_id'),
-                text=final_text,
+                text=self.message_data['text'],
+                embed=EmbedConfig.from_dict(self.message_data.get('embed_config')),
+                attachment_image_url=self.message_data.get('attachment_image_url'),
                 name=self.message_data.get('name'),
                 interval=None,
                 interval_unit=None,
@@ -81,14 +72,14 @@ class WeekdaySelectionView(View):
             
             # Guardar en la base de datos
             service = AutomaticMessagesService()
-            success, error = service.add(new_message)
+            success, error = await service.add(new_message)
             
             if error or not success:
                 await send_error_message(interaction, constants.ERROR_CREATING_MESSAGE)
                 return
             
-            # IMPORTANTE: Recargar el scheduler después de crear el mensaje
-            reload_all_schedules()
+            # IMPORTANTE: Programar el mensaje recién creado
+            schedule_message(new_message)
             
             # Mostrar confirmación final
             weekday_names = [constants.WEEKDAY_TRANSLATIONS[day] for day in sorted(self.selected_weekdays)]
@@ -0,0 +1,48 @@
+"""Registro en memoria de los formatos de canal con sus regex compiladas."""
+
+from re import compile as regex_compile, error as re_error, Pattern
+from typing import Dict, List, Optional
+from modules.core import logger
+from .models import ChannelFormat
+
+
+class ChannelFormatRegistry:
+    """
+    Formato activo de cada canal (el primero que devuelve la base de datos,
+    igual que get_one_by_channel_id). Se carga entero de una vez, así que
+    cualquier canal que no esté en el registro no tiene formato y su
+    comprobación se reduce a una búsqueda en un diccionario. Los canales con
+    una regex inválida se registran con None para no recompilarla.
+    """
+
+    def __init__(self):
+        self._patterns: Dict[int, Optional[Pattern[str]]] = {}
+        self._loaded = False
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def build(self, channel_formats: List[ChannelFormat]) -> None:
+        patterns: Dict[int, Optional[Pattern[str]]] = {}
+        for channel_format in channel_formats:
+            if channel_format.channel_id in patterns:
+                continue
+            try:
+                patterns[channel_format.channel_id] = regex_compile(channel_format.regex)
+            except re_error as e:
+                logger.error("Error en la expresión regular del formato %s: %s", channel_format.id, e)
+                patterns[channel_format.channel_id] = None
+
+        self._patterns = patterns
+        self._loaded = True
+        logger.debug("Registro de formatos de canal recargado (%d canales)", len(patterns))
+
+    def invalidate(self) -> None:
+        self._loaded = False
+
+    def get_pattern(self, channel_id: int) -> Optional[Pattern[str]]:
+        return self._patterns.get(channel_id)
+
+
+channel_format_registry = ChannelFormatRegistry()
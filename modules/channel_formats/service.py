@@ -2,15 +2,28 @@ from typing import List, Optional
 from database import Database
 from modules.core import logger
 from .models import ChannelFormat
+from .registry import channel_format_registry
 
 
 class ChannelFormatsService:
+    FORMAT_SELECT_BY_ID_SQL = "SELECT * FROM channel_formats WHERE id = ?"
+    FORMAT_SELECT_BY_CHANNEL_SQL = "SELECT * FROM channel_formats WHERE channel_id = ?"
+
     def __init__(self):
         self.db = Database()
 
-    def get_all(self) -> tuple[Optional[List[ChannelFormat]], Optional[str]]:
+    async def refresh_registry(self) -> Optional[str]:
+        """Recarga el registro en memoria que usa on_message"""
+        channel_formats, error = await self.get_all()
+        if error:
+            channel_format_registry.invalidate()
+            return error
+        channel_format_registry.build(channel_formats or [])
+        return None
+
+    async def get_all(self) -> tuple[Optional[List[ChannelFormat]], Optional[str]]:
         try:
-            rows = self.db.select("SELECT * FROM channel_formats")
+            rows = await self.db.select_async("SELECT * FROM channel_formats")
             channel_formats = [ChannelFormat(**row) for row in rows]
             return channel_formats, None
         except Exception as e:
@@ -18,9 +31,9 @@ class ChannelFormatsService:
             logger.error("Error al obtener los formatos de canal: %s", error)
             return None, error
 
-    def get_by_id(self, format_id: str) -> tuple[Optional[ChannelFormat], Optional[str]]:
+    async def get_by_id(self, format_id: str) -> tuple[Optional[ChannelFormat], Optional[str]]:
         try:
-            row = self.db.single("SELECT * FROM channel_formats WHERE id = ?", (format_id,))
+            row = await self.db.single_async(ChannelFormatsService.FORMAT_SELECT_BY_ID_SQL, (format_id,))
             if not row:
                 return None, None
             channel_format = ChannelFormat(**row)
@@ -30,11 +43,11 @@ class ChannelFormatsService:
             logger.error("Error al obtener el formato de canal: %s", error)
             return None, error
 
-    def get_one_by_channel_id(
+    async def get_one_by_channel_id(
         self, channel_id: int,
     ) -> tuple[Optional[ChannelFormat], Optional[str]]:
         try:
-            row = self.db.single("SELECT * FROM channel_formats WHERE channel_id = ?", (channel_id,))
+            row = await self.db.single_async(ChannelFormatsService.FORMAT_SELECT_BY_CHANNEL_SQL, (channel_id,))
             if not row:
                 return None, None
             channel_format = ChannelFormat(**row)
@@ -44,11 +57,11 @@ class ChannelFormatsService:
             logger.error("Error al obtener el formato de canal: %s", error)
             return None, error
 
-    def get_all_by_channel_id(
+    async def get_all_by_channel_id(
         self, channel_id: int,
     ) -> tuple[Optional[List[ChannelFormat]], Optional[str]]:
         try:
-            rows = self.db.select("SELECT * FROM channel_formats WHERE channel_id = ?", (channel_id,))
+            rows = await self.db.select_async(ChannelFormatsService.FORMAT_SELECT_BY_CHANNEL_SQL, (channel_id,))
             channel_formats = [ChannelFormat(**row) for row in rows]
             return channel_formats, None
         except Exception as e:
@@ -56,7 +69,7 @@ class ChannelFormatsService:
             logger.error("Error al obtener los formatos de canal: %s", error)
             return None, error
 
-    def add(
+    async def add(
         self, channel_format: ChannelFormat,
     ) -> tuple[Optional[ChannelFormat], Optional[str]]:
         try:
@@ -66,23 +79,25 @@ class ChannelFormatsService:
                 channel_format.channel_id,
                 channel_format.regex,
             )
-            self.db.execute(sql, params)
+            await self.db.execute_async(sql, params)
+            await self.refresh_registry()
             return channel_format, None
         except Exception as e:
             error = str(e)
             logger.error("Error al crear el formato de canal: %s", error)
             return None, error
 
-    def delete(self, channel_format: ChannelFormat) -> tuple[Optional[str], Optional[str]]:
+    async def delete(self, channel_format: ChannelFormat) -> tuple[Optional[str], Optional[str]]:
         try:
-            self.db.execute("DELETE FROM channel_formats WHERE id = ?", (str(channel_format.id),))
+            await self.db.execute_async("DELETE FROM channel_formats WHERE id = ?", (str(channel_format.id),))
+            await self.refresh_registry()
             return channel_format.id, None
         except Exception as e:
             error = str(e)
             logger.error("Error al eliminar el formato de canal: %s", error)
             return None, error
 
-    def update(self, channel_format: ChannelFormat) -> Optional[str]:
+    async def update(self, channel_format: ChannelFormat) -> Optional[str]:
         try:
             sql = """INSERT OR REPLACE INTO channel_formats (id, channel_id, regex) 
                      VALUES (?, ?, ?)"""
@@ -91,7 +106,8 @@ class ChannelFormatsService:
                 channel_format.channel_id,
                 channel_format.regex,
             )
-            self.db.execute(sql, params)
+            await self.db.execute_async(sql, params)
+            await self.refresh_registry()
             return None
         except Exception as e:
             error = str(e)
@@ -38,7 +38,7 @@ class ChannelFormatsCommands(commands.GroupCog, name="formato_canales"):
             return
 
         new_channel_format = ChannelFormat(id=str(uuid4()), channel_id=canal.id, regex=formato)
-        _, error = self.service.add(new_channel_format)
+        _, error = await self.service.add(new_channel_format)
         if error:
             await interaction.response.send_message(content=error, ephemeral=True)
             return
@@ -66,7 +66,7 @@ class ChannelFormatsCommands(commands.GroupCog, name="formato_canales"):
     ):
         channel_formats = []
         if id_formato:
-            channel_format, error = self.service.get_by_id(id_formato)
+            channel_format, error = await self.service.get_by_id(id_formato)
             if error:
                 await interaction.response.send_message(content=error, ephemeral=True)
                 return
@@ -78,12 +78,12 @@ class ChannelFormatsCommands(commands.GroupCog, name="formato_canales"):
                 return
             channel_formats.append(channel_format)
         elif canal:
-            channel_formats, error = self.service.get_all_by_channel_id(canal.id)
+            channel_formats, error = await self.service.get_all_by_channel_id(canal.id)
             if error:
                 await interaction.response.send_message(content=error, ephemeral=True)
                 return
         else:
-            channel_formats, error = self.service.get_all()
+            channel_formats, error = await self.service.get_all()
             if error:
                 await interaction.response.send_message(content=error, ephemeral=True)
                 return
@@ -120,7 +120,7 @@ class ChannelFormatsCommands(commands.GroupCog, name="formato_canales"):
             return
         
         # Lógica original para cuando se proporciona ID
-        channel_format, error = self.service.get_by_id(id_formato)
+        channel_format, error = await self.service.get_by_id(id_formato)
         if error:
             await interaction.response.send_message(content=error, ephemeral=True)
             return
@@ -132,7 +132,7 @@ class ChannelFormatsCommands(commands.GroupCog, name="formato_canales"):
             )
             return
 
-        _, error = self.service.delete(channel_format)
+        _, error = await self.service.delete(channel_format)
         if error:
             await interaction.response.send_message(content=error, ephemeral=True)
             return
@@ -163,7 +163,7 @@ class ChannelFormatsCommands(commands.GroupCog, name="formato_canales"):
             return
         
         # Lógica original para cuando se proporciona ID
-        result = edit_channel_format_by_id(id_formato, canal, formato)
+        result = await edit_channel_format_by_id(id_formato, canal, formato)
         
         if result['success']:
             await interaction.response.send_message(constants.SUCCESS_FORMAT_EDITED, ephemeral=True)
@@ -4,26 +4,20 @@ from discord import Message, TextChannel, Interaction, Embed, Color
 from modules.core import logger
 from .service import ChannelFormatsService
 from .models import ChannelFormat
+from .registry import channel_format_registry
 from .views import ChannelFormatSelectView, create_channel_format_selection_embed
 from . import constants
 
 
 async def check_channel_format(message: Message):
-    service = ChannelFormatsService()
-    channel_format, error = service.get_one_by_channel_id(message.channel.id)
-    if error:
-        logger.error(f"Error al obtener el formato de canal: {error}")
-        return
-    if channel_format is None:
-        return
-
-    try:
-        regex = regex_compile(channel_format.regex)
-        is_valid_format = regex.search(message.content)
-        if is_valid_format:
+    if not channel_format_registry.loaded:
+        error = await ChannelFormatsService().refresh_registry()
+        if error:
+            logger.error(f"Error al obtener el formato de canal: {error}")
             return
-    except re_error as e:
-        logger.error("Error en la expresión regular: %s", e)
+
+    regex = channel_format_registry.get_pattern(message.channel.id)
+    if regex is None or regex.search(message.content):
         return
 
     if not isinstance(message.channel, TextChannel):
@@ -45,7 +39,7 @@ async def check_channel_format(message: Message):
 async def show_channel_format_selection_for_delete(interaction: Interaction):
     """Mostrar vista de selección para eliminar formato de canal"""
     service = ChannelFormatsService()
-    channel_formats, error = service.get_all()
+    channel_formats, error = await service.get_all()
     
     if error:
         await interaction.response.send_message(content=error, ephemeral=True)
@@ -68,7 +62,7 @@ async def show_channel_format_selection_for_delete(interaction: Interaction):
 async def delete_channel_format_callback(interaction: Interaction, channel_format: ChannelFormat):
     """Callback para eliminar formato de canal seleccionado"""
     service = ChannelFormatsService()
-    _, error = service.delete(channel_format)
+    _, error = await service.delete(channel_format)
     
     if error:
         await interaction.response.edit_message(content=error, embed=None, view=None)
@@ -87,7 +81,7 @@ async def delete_channel_format_callback(interaction: Interaction, channel_forma
 async def show_channel_format_selection_for_edit(interaction: Interaction, canal: Optional[TextChannel], formato: Optional[str]):
     """Mostrar vista de selección para editar formato de canal"""
     service = ChannelFormatsService()
-    channel_formats, error = service.get_all()
+    channel_formats, error = await service.get_all()
     
     if error:
         await interaction.response.send_message(content=error, ephemeral=True)
@@ -113,7 +107,7 @@ async def show_channel_format_selection_for_edit(interaction: Interaction, canal
 
 async def edit_channel_format_callback(interaction: Interaction, channel_format: ChannelFormat, canal: Optional[TextChannel], formato: Optional[str]):
     """Callback para editar formato de canal seleccionado"""
-    result = edit_channel_format_by_id(channel_format.id, canal, formato)
+    result = await edit_channel_format_by_id(channel_format.id, canal, formato)
     
     if result['success']:
         # Crear embed de confirmación
@@ -127,12 +121,12 @@ async def edit_channel_format_callback(interaction: Interaction, channel_format:
         await interaction.response.edit_message(content=result['error'], embed=None, view=None)
 
 
-def edit_channel_format_by_id(format_id: str, canal: Optional[TextChannel], formato: Optional[str]) -> dict:
+async def edit_channel_format_by_id(format_id: str, canal: Optional[TextChannel], formato: Optional[str]) -> dict:
     """Editar formato de canal por ID - función auxiliar reutilizable"""
-    return _edit_channel_format_internal(format_id, canal, formato)
+    return await _edit_channel_format_internal(format_id, canal, formato)
 
 
-def _edit_channel_format_internal(format_id: str, canal: Optional[TextChannel], formato: Optional[str]) -> dict:
+async def _edit_channel_format_internal(format_id: str, canal: Optional[TextChannel], formato: Optional[str]) -> dict:
     """Lógica interna para editar formato de canal"""
     service = ChannelFormatsService()
     
@@ -147,7 +141,7 @@ def _edit_channel_format_internal(format_id: str, canal: Optional[TextChannel],
             }
     
     # Obtener formato existente
-    channel_format, error = service.get_by_id(format_id)
+    channel_format, error = await service.get_by_id(format_id)
     if error:
         return {'success': False, 'error': error}
     
@@ -164,7 +158,7 @@ def _edit_channel_format_internal(format_id: str, canal: Optional[TextChannel],
         channel_format.regex = formato
     
     # Actualizar en base de datos
-    error = service.update(channel_format)
+    error = await service.update(channel_format)
     if error:
         return {'success': False, 'error': error}
     
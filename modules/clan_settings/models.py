@@ -1,6 +1,6 @@
 from datetime import datetime
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Optional, Tuple
 import json
 
 DEFAULT_CLAN_SETTINGS = {
@@ -25,7 +25,9 @@ class ClanSetting:
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+# Inmutable porque la misma instancia se comparte entre todos los lectores
+# (ver ClanSettingsService); para modificarla usar dataclasses.replace
+@dataclass(frozen=True)
 class ClanSettings:
     text_category_id: Optional[int]
     voice_category_id: Optional[int]
@@ -34,12 +36,15 @@ class ClanSettings:
 
     default_role_color: str
     leader_role_id: Optional[int]
-    additional_roles: List[int]
+    additional_roles: Tuple[int, ...]
 
     max_members: int
     allow_multiple_clans: bool
     allow_multiple_leaders: bool
 
+    def __post_init__(self):
+        object.__setattr__(self, 'additional_roles', tuple(self.additional_roles or ()))
+
     @classmethod
     def get_default(cls) -> 'ClanSettings':
         return cls(**DEFAULT_CLAN_SETTINGS)
@@ -52,7 +57,7 @@ class ClanSettings:
             'max_voice_channels': str(self.max_voice_channels),
             'default_role_color': self.default_role_color,
             'leader_role_id': str(self.leader_role_id or 0),
-            'additional_roles': json.dumps(self.additional_roles or []),
+            'additional_roles': json.dumps(list(self.additional_roles)),
             'max_members': str(self.max_members),
             'allow_multiple_clans': 'true' if self.allow_multiple_clans else 'false',
             'allow_multiple_leaders': 'true' if self.allow_multiple_leaders else 'false',
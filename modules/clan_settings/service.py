@@ -1,16 +1,80 @@
-from typing import Optional, Tuple
+import asyncio
+import inspect
+import time
+from typing import Awaitable, Callable, ClassVar, List, Optional, Tuple, Union
 from database import Database
 from modules.core import logger
 from .models import ClanSettings
 
+# Segundos durante los que se usa la configuración por defecto tras un error al cargarla
+LOAD_RETRY_DELAY = 30
+
+SettingsSubscriber = Callable[[ClanSettings], Union[None, Awaitable[None]]]
+
 
 class ClanSettingsService:
+    """
+    La configuración se lee de la base de datos una sola vez y se guarda como una
+    instantánea inmutable compartida por todas las instancias del servicio.
+    save_settings la sustituye por la nueva tras escribirla. Cada vez que cambia la
+    instantánea (al cargarla y al guardarla) se avisa a los suscriptores, que
+    pueden recalcular lo que derivan de ella.
+    """
+
+    _snapshot: ClassVar[Optional[ClanSettings]] = None
+    # Se crea en la primera carga, dentro del event loop del bot
+    _load_lock: ClassVar[Optional[asyncio.Lock]] = None
+    # Resultado de la última carga fallida y momento a partir del cual se reintenta
+    _fallback: ClassVar[Optional[Tuple[ClanSettings, Optional[str]]]] = None
+    _retry_at: ClassVar[float] = 0.0
+    _subscribers: ClassVar[List[SettingsSubscriber]] = []
+
     def __init__(self):
         self.db = Database()
 
+    @classmethod
+    def subscribe(cls, callback: SettingsSubscriber) -> None:
+        """Registra una función (normal o async) que recibe la configuración cada vez que cambia"""
+        if callback not in cls._subscribers:
+            cls._subscribers.append(callback)
+
+    @classmethod
+    def unsubscribe(cls, callback: SettingsSubscriber) -> None:
+        if callback in cls._subscribers:
+            cls._subscribers.remove(callback)
+
     async def get_settings(self) -> Tuple[ClanSettings, Optional[str]]:
+        snapshot = ClanSettingsService._snapshot
+        if snapshot is not None:
+            return snapshot, None
+        if self._fallback_active():
+            return ClanSettingsService._fallback
+
+        if ClanSettingsService._load_lock is None:
+            ClanSettingsService._load_lock = asyncio.Lock()
+        async with ClanSettingsService._load_lock:
+            if ClanSettingsService._snapshot is not None:
+                return ClanSettingsService._snapshot, None
+            if self._fallback_active():
+                return ClanSettingsService._fallback
+            return await self._load_settings()
+
+    @staticmethod
+    def _fallback_active() -> bool:
+        return (
+            ClanSettingsService._fallback is not None
+            and time.monotonic() < ClanSettingsService._retry_at
+        )
+
+    @staticmethod
+    def _load_failed(error: Optional[str]) -> Tuple[ClanSettings, Optional[str]]:
+        ClanSettingsService._fallback = (ClanSettings.get_default(), error)
+        ClanSettingsService._retry_at = time.monotonic() + LOAD_RETRY_DELAY
+        return ClanSettingsService._fallback
+
+    async def _load_settings(self) -> Tuple[ClanSettings, Optional[str]]:
         try:
-            rows = self.db.select("SELECT key, value FROM clan_settings")
+            rows = await self.db.select_async("SELECT key, value FROM clan_settings")
             if not rows:
                 default_settings = ClanSettings.get_default()
                 await self.save_settings(default_settings)
@@ -19,24 +83,40 @@ class ClanSettingsService:
             settings_dict = {row["key"]: row["value"] for row in rows}
             try:
                 settings = ClanSettings.from_dict(settings_dict)
-                return settings, None
             except Exception:
                 logger.error("Error al cargar la configuración de clanes")
-                return ClanSettings.get_default(), "Error al cargar la configuración de clanes"
+                return self._load_failed("Error al cargar la configuración de clanes")
+
+            await self._publish(settings)
+            return settings, None
         except Exception as e:
             error = str(e)
             logger.error("Error al obtener la configuración de clanes: %s", error)
-            return ClanSettings.get_default(), None
+            return self._load_failed(None)
 
     async def save_settings(self, settings: ClanSettings) -> Optional[str]:
         try:
             settings_dict = settings.to_dict()
-            for key, value in settings_dict.items():
-                # Usar INSERT OR REPLACE para simplificar la lógica
-                sql = "INSERT OR REPLACE INTO clan_settings (key, value) VALUES (?, ?)"
-                self.db.execute(sql, (key, value))
-            return None
+            # Usar INSERT OR REPLACE para simplificar la lógica; todas las claves en un único commit
+            sql = "INSERT OR REPLACE INTO clan_settings (key, value) VALUES (?, ?)"
+            await self.db.executemany_async(sql, settings_dict.items())
         except Exception as e:
             error = str(e)
             logger.error("Error al guardar configuración: %s", error)
             return error
+
+        await self._publish(settings)
+        return None
+
+    @classmethod
+    async def _publish(cls, settings: ClanSettings) -> None:
+        """Sustituye la instantánea y avisa a los suscriptores"""
+        cls._snapshot = settings
+        cls._fallback = None
+        for callback in list(cls._subscribers):
+            try:
+                result = callback(settings)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error("Error al notificar el cambio de configuración de clanes: %s", e)
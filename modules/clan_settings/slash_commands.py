@@ -1,3 +1,4 @@
+from dataclasses import replace
 from typing import Optional
 from discord import app_commands, Interaction, Role, CategoryChannel, Embed, Color, Object
 from discord.ext import commands
@@ -46,30 +47,32 @@ class ClanSettingsCommands(commands.GroupCog, name="clan_settings"):
         if not settings:
             return
 
+        changes = {}
         if categoria_testo:
-            settings.text_category_id = categoria_testo.id
+            changes["text_category_id"] = categoria_testo.id
         if categoria_voz:
-            settings.voice_category_id = categoria_voz.id
+            changes["voice_category_id"] = categoria_voz.id
         if max_miembros:
-            settings.max_members = max_miembros
+            changes["max_members"] = max_miembros
         if rol_lider:
-            settings.leader_role_id = rol_lider.id
+            changes["leader_role_id"] = rol_lider.id
         if color_roles:
             try:
-                settings.default_role_color = int(color_roles, 16)
+                changes["default_role_color"] = int(color_roles, 16)
             except ValueError:
                 await interaction.response.send_message(
                     constants.ERROR_INVALID_COLOR, ephemeral=True
                 )
                 return
         if varios_clanes is not None:
-            settings.allow_multiple_clans = varios_clanes
+            changes["allow_multiple_clans"] = varios_clanes
         if varios_lideres is not None:
-            settings.allow_multiple_leaders = varios_lideres
+            changes["allow_multiple_leaders"] = varios_lideres
         if max_texto:
-            settings.max_text_channels = max_texto
+            changes["max_text_channels"] = max_texto
         if max_voz:
-            settings.max_voice_channels = max_voz
+            changes["max_voice_channels"] = max_voz
+        settings = replace(settings, **changes)
 
         # Guardar cambios
         error = await self.service.save_settings(settings)
@@ -168,7 +171,7 @@ class ClanSettingsCommands(commands.GroupCog, name="clan_settings"):
             )
             return
 
-        settings.additional_roles.append(rol.id)
+        settings = replace(settings, additional_roles=settings.additional_roles + (rol.id,))
         error = await self.service.save_settings(settings)
         if error:
             await interaction.response.send_message(error, ephemeral=True)
@@ -197,7 +200,10 @@ class ClanSettingsCommands(commands.GroupCog, name="clan_settings"):
             )
             return
 
-        settings.additional_roles.remove(rol.id)
+        settings = replace(
+            settings,
+            additional_roles=tuple(role_id for role_id in settings.additional_roles if role_id != rol.id),
+        )
         error = await self.service.save_settings(settings)
         if error:
             await interaction.response.send_message(error, ephemeral=True)
@@ -225,7 +231,7 @@ class ClanSettingsCommands(commands.GroupCog, name="clan_settings"):
             )
             return
 
-        settings.additional_roles = []
+        settings = replace(settings, additional_roles=())
         error = await self.service.save_settings(settings)
         if error:
             await interaction.response.send_message(error, ephemeral=True)
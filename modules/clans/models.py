@@ -50,3 +50,14 @@ class Clan:
 class FullClan(Clan):
     members: list[ClanMember] = field(default_factory=list)
     channels: list[ClanChannel] = field(default_factory=list)
+
+
+@dataclass
+class ClanStats:
+    total_clans: int
+    total_members: int
+    total_leaders: int
+    total_channels: int
+    largest_clan_name: Optional[str] = None
+    largest_clan_members: int = 0
+    largest_clan_channels: int = 0
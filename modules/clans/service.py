@@ -5,12 +5,39 @@ from discord import TextChannel, VoiceChannel, Role, Guild
 from database import Database
 from modules.clan_settings.service import ClanSettingsService
 from modules.core import logger
-from .models import Clan, ClanMember, ClanChannel, ClanMemberRole, ChannelType, FullClan
+from .models import Clan, ClanMember, ClanChannel, ClanMemberRole, ChannelType, FullClan, ClanStats
 
 
 class ClanService:
     CLAN_NOT_FOUND_MSG = "El miembro no pertenece a ningún clan"
     CLAN_SELECT_BY_ID_SQL = "SELECT * FROM clans WHERE id = ?"
+    CLAN_SELECT_ACTIVE_BY_ID_SQL = "SELECT * FROM clans WHERE id = ? AND deleted = 0"
+    CLAN_SELECT_BY_ROLE_SQL = "SELECT * FROM clans WHERE role_id = ? AND deleted = 0"
+    CLAN_SELECT_BY_MEMBER_SQL = """--sql
+        SELECT c.*
+        FROM clans c
+        INNER JOIN clan_members m ON c.id = m.clan_id
+        WHERE
+            m.user_id = ?
+            AND c.deleted = 0
+    """
+    CLAN_SELECT_BY_CHANNEL_SQL = """--sql
+        SELECT c.* FROM clans c
+        INNER JOIN clan_channels cc ON c.id = cc.clan_id
+        WHERE cc.channel_id = ? AND c.deleted = 0
+    """
+    MEMBER_SELECT_BY_USER_SQL = "SELECT * FROM clan_members WHERE user_id = ?"
+    MEMBER_SELECT_BY_ROLE_SQL = "SELECT * FROM clan_members WHERE user_id = ? AND role = ?"
+    MEMBER_SELECT_SQL = "SELECT * FROM clan_members WHERE user_id = ? AND clan_id = ?"
+    MEMBER_SELECT_WITH_ROLE_SQL = "SELECT * FROM clan_members WHERE user_id = ? AND clan_id = ? AND role = ?"
+    MEMBER_SELECT_BY_CLAN_SQL = "SELECT * FROM clan_members WHERE clan_id = ?"
+    MEMBER_COUNT_BY_CLAN_SQL = "SELECT COUNT(*) as count FROM clan_members WHERE clan_id = ?"
+    MEMBER_UPDATE_ROLE_SQL = "UPDATE clan_members SET role = ? WHERE user_id = ? AND clan_id = ?"
+    MEMBER_DELETE_SQL = "DELETE FROM clan_members WHERE user_id = ? AND clan_id = ?"
+    MEMBER_DELETE_BY_CLAN_SQL = "DELETE FROM clan_members WHERE clan_id = ?"
+    CHANNEL_SELECT_SQL = "SELECT * FROM clan_channels WHERE channel_id = ? AND clan_id = ?"
+    CHANNEL_SELECT_BY_CLAN_SQL = "SELECT * FROM clan_channels WHERE clan_id = ?"
+    CHANNEL_DELETE_SQL = "DELETE FROM clan_channels WHERE channel_id = ? AND clan_id = ?"
 
     def __init__(self):
         self.db = Database()
@@ -27,8 +54,8 @@ class ClanService:
         """
         try:
             # Verificar que el clan existe
-            clan_sql = "SELECT id FROM clans WHERE id = ? AND deleted = 0"
-            clan_row = self.db.single(clan_sql, (clan_id,))
+            clan_sql = ClanService.CLAN_SELECT_ACTIVE_BY_ID_SQL
+            clan_row = await self.db.single_async(clan_sql, (clan_id,))
             if not clan_row:
                 return "Clan no encontrado"
 
@@ -49,7 +76,7 @@ class ClanService:
             
             params.append(clan_id)
             update_sql = f"UPDATE clans SET {', '.join(update_fields)} WHERE id = ?"
-            self.db.execute(update_sql, tuple(params))
+            await self.db.execute_async(update_sql, tuple(params))
             
             logger.info(f"Configuración del clan {clan_id} actualizada: texto={max_text_channels}, voz={max_voice_channels}")
             return None
@@ -90,42 +117,12 @@ class ClanService:
             max_text_channels=max_text_channels,
             max_voice_channels=max_voice_channels,
         )
-        sql = """--sql
-            INSERT INTO clans (id, name, role_id, created_at, member_count, max_members, max_text_channels, max_voice_channels)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        self.db.execute(
-            sql,
-            (
-                clan.id,
-                clan.name,
-                clan.role_id,
-                clan.created_at,
-                clan.member_count,
-                clan.max_members,
-                clan.max_text_channels,
-                clan.max_voice_channels,
-            ),
-        )
-
         member = ClanMember(
             user_id=leader_id,
             clan_id=clan.id,
             role=ClanMemberRole.LEADER.value,
             joined_at=datetime.now(),
         )
-        sql = """--sql
-            INSERT INTO clan_members (user_id, clan_id, role, joined_at)
-            VALUES (?, ?, ?, ?)
-        """
-        self.db.execute(
-            sql, (member.user_id, member.clan_id, member.role, member.joined_at)
-        )
-
-        insert_channel_sql = """--sql
-            INSERT INTO clan_channels (channel_id, name, type, clan_id, created_at)
-            VALUES (?, ?, ?, ?, ?)
-        """
         _text_channel = ClanChannel(
             channel_id=text_channel.id,
             name=text_channel.name,
@@ -140,47 +137,66 @@ class ClanService:
             clan_id=clan.id,
             created_at=datetime.now(),
         )
-        self.db.execute(
-            insert_channel_sql,
-            (
-                _text_channel.channel_id,
-                _text_channel.name,
-                _text_channel.type,
-                _text_channel.clan_id,
-                _text_channel.created_at,
-            ),
-        )
-        self.db.execute(
-            insert_channel_sql,
-            (
-                _voice_channel.channel_id,
-                _voice_channel.name,
-                _voice_channel.type,
-                _voice_channel.clan_id,
-                _voice_channel.created_at,
-            ),
-        )
+
+        insert_clan_sql = """--sql
+            INSERT INTO clans (id, name, role_id, created_at, member_count, max_members, max_text_channels, max_voice_channels)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        insert_member_sql = """--sql
+            INSERT INTO clan_members (user_id, clan_id, role, joined_at)
+            VALUES (?, ?, ?, ?)
+        """
+        insert_channel_sql = """--sql
+            INSERT INTO clan_channels (channel_id, name, type, clan_id, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        """
+
+        # Clan, líder y canales se guardan en una sola transacción: o todo o nada
+        def insert_clan(db: Database) -> None:
+            db.execute(
+                insert_clan_sql,
+                (
+                    clan.id,
+                    clan.name,
+                    clan.role_id,
+                    clan.created_at,
+                    clan.member_count,
+                    clan.max_members,
+                    clan.max_text_channels,
+                    clan.max_voice_channels,
+                ),
+            )
+            db.execute(
+                insert_member_sql, (member.user_id, member.clan_id, member.role, member.joined_at)
+            )
+            db.executemany(
+                insert_channel_sql,
+                [
+                    (
+                        channel.channel_id,
+                        channel.name,
+                        channel.type,
+                        channel.clan_id,
+                        channel.created_at,
+                    )
+                    for channel in (_text_channel, _voice_channel)
+                ],
+            )
+
+        await self.db.transaction_async(insert_clan)
 
         return clan, None
 
     async def delete(self, clan_id: str) -> tuple[Optional[int], Optional[str]]:
         delete_sql = "DELETE FROM clans WHERE id = ?"
-        deleted = self.db.execute(delete_sql, (clan_id,))
+        deleted = await self.db.execute_async(delete_sql, (clan_id,))
         if not deleted:
             return None, f"No se pudo eliminar el clan con id {clan_id}"
         return clan_id, None
 
     async def get_member_clans(self, member_id: int) -> tuple[Optional[List[Clan]], Optional[str]]:
         try:
-            sql = """--sql
-                SELECT c.*
-                FROM clans c
-                INNER JOIN clan_members m ON c.id = m.clan_id
-                WHERE
-                    m.user_id = ?
-                    AND c.deleted = 0
-            """
-            clans_rows = self.db.select(sql, (member_id,))
+            clans_rows = await self.db.select_async(ClanService.CLAN_SELECT_BY_MEMBER_SQL, (member_id,))
             if not clans_rows:
                 return None, ClanService.CLAN_NOT_FOUND_MSG
 
@@ -190,19 +206,19 @@ class ClanService:
             return None, f"Error al obtener los clanes del miembro: {str(e)}"
 
     async def get_leader_clan(self, member_id: int) -> tuple[Optional[Clan], Optional[str]]:
-        sql = "SELECT * FROM clan_members WHERE user_id = ? AND role = ?"
-        leader = self.db.single(sql, (member_id, ClanMemberRole.LEADER.value))
+        sql = ClanService.MEMBER_SELECT_BY_ROLE_SQL
+        leader = await self.db.single_async(sql, (member_id, ClanMemberRole.LEADER.value))
         if not leader:
             return None, "El usuario no es líder de ningún clan"
 
-        clan = self.db.single(ClanService.CLAN_SELECT_BY_ID_SQL, (leader["clan_id"],))
+        clan = await self.db.single_async(ClanService.CLAN_SELECT_BY_ID_SQL, (leader["clan_id"],))
         if not clan:
             return None, "El usuario no es líder de ningún clan"
 
         return Clan(**clan), None
 
     async def get_clan_role(self, guild: Guild, clan_id: str) -> tuple[Optional[Role], Optional[str]]:
-        clan = self.db.single(ClanService.CLAN_SELECT_BY_ID_SQL, (clan_id,))
+        clan = await self.db.single_async(ClanService.CLAN_SELECT_BY_ID_SQL, (clan_id,))
         if not clan:
             return None, "El clan no existe"
 
@@ -220,14 +236,14 @@ class ClanService:
                 return "Error al obtener la configuración de clanes"
                 
             # Verificar que el clan existe
-            clan = self.db.single(ClanService.CLAN_SELECT_BY_ID_SQL, (clan_id,))
+            clan = await self.db.single_async(ClanService.CLAN_SELECT_BY_ID_SQL, (clan_id,))
             if not clan:
                 logger.error(f"Clan con ID {clan_id} no encontrado")
                 return "El clan no existe"
 
             # Verificar si el miembro ya está en algún clan
-            select_member_sql = "SELECT * FROM clan_members WHERE user_id = ?"
-            member = self.db.single(select_member_sql, (member_id,))
+            select_member_sql = ClanService.MEMBER_SELECT_BY_USER_SQL
+            member = await self.db.single_async(select_member_sql, (member_id,))
             
             if member and member["clan_id"] != clan_id and settings.allow_multiple_clans is False:
                 logger.info(f"Miembro {member_id} ya pertenece a otro clan {member['clan_id']}")
@@ -238,8 +254,8 @@ class ClanService:
                 return "El miembro ya pertenece a este clan"
 
             # Verificar límite de miembros del clan
-            count_members_sql = "SELECT COUNT(*) as count FROM clan_members WHERE clan_id = ?"
-            count_result = self.db.single(count_members_sql, (clan_id,))
+            count_members_sql = ClanService.MEMBER_COUNT_BY_CLAN_SQL
+            count_result = await self.db.single_async(count_members_sql, (clan_id,))
             current_members = count_result["count"] if count_result else 0
             
             if current_members >= clan["max_members"]:
@@ -253,7 +269,7 @@ class ClanService:
             """
             
             logger.info(f"Intentando añadir miembro {member_id} al clan {clan_id}")
-            result = self.db.execute(insert_member_sql, (member_id, clan_id, "member", datetime.now()))
+            result = await self.db.execute_async(insert_member_sql, (member_id, clan_id, "member", datetime.now()))
             
             if result:
                 logger.info(f"Miembro {member_id} añadido exitosamente al clan {clan_id}")
@@ -272,14 +288,14 @@ class ClanService:
             return "Error al obtener la configuración de clanes"
         
         # Validar si el clan existe
-        clan_sql = "SELECT * FROM clans WHERE id = ?"
-        clan_row = self.db.single(clan_sql, (clan_id,))
+        clan_sql = ClanService.CLAN_SELECT_BY_ID_SQL
+        clan_row = await self.db.single_async(clan_sql, (clan_id,))
         if not clan_row:
             return "El clan no existe"
 
         # Validar si el miembro ya pertenece a un clan
-        member_sql = "SELECT * FROM clan_members WHERE user_id = ?"
-        member_row = self.db.single(member_sql, (member_id,))
+        member_sql = ClanService.MEMBER_SELECT_BY_USER_SQL
+        member_row = await self.db.single_async(member_sql, (member_id,))
         if not member_row:
             return "El miembro no pertenece a ningún clan"
         
@@ -291,29 +307,29 @@ class ClanService:
             return "El miembro no pertenece a este clan"
 
         # Eliminar el miembro del clan
-        delete_sql = "DELETE FROM clan_members WHERE user_id = ? AND clan_id = ?"
-        self.db.execute(delete_sql, (member_id, clan_id))
+        delete_sql = ClanService.MEMBER_DELETE_SQL
+        await self.db.execute_async(delete_sql, (member_id, clan_id))
         
         return None
 
     async def get_clan_by_id(self, clan_id: str) -> tuple[Optional[FullClan], Optional[str]]:
         try:
             # Obtener datos básicos del clan
-            clan_sql = "SELECT * FROM clans WHERE id = ? AND deleted = 0"
-            clan_row = self.db.single(clan_sql, (clan_id,))
+            clan_sql = ClanService.CLAN_SELECT_ACTIVE_BY_ID_SQL
+            clan_row = await self.db.single_async(clan_sql, (clan_id,))
             if not clan_row:
                 return None, "Clan no encontrado"
             
             clan = Clan(**clan_row)
             
             # Obtener miembros del clan
-            members_sql = "SELECT * FROM clan_members WHERE clan_id = ?"
-            members_rows = self.db.select(members_sql, (clan_id,))
+            members_sql = ClanService.MEMBER_SELECT_BY_CLAN_SQL
+            members_rows = await self.db.select_async(members_sql, (clan_id,))
             members = [ClanMember(**row) for row in members_rows] if members_rows else []
             
             # Obtener canales del clan
-            channels_sql = "SELECT * FROM clan_channels WHERE clan_id = ?"
-            channels_rows = self.db.select(channels_sql, (clan_id,))
+            channels_sql = ClanService.CHANNEL_SELECT_BY_CLAN_SQL
+            channels_rows = await self.db.select_async(channels_sql, (clan_id,))
             channels = [ClanChannel(**row) for row in channels_rows] if channels_rows else []
             
             # Crear el objeto FullClan
@@ -334,28 +350,40 @@ class ClanService:
         except Exception as e:
             return None, f"Error al obtener el clan: {str(e)}"
 
-    async def get_all_clans(self) -> tuple[Optional[List[FullClan]], Optional[str]]:
+    async def get_all_clans(
+        self,
+        name: Optional[str] = None,
+        role_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> tuple[Optional[List[FullClan]], Optional[str]]:
+        """
+        Obtiene los clanes con sus miembros y canales.
+
+        Se hacen tres consultas en total (clanes, miembros y canales) sea cual sea el
+        número de clanes. `name` filtra por parte del nombre sin distinguir mayúsculas,
+        `role_id` por el rol del clan y `limit`/`offset` permiten paginar.
+        """
         try:
-            # Obtener todos los clanes
-            clans_sql = "SELECT * FROM clans WHERE deleted = 0"
-            clans_rows = self.db.select(clans_sql)
+            # Las tres consultas en la misma transacción de lectura para que sean coherentes
+            clans_rows, members_rows, channels_rows = await self.db.select_snapshot_async(
+                self.all_clans_queries(name, role_id, limit, offset)
+            )
             if not clans_rows:
                 return [], None
-            
+
+            members_by_clan: dict[str, list[ClanMember]] = {}
+            for row in members_rows:
+                members_by_clan.setdefault(row["clan_id"], []).append(ClanMember(**row))
+
+            channels_by_clan: dict[str, list[ClanChannel]] = {}
+            for row in channels_rows:
+                channels_by_clan.setdefault(row["clan_id"], []).append(ClanChannel(**row))
+
             full_clans = []
             for clan_row in clans_rows:
                 clan = Clan(**clan_row)
                 
-                # Obtener miembros del clan
-                members_sql = "SELECT * FROM clan_members WHERE clan_id = ?"
-                members_rows = self.db.select(members_sql, (clan.id,))
-                members = [ClanMember(**row) for row in members_rows] if members_rows else []
-                
-                # Obtener canales del clan
-                channels_sql = "SELECT * FROM clan_channels WHERE clan_id = ?"
-                channels_rows = self.db.select(channels_sql, (clan.id,))
-                channels = [ClanChannel(**row) for row in channels_rows] if channels_rows else []
-                
                 # Crear el objeto FullClan
                 full_clan = FullClan(
                     id=clan.id,
@@ -366,8 +394,8 @@ class ClanService:
                     max_members=clan.max_members,
                     max_text_channels=clan.max_text_channels,
                     max_voice_channels=clan.max_voice_channels,
-                    members=members,
-                    channels=channels
+                    members=members_by_clan.get(clan.id, []),
+                    channels=channels_by_clan.get(clan.id, [])
                 )
                 full_clans.append(full_clan)
             
@@ -375,18 +403,118 @@ class ClanService:
         except Exception as e:
             return None, f"Error al obtener los clanes: {str(e)}"
 
+    async def count_clans(
+        self, name: Optional[str] = None, role_id: Optional[int] = None
+    ) -> tuple[int, Optional[str]]:
+        """Número de clanes que cumplen los mismos filtros que get_all_clans"""
+        try:
+            where, params = self._clan_filter(name, role_id)
+            row = await self.db.single_async(f"SELECT COUNT(*) AS total FROM clans WHERE {where}", params)
+            return (row["total"] if row else 0), None
+        except Exception as e:
+            return 0, f"Error al contar los clanes: {str(e)}"
+
+    async def get_clan_stats(self) -> tuple[Optional[ClanStats], Optional[str]]:
+        """Estadísticas generales de los clanes, calculadas con agregados en SQLite"""
+        try:
+            totals_sql = """--sql
+                SELECT
+                    (SELECT COUNT(*) FROM clans WHERE deleted = 0) AS total_clans,
+                    COUNT(m.user_id) AS total_members,
+                    COALESCE(SUM(m.role = ?), 0) AS total_leaders,
+                    (
+                        SELECT COUNT(*) FROM clan_channels cc
+                        INNER JOIN clans c ON c.id = cc.clan_id
+                        WHERE c.deleted = 0
+                    ) AS total_channels
+                FROM clan_members m
+                INNER JOIN clans c ON c.id = m.clan_id
+                WHERE c.deleted = 0
+            """
+            # En caso de empate gana el clan más antiguo, igual que en el listado de clanes
+            largest_sql = """--sql
+                SELECT c.name, COUNT(m.user_id) AS member_count,
+                       (SELECT COUNT(*) FROM clan_channels cc WHERE cc.clan_id = c.id) AS channel_count
+                FROM clans c
+                LEFT JOIN clan_members m ON m.clan_id = c.id
+                WHERE c.deleted = 0
+                GROUP BY c.id
+                ORDER BY member_count DESC, c.created_at, c.id
+                LIMIT 1
+            """
+            totals_rows, largest_rows = await self.db.select_snapshot_async([
+                (totals_sql, (ClanMemberRole.LEADER.value,)),
+                (largest_sql, ()),
+            ])
+            totals = totals_rows[0] if totals_rows else None
+            largest = largest_rows[0] if largest_rows else None
+            if not totals:
+                return None, "Error al obtener las estadísticas de los clanes"
+
+            stats = ClanStats(
+                total_clans=totals["total_clans"],
+                total_members=totals["total_members"],
+                total_leaders=totals["total_leaders"],
+                total_channels=totals["total_channels"],
+            )
+            if largest:
+                stats.largest_clan_name = largest["name"]
+                stats.largest_clan_members = largest["member_count"]
+                stats.largest_clan_channels = largest["channel_count"]
+            return stats, None
+        except Exception as e:
+            return None, f"Error al obtener las estadísticas de los clanes: {str(e)}"
+
+    @classmethod
+    def all_clans_queries(
+        cls,
+        name: Optional[str] = None,
+        role_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> list[tuple[str, tuple]]:
+        """Consultas (sql, parámetros) de clanes, miembros y canales que usa get_all_clans"""
+        where, params = cls._clan_filter(name, role_id)
+        clans_sql = f"SELECT * FROM clans WHERE {where} ORDER BY created_at, id"
+        if limit is not None:
+            clans_sql += " LIMIT ? OFFSET ?"
+            params += (limit, offset)
+
+        # Miembros y canales de los mismos clanes, con la consulta de clanes como subconsulta
+        members_sql = f"SELECT * FROM clan_members WHERE clan_id IN (SELECT id FROM ({clans_sql}))"
+        channels_sql = f"SELECT * FROM clan_channels WHERE clan_id IN (SELECT id FROM ({clans_sql}))"
+        return [(clans_sql, params), (members_sql, params), (channels_sql, params)]
+
+    @staticmethod
+    def _clan_filter(name: Optional[str], role_id: Optional[int]) -> tuple[str, tuple]:
+        conditions = ["deleted = 0"]
+        params: tuple = ()
+        if name:
+            # Escapar los comodines de LIKE para buscar el texto literal
+            pattern = name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            conditions.append("name LIKE ? ESCAPE '\\'")
+            params += (f"%{pattern}%",)
+        if role_id is not None:
+            conditions.append("role_id = ?")
+            params += (role_id,)
+        return " AND ".join(conditions), params
+
     async def delete_clan(self, clan_id: str) -> Optional[str]:
         try:
-            # Marcar el clan como eliminado
             delete_sql = "UPDATE clans SET deleted = 1 WHERE id = ?"
-            result = self.db.execute(delete_sql, (clan_id,))
+            delete_members_sql = ClanService.MEMBER_DELETE_BY_CLAN_SQL
+
+            def soft_delete(db: Database):
+                # Marcar el clan como eliminado
+                result = db.execute(delete_sql, (clan_id,))
+                # Eliminar todos los miembros del clan eliminado
+                db.execute(delete_members_sql, (clan_id,))
+                return result
+
+            result = await self.db.transaction_async(soft_delete)
             if not result:
                 return "No se pudo eliminar el clan"
             
-            # Eliminar todos los miembros del clan eliminado
-            delete_members_sql = "DELETE FROM clan_members WHERE clan_id = ?"
-            self.db.execute(delete_members_sql, (clan_id,))
-            
             logger.info(f"Clan {clan_id} eliminado y sus miembros removidos")
             return None
         except Exception as e:
@@ -396,8 +524,8 @@ class ClanService:
     async def get_clan_by_role_id(self, role_id: int) -> tuple[Optional[FullClan], Optional[str]]:
         try:
             # Obtener el clan por role_id
-            clan_sql = "SELECT * FROM clans WHERE role_id = ? AND deleted = 0"
-            clan_row = self.db.single(clan_sql, (role_id,))
+            clan_sql = ClanService.CLAN_SELECT_BY_ROLE_SQL
+            clan_row = await self.db.single_async(clan_sql, (role_id,))
             if not clan_row:
                 return None, "No se encontró un clan con ese rol"
             
@@ -409,12 +537,8 @@ class ClanService:
     async def get_clan_by_channel_id(self, channel_id: int) -> tuple[Optional[FullClan], Optional[str]]:
         try:
             # Obtener el clan a través del canal
-            clan_sql = """--sql
-                SELECT c.* FROM clans c
-                INNER JOIN clan_channels cc ON c.id = cc.clan_id
-                WHERE cc.channel_id = ? AND c.deleted = 0
-            """
-            clan_row = self.db.single(clan_sql, (channel_id,))
+            clan_sql = ClanService.CLAN_SELECT_BY_CHANNEL_SQL
+            clan_row = await self.db.single_async(clan_sql, (channel_id,))
             if not clan_row:
                 return None, "No se encontró un clan asociado a este canal"
             
@@ -425,20 +549,20 @@ class ClanService:
 
     async def is_clan_leader(self, user_id: int, clan_id: str) -> tuple[bool, Optional[str]]:
         try:
-            sql = "SELECT * FROM clan_members WHERE user_id = ? AND clan_id = ? AND role = ?"
-            member = self.db.single(sql, (user_id, clan_id, ClanMemberRole.LEADER.value))
+            sql = ClanService.MEMBER_SELECT_WITH_ROLE_SQL
+            member = await self.db.single_async(sql, (user_id, clan_id, ClanMemberRole.LEADER.value))
             return member is not None, None
         except Exception as e:
             return False, f"Error al verificar liderazgo: {str(e)}"
 
-    def save_clan_channel(self, channel: ClanChannel) -> Optional[str]:
+    async def save_clan_channel(self, channel: ClanChannel) -> Optional[str]:
         """Guardar un canal de clan en la base de datos"""
         try:
             sql = """--sql
                 INSERT INTO clan_channels (channel_id, name, type, clan_id, created_at)
                 VALUES (?, ?, ?, ?, ?)
             """
-            self.db.execute(
+            await self.db.execute_async(
                 sql,
                 (
                     channel.channel_id,
@@ -453,12 +577,12 @@ class ClanService:
             logger.error(f"Error al guardar canal de clan: {str(e)}")
             return f"Error al guardar el canal: {str(e)}"
 
-    def promote_member_to_leader(self, user_id: int, clan_id: str) -> Optional[str]:
+    async def promote_member_to_leader(self, user_id: int, clan_id: str) -> Optional[str]:
         """Promover un miembro a líder del clan"""
         try:
             # Verificar que el miembro existe en el clan
-            member_sql = "SELECT * FROM clan_members WHERE user_id = ? AND clan_id = ?"
-            member = self.db.single(member_sql, (user_id, clan_id))
+            member_sql = ClanService.MEMBER_SELECT_SQL
+            member = await self.db.single_async(member_sql, (user_id, clan_id))
             if not member:
                 return "El usuario no es miembro de este clan"
             
@@ -466,8 +590,8 @@ class ClanService:
                 return "El usuario ya es líder de este clan"
             
             # Promover a líder
-            update_sql = "UPDATE clan_members SET role = ? WHERE user_id = ? AND clan_id = ?"
-            self.db.execute(update_sql, (ClanMemberRole.LEADER.value, user_id, clan_id))
+            update_sql = ClanService.MEMBER_UPDATE_ROLE_SQL
+            await self.db.execute_async(update_sql, (ClanMemberRole.LEADER.value, user_id, clan_id))
             
             return None
         except Exception as e:
@@ -303,8 +303,8 @@ class ClanCommands(commands.GroupCog, name="clan"):
 
         try:
             # Verificar si el clan ya existe en la BD
-            existing_clans, _ = await self.service.get_all_clans()
-            if existing_clans and any(clan.role_id == rol.id for clan in existing_clans):
+            existing_clans, _ = await self.service.get_all_clans(role_id=rol.id)
+            if existing_clans:
                 return await interaction.followup.send(
                     constants.ERROR_ROLE_ALREADY_REGISTERED.format(role_name=rol.name),
                     ephemeral=True,
@@ -424,10 +424,13 @@ class ClanCommands(commands.GroupCog, name="clan"):
             name=interaction.user.display_name, icon_url=interaction.user.display_avatar.url
         )
         embed.set_thumbnail(url=usuario.display_avatar.url)
+        # Info de miembro del usuario en todos sus clanes, en una sola consulta
+        member_rows = await self.service.db.select_async(
+            ClanService.MEMBER_SELECT_BY_USER_SQL, (usuario.id,)
+        )
+        memberships = {row["clan_id"]: row for row in member_rows}
         for clan in clans:
-            # Buscar info de miembro en el clan
-            sql = "SELECT * FROM clan_members WHERE user_id = ? AND clan_id = ?"
-            member_row = self.service.db.single(sql, (usuario.id, clan.id))
+            member_row = memberships.get(clan.id)
             if not member_row:
                 continue
             rol = member_row["role"]
@@ -451,24 +454,13 @@ class ClanCommands(commands.GroupCog, name="clan"):
     @app_commands.checks.has_permissions(manage_roles=True, manage_channels=True)
     async def clan_stats(self, interaction: Interaction, persistente: Optional[bool] = False):
         ephemeral = not persistente  # Si persistente=True, ephemeral=False
-        clans, error = await self.service.get_all_clans()
-        if error or not clans:
+        # Las estadísticas se calculan en la base de datos, sin cargar los clanes
+        stats, error = await self.service.get_clan_stats()
+        if error or not stats or stats.total_clans == 0:
             return await interaction.response.send_message(
                 error or constants.ERROR_NO_CLANS_STATS, ephemeral=ephemeral
             )
 
-        # Calcular estadísticas
-        total_clans = len(clans)
-        total_members = sum(len(clan.members) for clan in clans)
-        total_leaders = sum(
-            len([m for m in clan.members if m.role == ClanMemberRole.LEADER.value])
-            for clan in clans
-        )
-        total_channels = sum(len(clan.channels) for clan in clans)
-
-        # Clan con más miembros
-        largest_clan = max(clans, key=lambda c: len(c.members))
-
         # Crear embed con estadísticas
         embed = Embed(
             title=constants.EMBED_CLAN_STATS_TITLE,
@@ -479,10 +471,10 @@ class ClanCommands(commands.GroupCog, name="clan"):
         embed.add_field(
             name=constants.FIELD_GENERAL_NUMBERS,
             value=constants.STATS_GENERAL_FORMAT.format(
-                total_clans=total_clans,
-                total_members=total_members,
-                total_leaders=total_leaders,
-                total_channels=total_channels,
+                total_clans=stats.total_clans,
+                total_members=stats.total_members,
+                total_leaders=stats.total_leaders,
+                total_channels=stats.total_channels,
             ),
             inline=True,
         )
@@ -490,9 +482,9 @@ class ClanCommands(commands.GroupCog, name="clan"):
         embed.add_field(
             name=constants.FIELD_LARGEST_CLAN,
             value=constants.STATS_LARGEST_CLAN_FORMAT.format(
-                clan_name=largest_clan.name,
-                member_count=len(largest_clan.members),
-                channel_count=len(largest_clan.channels),
+                clan_name=stats.largest_clan_name,
+                member_count=stats.largest_clan_members,
+                channel_count=stats.largest_clan_channels,
             ),
             inline=True,
         )
@@ -500,7 +492,8 @@ class ClanCommands(commands.GroupCog, name="clan"):
         embed.add_field(
             name=constants.FIELD_AVERAGES,
             value=constants.STATS_AVERAGES_FORMAT.format(
-                avg_members=total_members / total_clans, avg_channels=total_channels / total_clans
+                avg_members=stats.total_members / stats.total_clans,
+                avg_channels=stats.total_channels / stats.total_clans,
             ),
             inline=True,
         )
@@ -1137,7 +1130,7 @@ class ClanCommands(commands.GroupCog, name="clan"):
                 created_at=datetime.now(),
             )
 
-            error = self.service.save_clan_channel(canal_obj)
+            error = await self.service.save_clan_channel(canal_obj)
             if error:
                 # Si hay error al guardar, eliminar el canal creado
                 await nuevo_canal.delete()
@@ -1232,7 +1225,7 @@ class ClanCommands(commands.GroupCog, name="clan"):
 
         try:
             # Promover a líder en la base de datos
-            error = self.service.promote_member_to_leader(miembro.id, clan.id)
+            error = await self.service.promote_member_to_leader(miembro.id, clan.id)
             if error:
                 return await interaction.followup.send(
                     constants.ERROR_PROMOTING_MEMBER.format(error=error), ephemeral=True
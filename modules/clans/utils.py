@@ -13,11 +13,38 @@ from discord import (
     Forbidden,
     HTTPException
 )
-from modules.clan_settings.service import ClanSettingsService
+from modules.clan_settings import ClanSettings, ClanSettingsService
 from modules.core import logger
 from .service import ClanService
 from .models import ClanMemberRole, ClanChannel, ChannelType
 
+DEFAULT_ROLE_COLOR = "7289da"  # Color azul de Discord
+
+# Color de los roles de clan, calculado cada vez que cambia la configuración
+_default_role_color: Optional[Color] = None
+
+
+def _parse_role_color(color_str) -> Color:
+    """Color configurado para los roles de clan, o el azul de Discord si no es válido"""
+    try:
+        # Asegurar que tenga exactamente 6 caracteres hexadecimales
+        if len(color_str) != 6 or not all(c in '0123456789ABCDEFabcdef' for c in color_str):
+            logger.warning(f"Color inválido en configuración: {color_str}, usando color por defecto")
+            color_str = DEFAULT_ROLE_COLOR
+        return Color.from_str(f"#{color_str}")
+    except Exception as color_error:
+        logger.warning(f"Error al procesar color {color_str}: {color_error}, usando color por defecto")
+        return Color.from_str(f"#{DEFAULT_ROLE_COLOR}")
+
+
+def _on_clan_settings_changed(settings: ClanSettings) -> None:
+    # Se valida una vez por cambio de configuración en lugar de en cada rol creado
+    global _default_role_color
+    _default_role_color = _parse_role_color(settings.default_role_color)
+
+
+ClanSettingsService.subscribe(_on_clan_settings_changed)
+
 
 async def create_clan_role(guild: Guild, name: str) -> Tuple[Optional[Role], Optional[str]]:
     try:
@@ -26,19 +53,10 @@ async def create_clan_role(guild: Guild, name: str) -> Tuple[Optional[Role], Opt
         if error:
             return None, error
 
-        # Validar y corregir el color
-        try:
-            # Intentar usar el color configurado
-            color_str = settings.default_role_color
-            # Asegurar que tenga exactamente 6 caracteres hexadecimales
-            if len(color_str) != 6 or not all(c in '0123456789ABCDEFabcdef' for c in color_str):
-                logger.warning(f"Color inválido en configuración: {color_str}, usando color por defecto")
-                color_str = "7289da"  # Color azul de Discord por defecto
-            
-            role_color = Color.from_str(f"#{color_str}")
-        except Exception as color_error:
-            logger.warning(f"Error al procesar color {settings.default_role_color}: {color_error}, usando color por defecto")
-            role_color = Color.from_str("#7289da")  # Color azul de Discord por defecto
+        # Si la configuración no se pudo cargar no se ha notificado y se calcula aquí
+        role_color = _default_role_color
+        if role_color is None:
+            role_color = _parse_role_color(settings.default_role_color)
 
         role = await guild.create_role(name=name, color=role_color)
         return role, None
@@ -493,7 +511,7 @@ async def crear_canal_adicional(
             created_at=datetime.now()
         )
         
-        error = servicio.save_clan_channel(canal_obj)
+        error = await servicio.save_clan_channel(canal_obj)
         if error:
             # Si hay error al guardar, eliminar el canal creado
             await nuevo_canal.delete()
@@ -572,7 +590,7 @@ async def demote_leader_to_member(guild, miembro, clan_id, service) -> tuple[boo
             return False, error_msg
         
         # Degradar en la base de datos
-        _demote_in_database(miembro.id, clan_id)
+        await _demote_in_database(miembro.id, clan_id)
         
         # Quitar rol de líder de Discord si corresponde
         await _remove_discord_leader_role_if_needed(guild, miembro, clan_id, service)
@@ -597,11 +615,11 @@ async def _check_can_demote_leader(clan_id: str, service) -> tuple[bool, Optiona
     return True, None
 
 
-def _demote_in_database(user_id: int, clan_id: str):
+async def _demote_in_database(user_id: int, clan_id: str):
     """Degradar al usuario en la base de datos"""
     service_instance = ClanService()
-    update_sql = "UPDATE clan_members SET role = ? WHERE user_id = ? AND clan_id = ?"
-    service_instance.db.execute(update_sql, (ClanMemberRole.MEMBER.value, user_id, clan_id))
+    update_sql = ClanService.MEMBER_UPDATE_ROLE_SQL
+    await service_instance.db.execute_async(update_sql, (ClanMemberRole.MEMBER.value, user_id, clan_id))
 
 
 async def _remove_discord_leader_role_if_needed(guild, miembro, clan_id: str, service):
@@ -651,8 +669,8 @@ async def remove_clan_channel(guild, channel_id: int, clan_id: str) -> tuple[boo
     try:
         # Verificar que el canal existe en la base de datos
         service_instance = ClanService()
-        check_sql = "SELECT * FROM clan_channels WHERE channel_id = ? AND clan_id = ?"
-        channel_record = service_instance.db.single(check_sql, (channel_id, clan_id))
+        check_sql = ClanService.CHANNEL_SELECT_SQL
+        channel_record = await service_instance.db.single_async(check_sql, (channel_id, clan_id))
         
         if not channel_record:
             return False, "El canal no pertenece a este clan"
@@ -667,8 +685,8 @@ async def remove_clan_channel(guild, channel_id: int, clan_id: str) -> tuple[boo
             logger.warning(f"Canal {channel_id} no encontrado en Discord, solo limpiando BD")
         
         # Eliminar de la base de datos
-        delete_sql = "DELETE FROM clan_channels WHERE channel_id = ? AND clan_id = ?"
-        service_instance.db.execute(delete_sql, (channel_id, clan_id))
+        delete_sql = ClanService.CHANNEL_DELETE_SQL
+        await service_instance.db.execute_async(delete_sql, (channel_id, clan_id))
         
         return True, None
         
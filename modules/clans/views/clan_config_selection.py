@@ -71,7 +71,7 @@ class ClanConfigSelectionView(View):
             # Actualizar max_members si se proporcionó
             if max_miembros is not None:
                 update_members_sql = "UPDATE clans SET max_members = ? WHERE id = ?"
-                self.service.db.execute(update_members_sql, (max_miembros, clan.id))
+                await self.service.db.execute_async(update_members_sql, (max_miembros, clan.id))
                 updates.append(f"👥 Máximo miembros: {clan.max_members} → **{max_miembros}**")
             
             # Actualizar configuración de canales
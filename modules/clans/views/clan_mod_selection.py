@@ -197,7 +197,7 @@ class ClanModSelectionView(discord.ui.View):
                 created_at=datetime.now(),
             )
 
-            error = self.service.save_clan_channel(canal_obj)
+            error = await self.service.save_clan_channel(canal_obj)
             if error:
                 # Si hay error al guardar, eliminar el canal creado
                 await nuevo_canal.delete()
@@ -237,7 +237,7 @@ class ClanModSelectionView(discord.ui.View):
             )
 
         # Promover a líder
-        error = self.service.promote_member_to_leader(miembro.id, clan.id)
+        error = await self.service.promote_member_to_leader(miembro.id, clan.id)
         if error:
             return await interaction.followup.send(
                 f"❌ Error al promover a líder: {error}", ephemeral=True
@@ -74,7 +74,7 @@ class EchoTextModal(Modal):
                         sent_message = await self.canal.send(embed=embed)
 
                         # Guardar el mensaje en la base de datos
-                        echo_id, _ = self.service.save_echo_message(
+                        echo_id, _ = await self.service.save_echo_message(
                             message_id=sent_message.id,
                             channel_id=self.canal.id,
                             guild_id=interaction.guild.id,
@@ -105,7 +105,7 @@ class EchoTextModal(Modal):
                     sent_message = await self.canal.send(texto)
 
                     # Guardar el mensaje en la base de datos
-                    echo_id, _ = self.service.save_echo_message(
+                    echo_id, _ = await self.service.save_echo_message(
                         message_id=sent_message.id,
                         channel_id=self.canal.id,
                         guild_id=interaction.guild.id,
@@ -233,7 +233,7 @@ class EchoEditModal(Modal):
             
             else:
                 # Obtener los últimos mensajes echo del servidor
-                echo_messages, error = self.service.get_guild_echo_messages(
+                echo_messages, error = await self.service.get_guild_echo_messages(
                     guild_id=interaction.guild.id,
                     limit=10
                 )
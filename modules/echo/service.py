@@ -10,32 +10,28 @@ from .models import EchoMessage
 
 class EchoService:
     """Servicio para gestionar mensajes echo"""
+
+    ECHO_SELECT_SQL = """
+        SELECT id, message_id, channel_id, guild_id, user_id,
+               content, is_embed, created_at
+        FROM echo_messages
+    """
+    ECHO_SELECT_BY_ID_SQL = ECHO_SELECT_SQL + "WHERE id = ?"
+    ECHO_SELECT_BY_USER_SQL = ECHO_SELECT_SQL + """
+        WHERE user_id = ? AND guild_id = ?
+        ORDER BY created_at DESC
+        LIMIT ?
+    """
+    ECHO_SELECT_BY_GUILD_SQL = ECHO_SELECT_SQL + """
+        WHERE guild_id = ?
+        ORDER BY created_at DESC
+        LIMIT ?
+    """
     
     def __init__(self):
         self.db = Database()
-        self._ensure_table_exists()
-    
-    def _ensure_table_exists(self):
-        """Crea la tabla echo_messages si no existe"""
-        try:
-            sql = """
-                CREATE TABLE IF NOT EXISTS echo_messages (
-                    id TEXT PRIMARY KEY,
-                    message_id INTEGER NOT NULL,
-                    channel_id INTEGER NOT NULL,
-                    guild_id INTEGER NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    content TEXT NOT NULL,
-                    is_embed BOOLEAN NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """
-            self.db.execute(sql)
-            logger.info("Tabla echo_messages verificada/creada")
-        except Exception as e:
-            logger.error(f"Error al crear tabla echo_messages: {e}")
     
-    def save_echo_message(
+    async def save_echo_message(
         self,
         message_id: int,
         channel_id: int,
@@ -65,7 +61,7 @@ class EchoService:
                 is_embed,
                 datetime.now().isoformat()
             )
-            self.db.execute(sql, params)
+            await self.db.execute_async(sql, params)
             logger.info(f"Mensaje echo guardado: {echo_id}")
             return echo_id, None
         except Exception as e:
@@ -73,7 +69,7 @@ class EchoService:
             logger.error(error_msg)
             return None, error_msg
     
-    def get_user_echo_messages(
+    async def get_user_echo_messages(
         self,
         user_id: int,
         guild_id: int,
@@ -84,15 +80,7 @@ class EchoService:
         Returns: (messages, error)
         """
         try:
-            sql = """
-                SELECT id, message_id, channel_id, guild_id, user_id, 
-                       content, is_embed, created_at
-                FROM echo_messages 
-                WHERE user_id = ? AND guild_id = ?
-                ORDER BY created_at DESC 
-                LIMIT ?
-            """
-            rows = self.db.select(sql, (user_id, guild_id, limit))
+            rows = await self.db.select_async(EchoService.ECHO_SELECT_BY_USER_SQL, (user_id, guild_id, limit))
             
             if not rows:
                 return [], None
@@ -117,7 +105,7 @@ class EchoService:
             logger.error(error_msg)
             return None, error_msg
     
-    def get_guild_echo_messages(
+    async def get_guild_echo_messages(
         self,
         guild_id: int,
         limit: int = 10
@@ -127,15 +115,7 @@ class EchoService:
         Returns: (messages, error)
         """
         try:
-            sql = """
-                SELECT id, message_id, channel_id, guild_id, user_id, 
-                       content, is_embed, created_at
-                FROM echo_messages 
-                WHERE guild_id = ?
-                ORDER BY created_at DESC 
-                LIMIT ?
-            """
-            rows = self.db.select(sql, (guild_id, limit))
+            rows = await self.db.select_async(EchoService.ECHO_SELECT_BY_GUILD_SQL, (guild_id, limit))
             
             if not rows:
                 return [], None
@@ -160,7 +140,7 @@ class EchoService:
             logger.error(error_msg)
             return None, error_msg
     
-    def get_echo_message_by_id(
+    async def get_echo_message_by_id(
         self,
         echo_id: str
     ) -> Tuple[Optional[EchoMessage], Optional[str]]:
@@ -169,13 +149,7 @@ class EchoService:
         Returns: (message, error)
         """
         try:
-            sql = """
-                SELECT id, message_id, channel_id, guild_id, user_id, 
-                       content, is_embed, created_at
-                FROM echo_messages 
-                WHERE id = ?
-            """
-            row = self.db.single(sql, (echo_id,))
+            row = await self.db.single_async(EchoService.ECHO_SELECT_BY_ID_SQL, (echo_id,))
             
             if not row:
                 return None, "Mensaje echo no encontrado"
@@ -197,7 +171,7 @@ class EchoService:
             logger.error(error_msg)
             return None, error_msg
     
-    def delete_echo_message(
+    async def delete_echo_message(
         self,
         echo_id: str
     ) -> Optional[str]:
@@ -206,7 +180,7 @@ class EchoService:
         Returns: error (si existe)
         """
         try:
-            self.db.execute("DELETE FROM echo_messages WHERE id = ?", (echo_id,))
+            await self.db.execute_async("DELETE FROM echo_messages WHERE id = ?", (echo_id,))
             logger.info(f"Mensaje echo eliminado: {echo_id}")
             return None
         except Exception as e:
@@ -115,7 +115,7 @@ class EchoCommands(commands.Cog):
                     sent_message = await canal.send(embed=embed)
 
                     # Guardar el mensaje en la base de datos
-                    echo_id, _ = self.service.save_echo_message(
+                    echo_id, _ = await self.service.save_echo_message(
                         message_id=sent_message.id,
                         channel_id=canal.id,
                         guild_id=interaction.guild.id,
@@ -146,7 +146,7 @@ class EchoCommands(commands.Cog):
                 sent_message = await canal.send(texto)
 
                 # Guardar el mensaje en la base de datos
-                echo_id, _ = self.service.save_echo_message(
+                echo_id, _ = await self.service.save_echo_message(
                     message_id=sent_message.id,
                     channel_id=canal.id,
                     guild_id=interaction.guild.id,
@@ -290,7 +290,7 @@ class EchoCommands(commands.Cog):
         
         else:
             # Obtener los últimos mensajes echo del servidor (no solo del usuario)
-            echo_messages, error = self.service.get_guild_echo_messages(
+            echo_messages, error = await self.service.get_guild_echo_messages(
                 guild_id=interaction.guild.id,
                 limit=10
             )
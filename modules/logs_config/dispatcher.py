@@ -0,0 +1,176 @@
+"""Cola de envío de logs por canal que agrupa embeds en un solo mensaje."""
+
+import asyncio
+from typing import Dict, List, Optional
+from discord import TextChannel, Embed, Forbidden, HTTPException
+from modules.core import logger
+from .embeds import get_logs_dropped_embed
+
+# Límites de Discord por mensaje
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+# Tiempo máximo que un log espera a que se llene el lote antes de enviarse (segundos).
+# Con un envío por canal y segundo se queda por debajo del bucket de 5 mensajes / 5 s.
+FLUSH_INTERVAL = 1.0
+
+# Logs pendientes por canal; al superarse se descartan y se avisa con un resumen
+MAX_PENDING_LOGS = 500
+
+# Segundos sin logs tras los que se libera la cola y el worker de un canal
+IDLE_TIMEOUT = 300.0
+
+# Tiempo máximo que se espera al cerrar para enviar los logs pendientes (segundos)
+CLOSE_TIMEOUT = 5.0
+
+
+class _ChannelLogQueue:
+    def __init__(self, channel: TextChannel):
+        self.channel = channel
+        self.queue: asyncio.Queue[Embed] = asyncio.Queue(maxsize=MAX_PENDING_LOGS)
+        self.dropped = 0
+        self.task: Optional[asyncio.Task] = None
+
+
+class LogDispatcher:
+    """
+    Envía los logs a través de una cola por canal.
+
+    Los eventos solo encolan el embed (nunca esperan a Discord). Un worker por
+    canal agrupa hasta 10 embeds por mensaje y los envía en serie, de modo que
+    el bucket de rate limit del canal se respeta y una avalancha de eventos no
+    bloquea el event loop. Si la cola se llena, los logs nuevos se descartan y
+    se envía un resumen con cuántos se perdieron. La cola y el worker de un
+    canal se liberan cuando lleva IDLE_TIMEOUT segundos sin logs.
+    """
+
+    def __init__(self):
+        self._queues: Dict[int, _ChannelLogQueue] = {}
+        self._closed = False
+
+    def enqueue(self, channel: TextChannel, embed: Embed) -> None:
+        if self._closed:
+            return
+
+        channel_queue = self._queues.get(channel.id)
+        if channel_queue is None:
+            channel_queue = _ChannelLogQueue(channel)
+            self._queues[channel.id] = channel_queue
+        channel_queue.channel = channel
+
+        if channel_queue.task is None or channel_queue.task.done():
+            channel_queue.task = asyncio.get_running_loop().create_task(
+                self._worker(channel_queue)
+            )
+
+        try:
+            channel_queue.queue.put_nowait(embed)
+        except asyncio.QueueFull:
+            channel_queue.dropped += 1
+
+    async def _worker(self, channel_queue: _ChannelLogQueue) -> None:
+        loop = asyncio.get_running_loop()
+        carry: Optional[Embed] = None
+        carry_is_summary = False
+
+        while True:
+            if carry is not None:
+                first = carry
+            else:
+                try:
+                    first = await asyncio.wait_for(channel_queue.queue.get(), IDLE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    # wait_for espera a que se cancele el get() y mientras tanto enqueue
+                    # puede haber añadido un log a esta cola (el worker aún no ha terminado)
+                    if not channel_queue.queue.empty():
+                        continue
+                    # Entre esta comprobación y el borrado no hay ningún await
+                    self._release(channel_queue)
+                    return
+            # Embeds sacados de la cola en este lote, para marcarlos como procesados
+            queued = 0 if carry_is_summary else 1
+            carry = None
+            carry_is_summary = False
+            batch = [first]
+            size = len(first)
+            deadline = loop.time() + FLUSH_INTERVAL
+
+            while len(batch) < MAX_EMBEDS_PER_MESSAGE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    embed = await asyncio.wait_for(channel_queue.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if size + len(embed) > MAX_EMBED_CHARS_PER_MESSAGE:
+                    carry = embed
+                    break
+                batch.append(embed)
+                size += len(embed)
+                queued += 1
+
+            if channel_queue.dropped:
+                # El resumen va en este lote si cabe; si no, abre el siguiente
+                summary = get_logs_dropped_embed(channel_queue.dropped)
+                if (
+                    len(batch) < MAX_EMBEDS_PER_MESSAGE
+                    and size + len(summary) <= MAX_EMBED_CHARS_PER_MESSAGE
+                ):
+                    batch.append(summary)
+                elif carry is None:
+                    carry = summary
+                    carry_is_summary = True
+                else:
+                    summary = None
+
+                if summary is not None:
+                    logger.warning(
+                        "Descartados %d logs del canal %s",
+                        channel_queue.dropped,
+                        channel_queue.channel.name,
+                    )
+                    channel_queue.dropped = 0
+
+            await self._send(channel_queue.channel, batch)
+            for _ in range(queued):
+                channel_queue.queue.task_done()
+
+    def _release(self, channel_queue: _ChannelLogQueue) -> None:
+        if self._queues.get(channel_queue.channel.id) is channel_queue:
+            del self._queues[channel_queue.channel.id]
+        if channel_queue.dropped:
+            logger.warning(
+                "Descartados %d logs del canal %s",
+                channel_queue.dropped,
+                channel_queue.channel.name,
+            )
+
+    async def close(self) -> None:
+        """Envía los logs pendientes (como mucho durante CLOSE_TIMEOUT) y detiene los workers"""
+        self._closed = True
+        channel_queues = list(self._queues.values())
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(channel_queue.queue.join() for channel_queue in channel_queues)),
+                CLOSE_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            logger.warning("No se han podido enviar todos los logs pendientes antes de cerrar")
+
+        tasks = [channel_queue.task for channel_queue in channel_queues if channel_queue.task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._queues.clear()
+
+    async def _send(self, channel: TextChannel, embeds: List[Embed]) -> None:
+        try:
+            await channel.send(embeds=embeds)
+        except Forbidden:
+            logger.warning("Error al enviar el log al canal %s. No tengo permisos.", channel.name)
+        except HTTPException as e:
+            logger.error("Error al enviar el log al canal %s. Error: %s", channel.name, e)
+
+
+log_dispatcher = LogDispatcher()
@@ -271,3 +271,12 @@ def get_member_update_roles_embed(before: Member, after: Member) -> Embed:
         )
 
     return embed
+
+
+def get_logs_dropped_embed(count: int) -> Embed:
+    return Embed(
+        title=embeds_constants.TITLE_LOGS_DROPPED,
+        description=embeds_constants.VALUE_LOGS_DROPPED.format(count=count),
+        color=Color.orange(),
+        timestamp=datetime.now(),
+    )
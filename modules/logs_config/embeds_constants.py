@@ -16,6 +16,7 @@ TITLE_AVATAR_CHANGE = "Cambio de avatar"
 TITLE_BANNER_CHANGE = "Cambio de banner"
 TITLE_ROLES_ADDED = "Roles añadidos"
 TITLE_ROLES_REMOVED = "Roles eliminados"
+TITLE_LOGS_DROPPED = "Logs descartados"
 
 # Campos de información del usuario
 FIELD_USER_MENTION = "Mención del usuario"
@@ -73,6 +74,7 @@ VALUE_NO_NEW_AVATAR = "No hay avatar nuevo"
 VALUE_NO_OLD_BANNER = "No hay banner antiguo"
 VALUE_NO_NEW_BANNER = "No hay banner nuevo"
 VALUE_MEMBER_COUNT = "{count} miembros"
+VALUE_LOGS_DROPPED = "Se han descartado {count} logs por exceso de eventos"
 
 # Separador
 SEPARATOR_FIELD = "\u200b"
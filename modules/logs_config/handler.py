@@ -1,7 +1,7 @@
-from discord import Message, Member, TextChannel, Embed, Forbidden, HTTPException
+from discord import Message, Member, TextChannel, Embed
 from discord.ext.commands import Bot
-from modules.core import logger
 from .utils import get_log_channel
+from .dispatcher import log_dispatcher
 from .embeds import (
     get_message_edit_embed,
     get_message_delete_embed,
@@ -22,14 +22,9 @@ class LogHandler:
     def __init__(self, bot: Bot):
         self.bot = bot
 
-    async def _send_log(self, channel: TextChannel, embed: Embed) -> None:
-        try:
-            await channel.send(embed=embed)
-        except Forbidden:
-            logger.warning("Error al enviar el log al canal %s. No tengo permisos.", channel.name)
-        except HTTPException as e:
-            logger.error("Error al enviar el log al canal %s. Error: %s", channel.name, e)
-
+    def _send_log(self, channel: TextChannel, embed: Embed) -> None:
+        # El envío real lo hace el dispatcher en segundo plano, agrupando embeds
+        log_dispatcher.enqueue(channel, embed)
 
     async def log_message_edit(self, before: Message, after: Message) -> None:
         if before.author.bot:
@@ -43,7 +38,7 @@ class LogHandler:
 
         embed = get_message_edit_embed(before, after)
         if embed:
-            await self._send_log(channel, embed)
+            self._send_log(channel, embed)
 
     async def log_message_delete(self, message: Message) -> None:
         if message.author.bot:
@@ -55,7 +50,7 @@ class LogHandler:
 
         embed = get_message_delete_embed(message)
         if embed:
-            await self._send_log(channel, embed)
+            self._send_log(channel, embed)
 
     async def log_member_join(self, member: Member) -> None:
         channel = await get_log_channel(self.bot, "join_leave")
@@ -64,7 +59,7 @@ class LogHandler:
 
         embed = get_member_join_embed(member)
         if embed:
-            await self._send_log(channel, embed)
+            self._send_log(channel, embed)
 
     async def log_member_remove(self, member: Member) -> None:
         channel = await get_log_channel(self.bot, "join_leave")
@@ -73,7 +68,7 @@ class LogHandler:
 
         embed = get_member_remove_embed(member)
         if embed:
-            await self._send_log(channel, embed)
+            self._send_log(channel, embed)
 
     async def log_member_update(self, before: Member, after: Member) -> None:
         # - Apodo actualizado
@@ -98,7 +93,7 @@ class LogHandler:
             return
 
         if embed:
-            await self._send_log(channel, embed)
+            self._send_log(channel, embed)
 
     async def log_voice_state_update(self, member: Member, before: Member, after: Member) -> None:
         channel = await get_log_channel(self.bot, "voice")
@@ -119,7 +114,7 @@ class LogHandler:
                 return
 
         if embed:
-            await self._send_log(channel, embed)
+            self._send_log(channel, embed)
 
     def get_voice_state_action(self, before, after):
         if before.channel is None and after.channel is not None:
@@ -0,0 +1,60 @@
+"""Tabla en memoria de rutas de logs (tipo de log -> canal)."""
+
+import time
+from typing import Dict, List, Optional
+from modules.core import logger
+from .models import LogConfig, LogConfigType
+
+# Segundos durante los que no se vuelve a pedir a Discord un canal de logs inaccesible
+UNREACHABLE_CHANNEL_TTL = 300
+
+
+class LogRouteTable:
+    """
+    Configuración de logs indexada por tipo. Se carga completa de una vez y
+    LogsConfigService la recarga cada vez que se cambia la configuración.
+
+    También recuerda durante un rato los canales borrados o sin permisos, para
+    no hacer una petición REST por cada evento que se registraría en ellos.
+    """
+
+    def __init__(self):
+        self._routes: Dict[str, LogConfig] = {}
+        self._loaded = False
+        self._unreachable: Dict[int, float] = {}
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def build(self, log_configs: List[LogConfig]) -> None:
+        self._routes = {log_config.type: log_config for log_config in log_configs}
+        self._loaded = True
+        self._unreachable.clear()
+        logger.debug("Rutas de logs recargadas (%d tipos)", len(self._routes))
+
+    def invalidate(self) -> None:
+        self._loaded = False
+        self._unreachable.clear()
+
+    def mark_unreachable(self, channel_id: int) -> None:
+        self._unreachable[channel_id] = time.monotonic() + UNREACHABLE_CHANNEL_TTL
+
+    def is_unreachable(self, channel_id: int) -> bool:
+        expires_at = self._unreachable.get(channel_id)
+        if expires_at is None:
+            return False
+        if time.monotonic() >= expires_at:
+            del self._unreachable[channel_id]
+            return False
+        return True
+
+    def get_channel_id(self, log_type: LogConfigType) -> Optional[int]:
+        """ID del canal de logs, o None si el tipo no está configurado o está desactivado"""
+        log_config = self._routes.get(log_type)
+        if not log_config or not log_config.enabled:
+            return None
+        return log_config.channel_id
+
+
+log_routes = LogRouteTable()
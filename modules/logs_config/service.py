@@ -2,15 +2,27 @@ from typing import List, Optional
 from database import Database
 from modules.core import logger
 from .models import LogConfigType, LogConfig
+from .routes import log_routes
 
 
 class LogsConfigService:
+    LOG_SELECT_BY_TYPE_SQL = "SELECT * FROM logs WHERE type = ?"
+
     def __init__(self):
         self.db = Database()
 
-    def get_all(self) -> tuple[Optional[List[LogConfig]], Optional[str]]:
+    async def refresh_routes(self) -> Optional[str]:
+        """Recarga la tabla de rutas que usan los eventos de logs"""
+        log_configs, error = await self.get_all()
+        if error:
+            log_routes.invalidate()
+            return error
+        log_routes.build(log_configs or [])
+        return None
+
+    async def get_all(self) -> tuple[Optional[List[LogConfig]], Optional[str]]:
         try:
-            rows = self.db.select("SELECT * FROM logs")
+            rows = await self.db.select_async("SELECT * FROM logs")
             log_configs = [LogConfig(**row) for row in rows]
             return log_configs, None
         except Exception as e:
@@ -18,11 +30,11 @@ class LogsConfigService:
             logger.error("Error al obtener las configuraciones de logs: %s", error)
             return None, error
 
-    def get_by_type(
+    async def get_by_type(
         self, log_type: LogConfigType,
     ) -> tuple[Optional[LogConfig], Optional[str]]:
         try:
-            row = self.db.single("SELECT * FROM logs WHERE type = ?", (log_type,))
+            row = await self.db.single_async(LogsConfigService.LOG_SELECT_BY_TYPE_SQL, (log_type,))
             if not row:
                 return None, None
             log_config = LogConfig(**row)
@@ -36,7 +48,7 @@ class LogsConfigService:
             )
             return None, error
 
-    def update(self, log_config: LogConfig) -> tuple[Optional[LogConfig], Optional[str]]:
+    async def update(self, log_config: LogConfig) -> tuple[Optional[LogConfig], Optional[str]]:
         try:
             sql = """INSERT OR REPLACE INTO logs (type, channel_id, enabled) 
                      VALUES (?, ?, ?)"""
@@ -45,7 +57,8 @@ class LogsConfigService:
                 log_config.channel_id,
                 log_config.enabled,
             )
-            self.db.execute(sql, params)
+            await self.db.execute_async(sql, params)
+            await self.refresh_routes()
             return log_config, None
         except Exception as e:
             error = str(e)
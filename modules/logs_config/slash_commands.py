@@ -48,7 +48,7 @@ class ConfigLogsCommands(commands.GroupCog, name="logs"):
             type=tipo_de_log, channel_id=canal.id if canal else None, enabled=activar
         )
 
-        _, error = self.service.update(log_config)
+        _, error = await self.service.update(log_config)
         if error:
             await interaction.response.send_message(content=error, ephemeral=True)
             return
@@ -74,7 +74,7 @@ class ConfigLogsCommands(commands.GroupCog, name="logs"):
     @app_commands.command(name="listar", description=constants.COMMAND_LIST_DESC)
     @app_commands.checks.has_permissions(administrator=True)
     async def show_logs_config(self, interaction: Interaction, persistente: bool = False):
-        log_configs, error = self.service.get_all()
+        log_configs, error = await self.service.get_all()
         if error:
             await interaction.response.send_message(content=error, ephemeral=True)
             return
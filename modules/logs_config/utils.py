@@ -1,17 +1,33 @@
 from typing import Optional
-from discord import TextChannel
+from discord import TextChannel, NotFound, Forbidden, HTTPException
 from discord.ext.commands import Bot
 from settings import guild_id
 from modules.core import logger
 from .service import LogsConfigService
 from .models import LogConfigType
+from .routes import log_routes
 
 
 async def _get_text_channel(bot: Bot, channel_id: int) -> Optional[TextChannel]:
     if not channel_id:
         return None
 
-    channel = await bot.fetch_channel(channel_id)
+    # Primero la caché del gateway; solo se hace la petición REST si el canal no está en ella
+    channel = bot.get_channel(channel_id)
+    if channel is None:
+        if log_routes.is_unreachable(channel_id):
+            return None
+        try:
+            channel = await bot.fetch_channel(channel_id)
+        except (NotFound, Forbidden) as e:
+            # Borrado o sin permisos: no se vuelve a intentar hasta que caduque o cambien las rutas
+            log_routes.mark_unreachable(channel_id)
+            logger.error("No se pudo obtener el canal de logs %s: %s", channel_id, e)
+            return None
+        except HTTPException as e:
+            logger.error("No se pudo obtener el canal de logs %s: %s", channel_id, e)
+            return None
+
     if not channel or not isinstance(channel, TextChannel):
         logger.error("El canal %s no es un canal de texto o no existe.", channel_id)
         return None
@@ -25,6 +41,8 @@ async def _get_text_channel(bot: Bot, channel_id: int) -> Optional[TextChannel]:
 async def get_log_channel(bot: Bot, log_type: LogConfigType) -> Optional[TextChannel]:
     """
     Get the log channel for a specific log type.
+    The configuration is read from the in-memory route table, which is only
+    loaded from the database the first time.
 
     Args:
         bot: The bot instance.
@@ -33,12 +51,14 @@ async def get_log_channel(bot: Bot, log_type: LogConfigType) -> Optional[TextCha
     Returns:
         The log channel, or None if not found or not enabled.
     """
-    service = LogsConfigService()
-    log_config, error = service.get_by_type(log_type)
-    if error:
-        logger.error("Error al obtener la configuracion de logs de tipo members: %s", error)
-        return None
-    if not log_config or not log_config.enabled:
+    if not log_routes.loaded:
+        error = await LogsConfigService().refresh_routes()
+        if error:
+            logger.error("Error al obtener la configuracion de logs de tipo %s: %s", log_type, error)
+            return None
+
+    channel_id = log_routes.get_channel_id(log_type)
+    if not channel_id:
         return None
 
-    return await _get_text_channel(bot, log_config.channel_id)
+    return await _get_text_channel(bot, channel_id)
@@ -0,0 +1,76 @@
+"""Índice en memoria de triggers por canal con matchers precompilados."""
+
+from typing import Dict, List, Optional
+from modules.core import logger
+from .models import Trigger
+from .matcher import ChannelMatcher
+from .memo import MatchMemo, memo_key
+
+
+class TriggerIndex:
+    """
+    Triggers agrupados por channel_id, en el mismo orden que devuelve la base de datos.
+    Se reconstruye completo al invalidarse para conservar la semántica de
+    "el primer trigger gana". Los resultados se memorizan por canal y contenido
+    y la memoria se vacía cada vez que cambian los triggers.
+    """
+
+    def __init__(self):
+        self._by_channel: Dict[int, ChannelMatcher] = {}
+        self._loaded = False
+        self.memo = MatchMemo()
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def build(self, triggers: List[Trigger]) -> None:
+        grouped: Dict[int, List[Trigger]] = {}
+        for trigger in triggers:
+            grouped.setdefault(trigger.channel_id, []).append(trigger)
+
+        # Sustitución atómica: los lectores ven el índice anterior o el nuevo
+        self._by_channel = {
+            channel_id: ChannelMatcher(channel_triggers)
+            for channel_id, channel_triggers in grouped.items()
+        }
+        self._log_memo_stats()
+        self.memo.clear()
+        self._loaded = True
+        logger.debug("Índice de triggers reconstruido (%d canales)", len(grouped))
+
+    def invalidate(self) -> None:
+        self._loaded = False
+        self._log_memo_stats()
+        self.memo.clear()
+
+    def _log_memo_stats(self) -> None:
+        """Aciertos de la memoria de búsquedas desde la última vez que cambiaron los triggers"""
+        stats = self.memo.stats()
+        lookups = stats["hits"] + stats["misses"]
+        if not lookups:
+            return
+        logger.info(
+            "Memoria de triggers: %d aciertos de %d búsquedas (%.0f%%), %d entradas",
+            stats["hits"],
+            lookups,
+            100 * stats["hits"] / lookups,
+            stats["size"],
+        )
+
+    def find(self, channel_id: int, text: str) -> Optional[Trigger]:
+        matcher = self._by_channel.get(channel_id)
+        if matcher is None:
+            return None
+
+        key = memo_key(channel_id, text)
+        found, trigger = self.memo.get(key)
+        if found:
+            return trigger
+
+        trigger = matcher.find(text)
+        self.memo.put(key, trigger)
+        return trigger
+
+
+trigger_index = TriggerIndex()
@@ -0,0 +1,153 @@
+"""Motor de coincidencias de triggers de un canal."""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Pattern
+from modules.core import logger
+from .models import Trigger, TriggerPosition
+
+LITERAL_POSITIONS = (
+    TriggerPosition.CONTAINS.value,
+    TriggerPosition.STARTS_WITH.value,
+    TriggerPosition.ENDS_WITH.value,
+    TriggerPosition.EXACT_MATCH.value,
+)
+
+
+@dataclass
+class CompiledTrigger:
+    trigger: Trigger
+    matches: Callable[[str], bool]
+
+
+def _never(_text: str) -> bool:
+    return False
+
+
+def compile_trigger(trigger: Trigger) -> CompiledTrigger:
+    """
+    Convierte un trigger en un matcher listo para usar.
+    Las expresiones regulares se compilan una sola vez; si son inválidas
+    el trigger queda registrado pero nunca se activa.
+    """
+    position = trigger.position
+    key = trigger.key
+
+    if position == TriggerPosition.CONTAINS.value:
+        return CompiledTrigger(trigger, lambda text: key in text)
+    if position == TriggerPosition.STARTS_WITH.value:
+        return CompiledTrigger(trigger, lambda text: text.startswith(key))
+    if position == TriggerPosition.ENDS_WITH.value:
+        return CompiledTrigger(trigger, lambda text: text.endswith(key))
+    if position == TriggerPosition.EXACT_MATCH.value:
+        return CompiledTrigger(trigger, lambda text: text == key)
+
+    if position == TriggerPosition.TEXT_BETWEEN.value:
+        words = [word for word in key.split() if word.strip()]
+        pattern = ".*".join(words)
+    elif position == TriggerPosition.REGEX.value:
+        pattern = key
+    else:
+        logger.warning("Posición de trigger desconocida (%s): %s", trigger.id, position)
+        return CompiledTrigger(trigger, _never)
+
+    try:
+        regex = re.compile(pattern, re.IGNORECASE)
+    except re.error as e:
+        logger.error("Expresión regular inválida en el trigger %s: %s", trigger.id, e)
+        return CompiledTrigger(trigger, _never)
+    return CompiledTrigger(trigger, lambda text: regex.search(text) is not None)
+
+
+def _first_priorities(keys: List[tuple[str, int]]) -> Dict[str, int]:
+    """Mapa clave -> prioridad más alta (menor índice) con la que aparece"""
+    priorities: Dict[str, int] = {}
+    for key, priority in keys:
+        priorities.setdefault(key, priority)
+    return priorities
+
+
+def _alternation(priorities: Dict[str, int]) -> str:
+    # El orden de las alternativas es el de prioridad: en cada posición
+    # el motor de regex devuelve la primera clave que encaja.
+    ordered = sorted(priorities, key=priorities.__getitem__)
+    return "|".join(re.escape(key) for key in ordered)
+
+
+class ChannelMatcher:
+    """
+    Triggers de un canal preparados para evaluarse con una sola pasada.
+
+    Las claves literales (contains/starts_with/ends_with/equal) se agrupan en
+    una alternancia compilada por posición, de modo que el coste por mensaje
+    no depende del número de triggers. Los triggers text_between/regex se
+    evalúan uno a uno, pero solo si tienen más prioridad que el mejor literal.
+    La prioridad es el orden de la base de datos: el primer trigger gana.
+    """
+
+    def __init__(self, triggers: List[Trigger]):
+        self.triggers = triggers
+        self._contains: Dict[str, int] = {}
+        self._starts: Dict[str, int] = {}
+        self._ends: Dict[str, int] = {}
+        self._exact: Dict[str, int] = {}
+        self._patterns: List[tuple[int, CompiledTrigger]] = []
+
+        literals: Dict[str, List[tuple[str, int]]] = {pos: [] for pos in LITERAL_POSITIONS}
+        for priority, trigger in enumerate(triggers):
+            if trigger.position in literals:
+                literals[trigger.position].append((trigger.key, priority))
+            else:
+                self._patterns.append((priority, compile_trigger(trigger)))
+
+        self._contains = _first_priorities(literals[TriggerPosition.CONTAINS.value])
+        self._starts = _first_priorities(literals[TriggerPosition.STARTS_WITH.value])
+        self._ends = _first_priorities(
+            [(key[::-1], priority) for key, priority in literals[TriggerPosition.ENDS_WITH.value]]
+        )
+        self._exact = _first_priorities(literals[TriggerPosition.EXACT_MATCH.value])
+
+        self._contains_regex: Optional[Pattern[str]] = None
+        self._contains_best = min(self._contains.values(), default=None)
+        if self._contains:
+            self._contains_regex = re.compile(f"(?=({_alternation(self._contains)}))")
+        self._starts_regex: Optional[Pattern[str]] = None
+        if self._starts:
+            self._starts_regex = re.compile(f"(?:{_alternation(self._starts)})")
+        self._ends_regex: Optional[Pattern[str]] = None
+        if self._ends:
+            self._ends_regex = re.compile(f"(?:{_alternation(self._ends)})")
+
+    def _best_literal(self, text: str) -> Optional[int]:
+        best = self._exact.get(text)
+
+        if self._starts_regex is not None:
+            match = self._starts_regex.match(text)
+            if match and (best is None or self._starts[match.group()] < best):
+                best = self._starts[match.group()]
+
+        if self._ends_regex is not None:
+            match = self._ends_regex.match(text[::-1])
+            if match and (best is None or self._ends[match.group()] < best):
+                best = self._ends[match.group()]
+
+        if self._contains_regex is not None and (best is None or self._contains_best < best):
+            for match in self._contains_regex.finditer(text):
+                priority = self._contains[match.group(1)]
+                if best is None or priority < best:
+                    best = priority
+                    if best == self._contains_best:
+                        break
+
+        return best
+
+    def find(self, text: str) -> Optional[Trigger]:
+        best = self._best_literal(text)
+
+        for priority, compiled in self._patterns:
+            if best is not None and priority > best:
+                break
+            if compiled.matches(text):
+                return compiled.trigger
+
+        return self.triggers[best] if best is not None else None
@@ -0,0 +1,56 @@
+"""Memoria LRU con caducidad para resultados de búsqueda de triggers."""
+
+from collections import OrderedDict
+from hashlib import blake2b
+from time import monotonic
+from typing import Optional, Tuple
+from .models import Trigger
+
+MemoKey = Tuple[int, bytes]
+
+
+def memo_key(channel_id: int, text: str) -> MemoKey:
+    # Se guarda un resumen de 16 bytes en lugar del texto para acotar la memoria
+    return channel_id, blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class MatchMemo:
+    """
+    Guarda el resultado (trigger o None) de las últimas búsquedas por canal y contenido,
+    de modo que un mensaje repetido (spam, copia y pega) cuesta una búsqueda en un dict.
+    Las entradas caducan a los `ttl` segundos y se expulsa la menos usada al superar `max_size`.
+    """
+
+    def __init__(self, max_size: int = 2048, ttl: float = 60.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[MemoKey, Tuple[float, Optional[Trigger]]]" = OrderedDict()
+
+    def get(self, key: MemoKey) -> Tuple[bool, Optional[Trigger]]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, entry[1]
+
+    def put(self, key: MemoKey, trigger: Optional[Trigger]) -> None:
+        self._entries[key] = (monotonic() + self.ttl, trigger)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Vacía la memoria y reinicia los contadores"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
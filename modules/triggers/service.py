@@ -2,13 +2,27 @@ from typing import List, Optional
 from database import Database
 from modules.core import logger
 from .models import Trigger
+from .index import trigger_index
 
 class TriggersService:
+    TRIGGER_SELECT_BY_ID_SQL = "SELECT * FROM triggers WHERE id = ?"
+    TRIGGER_SELECT_BY_CHANNEL_SQL = "SELECT * FROM triggers WHERE channel_id = ?"
+
     def __init__(self):
         self.db = Database()
-    def get_all(self) -> tuple[Optional[List[Trigger]], Optional[str]]:
+
+    async def refresh_index(self) -> Optional[str]:
+        """Recarga el índice en memoria que usa on_message"""
+        triggers, error = await self.get_all()
+        if error:
+            trigger_index.invalidate()
+            return error
+        trigger_index.build(triggers or [])
+        return None
+
+    async def get_all(self) -> tuple[Optional[List[Trigger]], Optional[str]]:
         try:
-            rows = self.db.select("SELECT * FROM triggers")
+            rows = await self.db.select_async("SELECT * FROM triggers")
             triggers = [Trigger(**row) for row in rows]
             return triggers, None
         except Exception as e:
@@ -16,9 +30,9 @@ class TriggersService:
             logger.error("Error al obtener los triggers: %s", error)
             return None, error
 
-    def get_by_id(self, trigger_id: str) -> tuple[Optional[Trigger], Optional[str]]:
+    async def get_by_id(self, trigger_id: str) -> tuple[Optional[Trigger], Optional[str]]:
         try:
-            row = self.db.single("SELECT * FROM triggers WHERE id = ?", (trigger_id,))
+            row = await self.db.single_async(TriggersService.TRIGGER_SELECT_BY_ID_SQL, (trigger_id,))
             if not row:
                 return None, None
             trigger = Trigger(**row)
@@ -28,11 +42,11 @@ class TriggersService:
             logger.error("Error al obtener el trigger: %s", error)
             return None, error
 
-    def get_one_by_channel_id(
+    async def get_one_by_channel_id(
         self, channel_id: int,
     ) -> tuple[Optional[Trigger], Optional[str]]:
         try:
-            row = self.db.single("SELECT * FROM triggers WHERE channel_id = ?", (channel_id,))
+            row = await self.db.single_async(TriggersService.TRIGGER_SELECT_BY_CHANNEL_SQL, (channel_id,))
             if not row:
                 return None, None
             trigger = Trigger(**row)
@@ -42,11 +56,11 @@ class TriggersService:
             logger.error("Error al obtener el trigger: %s", error)
             return None, error
 
-    def get_all_by_channel_id(
+    async def get_all_by_channel_id(
         self, channel_id: int,
     ) -> tuple[Optional[List[Trigger]], Optional[str]]:
         try:
-            rows = self.db.select("SELECT * FROM triggers WHERE channel_id = ?", (channel_id,))
+            rows = await self.db.select_async(TriggersService.TRIGGER_SELECT_BY_CHANNEL_SQL, (channel_id,))
             triggers = [Trigger(**row) for row in rows]
             return triggers, None
         except Exception as e:
@@ -54,7 +68,7 @@ class TriggersService:
             logger.error("Error al obtener los triggers: %s", error)
             return None, error
 
-    def add(self, trigger: Trigger) -> tuple[Optional[Trigger], Optional[str]]:
+    async def add(self, trigger: Trigger) -> tuple[Optional[Trigger], Optional[str]]:
         try:
             sql = """INSERT INTO triggers 
                      (id, channel_id, delete_message, response, key, position, response_timeout) 
@@ -68,16 +82,17 @@ class TriggersService:
                 trigger.position,
                 trigger.response_timeout
             )
-            self.db.execute(sql, params)
+            await self.db.execute_async(sql, params)
+            await self.refresh_index()
             return trigger, None
         except Exception as e:
             error = str(e)
             logger.error("Error al crear el trigger: %s", error)
             return None, error
 
-    def delete_by_id(self, trigger_id: str) -> tuple[Optional[str], Optional[str]]:
+    async def delete_by_id(self, trigger_id: str) -> tuple[Optional[str], Optional[str]]:
         # Check if trigger exists
-        trigger, error = self.get_by_id(trigger_id)
+        trigger, error = await self.get_by_id(trigger_id)
         if error:
             logger.error("Error al obtener el trigger: %s", error)
             return None, error
@@ -86,14 +101,15 @@ class TriggersService:
             return None, "Trigger no encontrado"
 
         try:
-            self.db.execute("DELETE FROM triggers WHERE id = ?", (trigger_id,))
+            await self.db.execute_async("DELETE FROM triggers WHERE id = ?", (trigger_id,))
+            await self.refresh_index()
             return trigger_id, None
         except Exception as e:
             error = str(e)
             logger.error("Error al eliminar el trigger: %s", error)
             return None, error
 
-    def update(self, trigger: Trigger) -> tuple[Optional[Trigger], Optional[str]]:
+    async def update(self, trigger: Trigger) -> tuple[Optional[Trigger], Optional[str]]:
         try:
             sql = """INSERT OR REPLACE INTO triggers 
                      (id, channel_id, delete_message, response, key, position, response_timeout) 
@@ -107,7 +123,8 @@ class TriggersService:
                 trigger.position,
                 trigger.response_timeout
             )
-            self.db.execute(sql, params)
+            await self.db.execute_async(sql, params)
+            await self.refresh_index()
             return trigger, None
         except Exception as e:
             error = str(e)
@@ -75,7 +75,7 @@ class TriggersCommands(commands.GroupCog, name="triggers"):
             position=posicion,
             response_timeout=tiempo_respuesta,
         )
-        _, error = self.service.add(new_trigger)
+        _, error = await self.service.add(new_trigger)
         if error:
             await interaction.response.send_message(content=error, ephemeral=True)
             return
@@ -100,7 +100,7 @@ class TriggersCommands(commands.GroupCog, name="triggers"):
     ):
         triggers = []
         if id_trigger:
-            trigger, error = self.service.get_by_id(id_trigger)
+            trigger, error = await self.service.get_by_id(id_trigger)
             if error:
                 await interaction.response.send_message(content=error, ephemeral=True)
                 return
@@ -112,12 +112,12 @@ class TriggersCommands(commands.GroupCog, name="triggers"):
                 return
             triggers.append(trigger)
         elif canal:
-            triggers, error = self.service.get_all_by_channel_id(canal.id)
+            triggers, error = await self.service.get_all_by_channel_id(canal.id)
             if error:
                 await interaction.response.send_message(content=error, ephemeral=True)
                 return
         else:
-            triggers, error = self.service.get_all()
+            triggers, error = await self.service.get_all()
             if error:
                 await interaction.response.send_message(content=error, ephemeral=True)
                 return
@@ -175,7 +175,7 @@ class TriggersCommands(commands.GroupCog, name="triggers"):
         """Delete trigger command"""
         if id_del_trigger:
             # Si se proporciona ID, eliminar directamente
-            _, error = self.service.delete_by_id(id_del_trigger)
+            _, error = await self.service.delete_by_id(id_del_trigger)
             if error:
                 await interaction.response.send_message(content=error, ephemeral=True)
                 return
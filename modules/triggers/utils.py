@@ -1,65 +1,36 @@
 """triggers util functions."""
 
-import re
 from asyncio import sleep
 from typing import Optional
 from discord import Forbidden, Embed, Color
 from modules.core import logger
 from .service import TriggersService
-from .models import TriggerPosition, Trigger
+from .models import Trigger
+from .index import trigger_index
 from . import constants
 from .views import TriggerSelectView, create_trigger_selection_embed
 
 
-def _find_trigger(channel_id: int, text: str) -> Optional[Trigger]:
+async def _find_trigger(channel_id: int, text: str) -> Optional[Trigger]:
     """
     Searches for a trigger in the message.
-    The function iterates through the triggers and checks if any of them match the message.
-    If a trigger is found, it returns the trigger.
-    If no trigger is found, it returns None.
+    The lookup uses the in-memory trigger index, so the database is only queried
+    the first time (or after a failed refresh). Triggers are checked in database
+    order and the first one that matches wins.
 
     Args:
         channel_id (int): The ID of the channel where the message was sent.
         text (str): The message content to check.
     Returns:
-        Optional[dict]: The trigger that was found, or None if no trigger was found.
+        Optional[Trigger]: The trigger that was found, or None if no trigger was found.
     """
+    if not trigger_index.loaded:
+        error = await TriggersService().refresh_index()
+        if error:
+            logger.error("Error al obtener los triggers: %s", error)
+            return None
 
-    def activates_trigger(trigger: Trigger) -> bool:
-        position = trigger.position
-        key = trigger.key
-
-        if position == TriggerPosition.CONTAINS.value:
-            return key in text
-        if position == TriggerPosition.STARTS_WITH.value:
-            return text.startswith(key)
-        if position == TriggerPosition.ENDS_WITH.value:
-            return text.endswith(key)
-        if position == TriggerPosition.EXACT_MATCH.value:
-            return text == key
-        if position == TriggerPosition.TEXT_BETWEEN.value:
-            words = [word for word in key.split() if word.strip()]
-            pattern = ".*".join(words)
-            return bool(re.search(pattern, text, re.IGNORECASE))
-        if position == TriggerPosition.REGEX.value:
-            return bool(re.search(key, text, re.IGNORECASE))
-
-        return False
-
-    service = TriggersService()
-    triggers, error = service.get_all_by_channel_id(channel_id)
-    if error:
-        logger.error("Error al obtener los triggers: %s", error)
-        return None
-
-    if not triggers:
-        return None
-
-    for trigger in triggers:
-        if activates_trigger(trigger):
-            return trigger
-
-    return None
+    return trigger_index.find(channel_id, text)
 
 
 async def check_trigger(message) -> None:
@@ -72,7 +43,7 @@ async def check_trigger(message) -> None:
     Returns:
         None
     """
-    matched_trigger = _find_trigger(message.channel.id, message.content)
+    matched_trigger = await _find_trigger(message.channel.id, message.content)
     if not matched_trigger:
         return
 
@@ -114,7 +85,7 @@ async def check_trigger(message) -> None:
 
 async def show_trigger_selection_for_delete(interaction, service: TriggersService):
     """Mostrar vista de selección para eliminar trigger"""
-    triggers, error = service.get_all_by_channel_id(interaction.channel_id)
+    triggers, error = await service.get_all_by_channel_id(interaction.channel_id)
     if error:
         await interaction.response.send_message(content=error, ephemeral=True)
         return
@@ -125,7 +96,7 @@ async def show_trigger_selection_for_delete(interaction, service: TriggersServic
     
     async def delete_callback(button_interaction, trigger_id: str):
         # Eliminar el trigger seleccionado
-        _, error = service.delete_by_id(trigger_id)
+        _, error = await service.delete_by_id(trigger_id)
         if error:
             await button_interaction.response.send_message(content=error, ephemeral=True)
             return
@@ -152,7 +123,7 @@ async def show_trigger_selection_for_delete(interaction, service: TriggersServic
 
 async def show_trigger_selection_for_edit(interaction, service: TriggersService, **edit_params):
     """Mostrar vista de selección para editar trigger"""
-    triggers, error = service.get_all_by_channel_id(interaction.channel_id)
+    triggers, error = await service.get_all_by_channel_id(interaction.channel_id)
     if error:
         await interaction.response.send_message(content=error, ephemeral=True)
         return
@@ -163,7 +134,7 @@ async def show_trigger_selection_for_edit(interaction, service: TriggersService,
     
     async def edit_callback(button_interaction, trigger_id: str):
         # Editar el trigger seleccionado
-        result = _edit_trigger_internal(service, trigger_id, **edit_params)
+        result = await _edit_trigger_internal(service, trigger_id, **edit_params)
         
         if result["success"]:
             # Crear embed de confirmación
@@ -191,7 +162,7 @@ async def show_trigger_selection_for_edit(interaction, service: TriggersService,
 
 async def edit_trigger_by_id(interaction, service: TriggersService, id_trigger: str, **edit_params):
     """Editar un trigger específico por ID (comando directo)"""
-    result = _edit_trigger_internal(service, id_trigger, **edit_params)
+    result = await _edit_trigger_internal(service, id_trigger, **edit_params)
     
     if result["success"]:
         await interaction.response.send_message(content=result["message"], ephemeral=True)
@@ -199,9 +170,9 @@ async def edit_trigger_by_id(interaction, service: TriggersService, id_trigger:
         await interaction.response.send_message(content=result["error"], ephemeral=True)
 
 
-def _edit_trigger_internal(service: TriggersService, id_trigger: str, **edit_params):
+async def _edit_trigger_internal(service: TriggersService, id_trigger: str, **edit_params):
     """Función interna para editar trigger sin manejar la respuesta de interaction"""
-    trigger, error = service.get_by_id(id_trigger)
+    trigger, error = await service.get_by_id(id_trigger)
     if error:
         return {"success": False, "error": error}
     if not trigger:
@@ -231,7 +202,7 @@ def _edit_trigger_internal(service: TriggersService, id_trigger: str, **edit_par
     if tiempo_respuesta:
         trigger.response_timeout = tiempo_respuesta
 
-    _, error = service.update(trigger)
+    _, error = await service.update(trigger)
     if error:
         return {"success": False, "error": error}
 
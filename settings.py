@@ -38,3 +38,5 @@ prefix: str = _config.get("prefix", "!")
 guild_id: int = _config.get("guild_id", 0)
 admin_id: int = _config.get("admin_id", 0)
 send_to_admin: bool = _config.get("send_to_admin", False)
+database_profile: Dict[str, Any] = _config.get("database", {})
+automatic_messages_profile: Dict[str, Any] = _config.get("automatic_messages", {})